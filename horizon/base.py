@@ -31,6 +31,8 @@ base.py实现了一套dashboard/panel注册、动态加载机制,
 
 import collections
 import copy
+import functools
+import hashlib
 import inspect
 import logging
 import os
@@ -39,6 +41,7 @@ from django.conf import settings
 from django.conf.urls import include
 from django.conf.urls import patterns
 from django.conf.urls import url
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured  # noqa
 from django.core.urlresolvers import reverse
 from django.utils.encoding import python_2_unicode_compatible
@@ -66,24 +69,41 @@ def _decorate_urlconf(urlpatterns, decorator, *args, **kwargs):
             _decorate_urlconf(pattern.url_patterns, decorator, *args, **kwargs)
 
 
-# FIXME(lhcheng): We need to find a better way to cache the result.
-# Rather than storing it in the session, we could leverage the Django
-# session. Currently, this has been causing issue with cookie backend,
-# adding 1600+ in the cookie size.
 def access_cached(func):
-    def inner(self, context):
-        session = context['request'].session
-        try:
-            if session['allowed']['valid_for'] != session.get('token'):
-                raise KeyError()
-        except KeyError:
-            session['allowed'] = {"valid_for": session.get('token')}
+    """Caches the result of ``can_access`` for the user's token.
 
+    Results are kept on the request and, for ``API_CACHE_TIMEOUT`` seconds,
+    in the ``API_CACHE_ALIAS`` cache keyed on the token and the services
+    region, as the panels available depend on both. They used to be stored
+    in the session, which grew the session cookie by 1600+ bytes.
+    """
+    @functools.wraps(func)
+    def inner(self, context):
+        request = context['request']
         key = "%s.%s" % (self.__class__.__module__, self.__class__.__name__)
-        if key not in session['allowed']:
-            session['allowed'][key] = func(self, context)
-            session.modified = True
-        return session['allowed'][key]
+        allowed = getattr(request, '_horizon_allowed', None)
+        if allowed is None:
+            allowed = request._horizon_allowed = {}
+        if key in allowed:
+            return allowed[key]
+
+        user = getattr(request, 'user', None)
+        token_id = getattr(getattr(user, 'token', None), 'id', None)
+        timeout = getattr(settings, 'API_CACHE_TIMEOUT', 60)
+        if not (token_id and timeout):
+            allowed[key] = func(self, context)
+            return allowed[key]
+
+        cache = caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+        scope = '%s:%s' % (token_id, getattr(user, 'services_region', None))
+        cache_key = 'horizon:allowed:%s:%s' % (
+            hashlib.sha1(scope.encode('utf-8')).hexdigest(), key)
+        value = cache.get(cache_key)
+        if value is None:
+            value = func(self, context)
+            cache.set(cache_key, value, timeout)
+        allowed[key] = value
+        return value
     return inner
 
 
@@ -123,15 +143,13 @@ class HorizonComponent(object):
                 urlpatterns = patterns('')
         return urlpatterns
 
-    # FIXME(lhcheng): Removed the access_cached decorator for now until
-    # a better implementation has been figured out. This has been causing
-    # issue with cookie backend, adding 1600+ in the cookie size.
-    # @access_cached
+    @access_cached
     def can_access(self, context):
         """Return whether the user has role based access to this component.
         返回用户是否对该组件有基于角色的访问。
         This method is not intended to be overridden.
-        The result of the method is stored in per-session cache.
+        The result of the method is cached per token, see
+        :func:`access_cached`.
         """
         return self.allowed(context)
 
@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from optparse import make_option  # noqa
+import time
+
+from django.core.management.base import BaseCommand  # noqa
+from django.test.client import RequestFactory  # noqa
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from horizon.utils import csvbase
+
+
+COLUMNS = ["Project Name", "Meter", "Description", "Service", "Time",
+           "Value (Avg)", "Unit"]
+
+
+def _rows(count):
+    for i in range(count):
+        yield ("project-%d" % (i % 100), "cpu_util", "Average CPU utilization",
+               "Nova", "2016-01-01T00:00:00", i * 0.5, "%")
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        make_option('-n', '--rows',
+                    dest='rows',
+                    type='int',
+                    default=100000,
+                    help='Number of CSV rows to render (default: 100000).'),
+        make_option('--chunk-size',
+                    dest='chunk_size',
+                    type='int',
+                    default=None,
+                    help='Chunk size of the streaming modes, in bytes '
+                         '(default: CSV_STREAMING_CHUNK_SIZE).'),)
+    help = ("Compares the throughput and memory use of the buffered and "
+            "the streaming (plain and gzip) CSV responses.")
+
+    def handle(self, *args, **options):
+        count = options['rows']
+
+        class Buffered(csvbase.BaseCsvResponse):
+            columns = COLUMNS
+
+            def get_row_data(self):
+                return _rows(count)
+
+        class Streaming(csvbase.BaseCsvStreamingResponse):
+            columns = COLUMNS
+            chunk_size = options['chunk_size']
+
+            def get_row_data(self):
+                return _rows(count)
+
+        class GzipStreaming(Streaming):
+            gzip = True
+
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        for name, response_class in (('buffered', Buffered),
+                                     ('streaming', Streaming),
+                                     ('streaming+gzip', GzipStreaming)):
+            if tracemalloc:
+                tracemalloc.start()
+            start = time.time()
+            response = response_class(request, None, {}, 'text/csv')
+            if response.streaming:
+                chunks = size = 0
+                for chunk in response.streaming_content:
+                    chunks += 1
+                    size += len(chunk)
+            else:
+                chunks, size = 1, len(response.content)
+            elapsed = time.time() - start
+            peak = None
+            if tracemalloc:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.stdout.write(
+                "%-15s %8.3fs %9.0f rows/s %10d bytes in %6d chunks, "
+                "peak memory %s" % (
+                    name, elapsed, count / max(elapsed, 1e-9), size, chunks,
+                    "%d KiB" % (peak // 1024) if peak is not None
+                    else "n/a (needs tracemalloc)"))
@@ -156,7 +156,14 @@ class HorizonMiddleware(object):
                     )
         # We have a valid session, so we set the timestamp
         # 我们有一个有效的会话，所以我们设置了时间戳
-        request.session['last_activity'] = timestamp
+        # Only when it moved on by SESSION_ACTIVITY_GRANULARITY seconds
+        # though, every change of the session means re-sending the cookie
+        # or writing to the session store.
+        granularity = getattr(settings, 'SESSION_ACTIVITY_GRANULARITY', 60)
+        last_activity = request.session.get('last_activity')
+        if (not isinstance(last_activity, int) or
+                timestamp - last_activity >= granularity):
+            request.session['last_activity'] = timestamp
 
     def process_exception(self, request, exception):
         """Catches internal Horizon exception classes such as NotAuthorized,
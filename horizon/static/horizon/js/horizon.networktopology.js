@@ -72,6 +72,11 @@ horizon.network_topology = {
   network_index: {},
   balloonID:null,
   reload_duration: 10000,
+  // Poll only for changes, with a full reload every few polls to pick up
+  // anything an incremental response cannot describe.
+  full_reload_every: 6,
+  polls_since_full_reload: 0,
+  last_timestamp: null,
   network_height : 0,
   previous_message : null,
   deleting_device : null,
@@ -166,10 +171,23 @@ horizon.network_topology = {
     if (angular.element('#networktopology').length === 0) {
       return;
     }
+    var url = angular.element('#networktopology').data('networktopology') + '?' +
+      angular.element.now();
+    if (self.last_timestamp && !force_start &&
+        self.polls_since_full_reload < self.full_reload_every) {
+      url += '&changes_since=' + encodeURIComponent(self.last_timestamp);
+      self.polls_since_full_reload++;
+    } else {
+      self.polls_since_full_reload = 0;
+    }
     angular.element.getJSON(
-      angular.element('#networktopology').data('networktopology') + '?' + angular.element.now(),
+      url,
       function(data) {
         self.data_loaded = true;
+        self.last_timestamp = data.timestamp;
+        if (data.deleted) {
+          self.remove_deleted_servers(data.deleted.servers);
+        }
         self.load_topology(data);
         if (force_start) {
           var i = 0;
@@ -844,6 +862,16 @@ horizon.network_topology = {
     self.deleting_device = {type: type, deviceId: deviceId};
   },
 
+  remove_deleted_servers: function(serverIds) {
+    var self = this;
+    angular.forEach(serverIds, function(serverId) {
+      if (self.data.servers[serverId]) {
+        self.removeNode(self.data.servers[serverId]);
+        self.data.servers[serverId] = undefined;
+      }
+    });
+  },
+
   remove_node_on_delete: function () {
     var self = this;
     var type = self.deleting_device.type;
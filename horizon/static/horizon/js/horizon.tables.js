@@ -21,86 +21,79 @@ horizon.datatables = {
         $table.removeAttr('decay_constant');
         return;
       }
-      // Trigger the update handlers.
-      $rows_to_update.each(function() {
-        var $row = $(this),
-          $table = $row.closest('table.datatable');
+      // Trigger the update handlers. Rows of the same table are updated
+      // together, in batches of at most batch_size rows per request.
+      var requests = [];
+      $rows_to_update.closest('table.datatable').each(function() {
+        var $table = $(this),
+          $table_rows = $rows_to_update.filter(function() {
+            return $(this).closest('table.datatable').is($table);
+          }),
+          $batch_rows = $table_rows.filter('[data-batch-update-url]');
+        $table_rows.not($batch_rows).each(function() {
+          requests.push({$table: $table, $rows: $(this)});
+        });
+        for (var i = 0; i < $batch_rows.length;
+             i += horizon.datatables.batch_size) {
+          requests.push({
+            $table: $table,
+            $rows: $batch_rows.slice(i, i + horizon.datatables.batch_size)
+          });
+        }
+      });
+      var requests_pending = requests.length;
+      $.each(requests, function(index, request) {
+        var $table = request.$table,
+          $rows = request.$rows,
+          batch = $rows.is('[data-batch-update-url]'),
+          url = $rows.attr(batch ? 'data-batch-update-url' : 'data-update-url');
+        if (batch) {
+          url += '&' + $.param({
+            obj_id: $rows.map(function() {
+              return $(this).attr('data-object-id');
+            }).get()
+          }, true);
+        }
         horizon.ajax.queue({
-          url: $row.attr('data-update-url'),
+          url: url,
           error: function (jqXHR) {
             switch (jqXHR.status) {
               // A 404 indicates the object is gone, and should be removed from the table
+              // A batch lists its gone objects in "removed" instead.
               case 404:
-                // Update the footer count and reset to default empty row if needed
-                var row_count, colspan, template, params;
-
-                // existing count minus one for the row we're removing
-                row_count = horizon.datatables.update_footer_count($table, -1);
-
-                if(row_count === 0) {
-                  colspan = $table.find('th[colspan]').attr('colspan');
-                  template = horizon.templates.compiled_templates["#empty_row_template"];
-                  params = {
-                      "colspan": colspan,
-                      no_items_label: gettext("No items to display.")
-                  };
-                  var empty_row = template.render(params);
-                  $row.replaceWith(empty_row);
-                } else {
-                  $row.remove();
+                if (!batch) {
+                  horizon.datatables.remove_row($table, $rows);
+                  break;
                 }
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                // Enable launch action if quota is not exceeded
-                horizon.datatables.update_actions();
-                break;
+                /* falls through */
               default:
                 console.log(gettext("An error occurred while updating."));
-                $row.removeClass("ajax-update");
-                $row.find("i.ajax-updating").remove();
+                $rows.removeClass("ajax-update");
+                $rows.find("i.ajax-updating").remove();
                 break;
             }
           },
           success: function (data) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('status_unknown')) {
-              var spinner_elm = $new_row.find("td.status_unknown:last");
-              var imagePath = $new_row.find('.btn-action-required').length > 0 ?
-                "dashboard/img/action_required.png":
-                "dashboard/img/loading.gif";
-
-              imagePath = window.STATIC_URL + imagePath;
-              spinner_elm.prepend(
-                $("<div>")
-                  .addClass("loading_gif")
-                  .append($("<img>").attr("src", imagePath)));
+            if (!batch) {
+              horizon.datatables.replace_row($table, $rows, data);
+              return;
             }
-
-            // Only replace row if the html content has changed
-            if($new_row.html() !== $row.html()) {
-              if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
-                // Preserve the checkbox if it's already clicked
-                $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
+            $rows.each(function() {
+              var $row = $(this),
+                obj_id = $row.attr('data-object-id');
+              if (obj_id in data.rows) {
+                horizon.datatables.replace_row($table, $row, data.rows[obj_id]);
+              } else if ($.inArray(obj_id, $.map(data.removed, String)) !== -1) {
+                horizon.datatables.remove_row($table, $row);
               }
-              $row.replaceWith($new_row);
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-              // Check that quicksearch is enabled for this table
-              // Reset quicksearch's data cache.
-              if ($table.attr('id') in horizon.datatables.qs) {
-                horizon.datatables.qs[$table.attr('id')].cache();
-              }
-            }
+            });
           },
           complete: function () {
             // Revalidate the button check for the updated table
             horizon.datatables.validate_button();
-            rows_to_update--;
+            requests_pending--;
             // Schedule next poll when all the rows are updated
-            if ( rows_to_update === 0 ) {
+            if ( requests_pending === 0 ) {
               // Set interval decay to this table, and increase if it already exist
               if(decay_constant === undefined) {
                 decay_constant = 1;
@@ -120,6 +113,69 @@ horizon.datatables = {
     }
   },
 
+  // The maximum number of rows updated by a single request.
+  batch_size: 50,
+
+  remove_row: function($table, $row) {
+    // Update the footer count and reset to default empty row if needed
+    var row_count, colspan, template, params;
+
+    // existing count minus one for the row we're removing
+    row_count = horizon.datatables.update_footer_count($table, -1);
+
+    if(row_count === 0) {
+      colspan = $table.find('th[colspan]').attr('colspan');
+      template = horizon.templates.compiled_templates["#empty_row_template"];
+      params = {
+          "colspan": colspan,
+          no_items_label: gettext("No items to display.")
+      };
+      var empty_row = template.render(params);
+      $row.replaceWith(empty_row);
+    } else {
+      $row.remove();
+    }
+    // Reset tablesorter's data cache.
+    $table.trigger("update");
+    // Enable launch action if quota is not exceeded
+    horizon.datatables.update_actions();
+  },
+
+  replace_row: function($table, $row, data) {
+    var $new_row = $(data);
+
+    if ($new_row.hasClass('status_unknown')) {
+      var spinner_elm = $new_row.find("td.status_unknown:last");
+      var imagePath = $new_row.find('.btn-action-required').length > 0 ?
+        "dashboard/img/action_required.png":
+        "dashboard/img/loading.gif";
+
+      imagePath = window.STATIC_URL + imagePath;
+      spinner_elm.prepend(
+        $("<div>")
+          .addClass("loading_gif")
+          .append($("<img>").attr("src", imagePath)));
+    }
+
+    // Only replace row if the html content has changed
+    if($new_row.html() !== $row.html()) {
+      if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
+        // Preserve the checkbox if it's already clicked
+        $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
+      }
+      $row.replaceWith($new_row);
+      // Reset tablesorter's data cache.
+      $table.trigger("update");
+      // Reset decay constant.
+      $table.removeAttr('decay_constant');
+      // Check that quicksearch is enabled for this table
+      // Reset quicksearch's data cache.
+      if ($table.attr('id') in horizon.datatables.qs) {
+        horizon.datatables.qs[$table.attr('id')].cache();
+      }
+    }
+  },
+
   update_actions: function() {
     var $actions_to_update = $('.btn-launch.ajax-update, .btn-create.ajax-update');
     $actions_to_update.each(function() {
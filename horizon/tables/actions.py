@@ -130,9 +130,15 @@ class BaseAction(html.HTMLElement):
         policy_check = getattr(settings, "POLICY_CHECK_FUNCTION", None)
 
         if policy_check and self.policy_rules:
-            target = self.get_policy_target(request, datum)
-            return (policy_check(self.policy_rules, request, target) and
-                    self.allowed(request, datum))
+            allowed = None
+            get_decision = getattr(self.table, 'get_policy_decision', None)
+            if datum is not None and get_decision:
+                # The table may have checked the rules for all its rows.
+                allowed = get_decision(self, datum)
+            if allowed is None:
+                target = self.get_policy_target(request, datum)
+                allowed = policy_check(self.policy_rules, request, target)
+            return allowed and self.allowed(request, datum)
         return self.allowed(request, datum)
 
     def update(self, request, datum):
@@ -19,9 +19,11 @@ import logging
 from operator import attrgetter
 import sys
 
+from django.conf import settings
 from django.core import exceptions as core_exceptions
 from django.core import urlresolvers
 from django import forms
+from django.http import Http404
 from django.http import HttpResponse  # noqa
 from django import template
 from django.template.defaultfilters import slugify  # noqa
@@ -41,6 +43,7 @@ from horizon import messages
 from horizon.tables.actions import FilterAction  # noqa
 from horizon.tables.actions import LinkAction  # noqa
 from horizon.utils import html
+from horizon.utils import parallel
 
 
 LOG = logging.getLogger(__name__)
@@ -471,6 +474,11 @@ class Row(html.HTMLElement):
     ``ajax_poll_interval`` in the ``HORIZON_CONFIG`` dictionary.
     Default: ``2500`` (measured in milliseconds).
 
+    The rows of a table which need updating are polled together, in one
+    request per table, through :meth:`get_data_many`. By default it calls
+    ``get_data`` for each row concurrently; override it when the API can
+    return several objects at once.
+
     .. attribute:: table
 
         The table which this row belongs to.
@@ -509,6 +517,13 @@ class Row(html.HTMLElement):
         updates. Generally you won't need to change this value.
         Default: ``"row_update"``.
 
+    .. attribute:: ajax_batch_action_name
+
+        String that is used for the query parameter key to request AJAX
+        updates of several rows at once. Generally you won't need to change
+        this value.
+        Default: ``"row_update_batch"``.
+
     .. attribute:: ajax_cell_action_name
 
         String that is used for the query parameter key to request AJAX
@@ -518,6 +533,7 @@ class Row(html.HTMLElement):
     """
     ajax = False
     ajax_action_name = "row_update"
+    ajax_batch_action_name = "row_update_batch"
     ajax_cell_action_name = "cell_update"
 
     def __init__(self, table, datum=None):
@@ -560,6 +576,8 @@ class Row(html.HTMLElement):
             interval = conf.HORIZON_CONFIG['ajax_poll_interval']
             self.attrs['data-update-interval'] = interval
             self.attrs['data-update-url'] = self.get_ajax_update_url()
+            self.attrs['data-batch-update-url'] = \
+                self.get_ajax_batch_update_url()
             self.classes.append("ajax-update")
 
         self.attrs['data-object-id'] = table.get_object_id(datum)
@@ -616,6 +634,17 @@ class Row(html.HTMLElement):
         ]))
         return "%s?%s" % (table_url, params)
 
+    def get_ajax_batch_update_url(self):
+        """Returns the URL updating several rows, to which the object IDs
+        are appended as ``obj_id`` query parameters.
+        """
+        table_url = self.table.get_absolute_url()
+        params = urlencode(collections.OrderedDict([
+            ("action", self.ajax_batch_action_name),
+            ("table", self.table.name)
+        ]))
+        return "%s?%s" % (table_url, params)
+
     def can_be_selected(self, datum):
         """By default if multiselect enabled return True. You can remove the
         checkbox after an ajax update here if required.
@@ -628,6 +657,30 @@ class Row(html.HTMLElement):
         """
         return {}
 
+    def get_data_many(self, request, obj_ids):
+        """Fetches the updated data for the rows of the given object ids.
+
+        Returns a tuple of the list of data objects and the list of the ids
+        of the objects which no longer exist, whose rows get removed from the
+        table. Objects which fail to load for any other reason are in
+        neither list, so that their rows are polled again. By default
+        ``get_data`` is called concurrently for each object id.
+        """
+        calls = parallel.call_parallel(
+            [parallel.Call(self.get_data, (request, obj_id), name=obj_id)
+             for obj_id in obj_ids])
+        data = []
+        removed = []
+        for call in calls:
+            try:
+                data.append(call.get())
+            except exceptions.NOT_FOUND + (exceptions.NotFound, Http404):
+                removed.append(call.name)
+            except Exception:
+                LOG.warning('Unable to update the row of %s: %s',
+                            call.name, call.exc_info[1])
+        return data, removed
+
 
 class Cell(html.HTMLElement):
     """Represents a single cell in the table."""
@@ -1312,6 +1365,49 @@ class DataTable(object):
         """Returns the message to be displayed when there is no data."""
         return self._no_data_message
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._object_index = None
+
+    @staticmethod
+    def _object_id_text(obj_id):
+        if not isinstance(obj_id, six.text_type):
+            obj_id = six.text_type(str(obj_id), 'utf-8')
+        return obj_id
+
+    def _find_objects(self, lookup):
+        """Returns the data objects whose unicode id is ``lookup``.
+
+        The positions of the objects in ``data`` are indexed by id on first
+        use. The index is rebuilt whenever ``data`` is replaced or its
+        length changes, and also when the objects at the indexed positions
+        no longer have the id looked up or none are found, since items may
+        have been replaced in place.
+        """
+        data = self.data or []
+        stale = (self._object_index is None or
+                 self._object_index_size != len(data))
+        while True:
+            if stale:
+                index = {}
+                for position, datum in enumerate(data):
+                    obj_id = self._object_id_text(self.get_object_id(datum))
+                    index.setdefault(obj_id, []).append(position)
+                self._object_index = index
+                self._object_index_size = len(data)
+            matches = [data[position]
+                       for position in self._object_index.get(lookup, [])]
+            if stale or (matches and all(
+                    self._object_id_text(self.get_object_id(datum)) == lookup
+                    for datum in matches)):
+                return matches
+            stale = True
+
     def get_object_by_id(self, lookup):
         """Returns the data object from the table's dataset which matches
         the ``lookup`` parameter specified. An error will be raised if
@@ -1320,17 +1416,11 @@ class DataTable(object):
         We will convert the object id and ``lookup`` to unicode before
         comparison.
 
-        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally.
+        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally,
+        through an index of the data built on first use.
         """
-        if not isinstance(lookup, six.text_type):
-            lookup = six.text_type(str(lookup), 'utf-8')
-        matches = []
-        for datum in self.data:
-            obj_id = self.get_object_id(datum)
-            if not isinstance(obj_id, six.text_type):
-                obj_id = six.text_type(str(obj_id), 'utf-8')
-            if obj_id == lookup:
-                matches.append(datum)
+        lookup = self._object_id_text(lookup)
+        matches = self._find_objects(lookup)
         if len(matches) > 1:
             raise ValueError("Multiple matches were returned for that id: %s."
                              % matches)
@@ -1537,6 +1627,10 @@ class DataTable(object):
                         return HttpResponse(new_row.render())
                     else:
                         return HttpResponse(status=error.status_code)
+            elif new_row.ajax and new_row.ajax_batch_action_name == \
+                    action_name and request.is_ajax():
+                return self.batch_row_update(request,
+                                             request.GET.getlist('obj_id'))
             elif new_row.ajax_cell_action_name == action_name:
                 # inline edit of the cell actions
                 return self.inline_edit_handle(request, table_name,
@@ -1553,6 +1647,37 @@ class DataTable(object):
                             return handled
         return None
 
+    def batch_row_update(self, request, obj_ids):
+        """Renders the updated rows of the given object ids.
+
+        Responds with a JSON object holding the rendered rows by object id
+        in ``rows`` and the ids of the objects which no longer exist in
+        ``removed``.
+        """
+        obj_ids = [self.sanitize_id(obj_id) for obj_id in obj_ids]
+        try:
+            data, removed = self._meta.row_class(self).get_data_many(request,
+                                                                     obj_ids)
+        except Exception:
+            error = exceptions.handle(request, ignore=True)
+            # A 404 would remove every row of the batch, while only some of
+            # its objects may be gone.
+            status = error.status_code
+            if status == 404:
+                status = 500
+            return HttpResponse(status=status)
+
+        rows = collections.OrderedDict()
+        for datum in data:
+            new_row = self._meta.row_class(self)
+            obj_id = self.get_object_id(datum)
+            if obj_id == self.current_item_id:
+                new_row.classes.append('current_selected')
+            new_row.load_cells(datum)
+            rows[six.text_type(obj_id)] = new_row.render()
+        return HttpResponse(json.dumps({'rows': rows, 'removed': removed}),
+                            content_type='application/json')
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -1767,10 +1892,49 @@ class DataTable(object):
         """Returns this table's columns including auto-generated ones."""
         return self.columns.values()
 
+    def check_row_action_policies(self, data):
+        """Checks the policy rules of the row actions for all rows at once.
+
+        When ``POLICY_CHECK_MANY_FUNCTION`` is set alongside
+        ``POLICY_CHECK_FUNCTION``, each row action's rules are checked with a
+        single call for all the given data, and the decisions are used when
+        the rows are rendered.
+        """
+        self._policy_decisions = {}
+        policy_check = getattr(settings, "POLICY_CHECK_FUNCTION", None)
+        policy_check_many = getattr(settings, "POLICY_CHECK_MANY_FUNCTION",
+                                    None)
+        if not (policy_check and policy_check_many and data):
+            return
+        for action in self._meta.row_actions:
+            action = self.base_actions[action.name]
+            if not action.policy_rules:
+                continue
+            try:
+                targets = [action.get_policy_target(self.request, datum)
+                           for datum in data]
+                decisions = policy_check_many(action.policy_rules,
+                                              self.request, targets)
+            except Exception:
+                # Leave it to the per-row checks, which log the error.
+                continue
+            for datum, allowed in zip(data, decisions):
+                self._policy_decisions[(action.name, id(datum))] = allowed
+
+    def get_policy_decision(self, action, datum):
+        """Returns the decision made by :meth:`check_row_action_policies`
+        for the action on datum, or ``None`` if there is none.
+        """
+        decisions = getattr(self, '_policy_decisions', None)
+        if not decisions:
+            return None
+        return decisions.get((action.name, id(datum)))
+
     def get_rows(self):
         """Return the row data for this table broken out by columns."""
         rows = []
         try:
+            self.check_row_action_policies(self.filtered_data)
             for datum in self.filtered_data:
                 row = self._meta.row_class(self, datum)
                 if self.get_object_id(datum) == self.current_item_id:
@@ -16,14 +16,20 @@ from collections import defaultdict
 
 from django import shortcuts
 
+from horizon.utils import parallel
 from horizon import views
 
 from horizon.templatetags.horizon import has_permissions  # noqa
 
 
 class MultiTableMixin(object):
-    """A generic mixin which provides methods for handling DataTables."""
+    """A generic mixin which provides methods for handling DataTables.
+
+    Set ``parallel_data`` to ``True`` to run the ``get_{{ table_name }}_data``
+    methods of independent tables concurrently.
+    """
     data_method_pattern = "get_%s_data"
+    parallel_data = False
 
     def __init__(self, *args, **kwargs):
         super(MultiTableMixin, self).__init__(*args, **kwargs)
@@ -36,6 +42,8 @@ class MultiTableMixin(object):
 
     def _get_data_dict(self):
         if not self._data:
+            if self.parallel_data:
+                return self._get_data_dict_parallel()
             for table in self.table_classes:
                 data = []
                 name = table._meta.name
@@ -45,6 +53,29 @@ class MultiTableMixin(object):
                 self._data[name] = data
         return self._data
 
+    def _get_data_dict_parallel(self):
+        calls = []
+        for table in self.table_classes:
+            name = table._meta.name
+            for func in self._data_methods.get(name, []):
+                calls.append(parallel.Call(func, name=name))
+        parallel.call_parallel(calls)
+        data = dict((table._meta.name, []) for table in self.table_classes)
+        # The data methods handle their own API errors, anything escaping
+        # them is re-raised here exactly as the serial code path would.
+        for call in calls:
+            data[call.name].extend(call.get())
+        self._data = data
+        return self._data
+
+    def get_fan_out(self, max_workers=None, timeout=None):
+        """Returns a :class:`~horizon.utils.parallel.FanOut` bound to the
+        current request, for running independent API calls concurrently
+        from ``get_data`` style methods.
+        """
+        return parallel.FanOut(self.request, max_workers=max_workers,
+                               timeout=timeout)
+
     def get_data_methods(self, table_classes, methods):
         for table in table_classes:
             name = table._meta.name
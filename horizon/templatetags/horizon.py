@@ -18,6 +18,9 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
+import logging
+import time
+
 from horizon.contrib import bootstrap_datepicker
 
 from django.conf import settings
@@ -30,6 +33,8 @@ from horizon.base import Horizon  # noqa
 from horizon import conf
 
 
+LOG = logging.getLogger(__name__)
+
 register = template.Library()
 
 
@@ -48,6 +53,45 @@ def has_permissions_on_list(components, user):
             in components if has_permissions(user, component)]
 
 
+def _is_visible(component, context):
+    nav = component.nav
+    if callable(nav):
+        nav = nav(context)
+    return bool(nav) and component.can_access(context)
+
+
+def _get_nav_tree(context):
+    """Returns the navigation the user of the request may see.
+
+    It is a list of ``(dashboard, visible, groups)`` tuples, where
+    ``groups`` maps each panel group of the dashboard which has visible
+    panels to these panels. The tree is computed once per request and
+    shared by all the navigation tags; access checks are also cached per
+    token across requests, see :func:`horizon.base.access_cached`.
+    """
+    request = context['request']
+    tree = getattr(request, '_horizon_nav_tree', None)
+    if tree is not None:
+        return tree
+
+    start = time.time()
+    tree = []
+    panel_count = 0
+    for dash in Horizon.get_dashboards():
+        groups = []
+        for group in dash.get_panel_groups().values():
+            panel_count += len(group)
+            allowed_panels = [panel for panel in group
+                              if _is_visible(panel, context)]
+            if allowed_panels:
+                groups.append((group, allowed_panels))
+        tree.append((dash, _is_visible(dash, context), OrderedDict(groups)))
+    request._horizon_nav_tree = tree
+    LOG.debug("Navigation of %d dashboards and %d panels computed in %.3fs",
+              len(tree), panel_count, time.time() - start)
+    return tree
+
+
 @register.inclusion_tag('horizon/_sidebar.html', takes_context=True)
 def horizon_nav(context):
     if 'request' not in context:
@@ -56,28 +100,13 @@ def horizon_nav(context):
     current_panel_group = None
     current_panel = context['request'].horizon.get('panel', None)
     dashboards = []
-    for dash in Horizon.get_dashboards():
-        panel_groups = dash.get_panel_groups()
-        non_empty_groups = []
-        for group in panel_groups.values():
-            allowed_panels = []
-            for panel in group:
-                if (callable(panel.nav) and panel.nav(context) and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                elif (not callable(panel.nav) and panel.nav and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                if panel == current_panel:
+    for dash, visible, groups in _get_nav_tree(context):
+        if current_panel is not None and current_panel_group is None:
+            for group in dash.get_panel_groups().values():
+                if current_panel in group:
                     current_panel_group = group.slug
-            if allowed_panels:
-                non_empty_groups.append((group, allowed_panels))
-        if (callable(dash.nav) and dash.nav(context) and
-                dash.can_access(context)):
-            dashboards.append((dash, OrderedDict(non_empty_groups)))
-        elif (not callable(dash.nav) and dash.nav and
-                dash.can_access(context)):
-            dashboards.append((dash, OrderedDict(non_empty_groups)))
+        if visible:
+            dashboards.append((dash, groups))
     return {'components': dashboards,
             'user': context['request'].user,
             'current': current_dashboard,
@@ -93,13 +122,8 @@ def horizon_main_nav(context):
     if 'request' not in context:
         return {}
     current_dashboard = context['request'].horizon.get('dashboard', None)
-    dashboards = []
-    for dash in Horizon.get_dashboards():
-        if dash.can_access(context):
-            if callable(dash.nav) and dash.nav(context):
-                dashboards.append(dash)
-            elif dash.nav:
-                dashboards.append(dash)
+    dashboards = [dash for dash, visible, groups in _get_nav_tree(context)
+                  if visible]
     return {'components': dashboards,
             'user': context['request'].user,
             'current': current_dashboard,
@@ -113,19 +137,12 @@ def horizon_dashboard_nav(context):
     if 'request' not in context:
         return {}
     dashboard = context['request'].horizon['dashboard']
-    panel_groups = dashboard.get_panel_groups()
     non_empty_groups = []
 
-    for group in panel_groups.values():
-        allowed_panels = []
-        for panel in group:
-            if (callable(panel.nav) and panel.nav(context) and
-                    panel.can_access(context)):
-                allowed_panels.append(panel)
-            elif (not callable(panel.nav) and panel.nav and
-                    panel.can_access(context)):
-                allowed_panels.append(panel)
-        if allowed_panels:
+    for dash, visible, groups in _get_nav_tree(context):
+        if dash != dashboard:
+            continue
+        for group, allowed_panels in groups.items():
             if group.name is None:
                 non_empty_groups.append((dashboard.name, allowed_panels))
             else:
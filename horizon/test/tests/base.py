@@ -525,3 +525,14 @@ class RbacHorizonTests(test.TestCase):
                                  ['<Panel: rbac_panel_yes>'])
 
         self.assertTrue(dogs.can_access(context))
+
+    def test_can_access_cached_per_request(self):
+        context = {'request': self.request}
+        dogs = horizon.get_dashboard("dogs")
+        self.assertTrue(dogs.can_access(context))
+        key = "%s.%s" % (dogs.__class__.__module__, dogs.__class__.__name__)
+        self.assertTrue(self.request._horizon_allowed[key])
+        self.assertNotIn('allowed', self.request.session)
+
+        self.request._horizon_allowed[key] = False
+        self.assertFalse(dogs.can_access(context))
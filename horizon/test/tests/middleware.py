@@ -48,6 +48,20 @@ class MiddlewareTests(test.TestCase):
         self.assertEqual(302, resp.status_code)
         self.assertEqual(requested_url, resp.get('Location'))
 
+    def test_last_activity_granularity(self):
+        request = self.factory.get('/project/instances/')
+        timestamp = int(time.time())
+        request.session['last_activity'] = timestamp - 1
+        request.session.modified = False
+        mw = middleware.HorizonMiddleware()
+        self.assertIsNone(mw.process_request(request))
+        self.assertEqual(timestamp - 1, request.session['last_activity'])
+        self.assertFalse(request.session.modified)
+
+        request.session['last_activity'] = timestamp - 120
+        mw.process_request(request)
+        self.assertTrue(request.session['last_activity'] >= timestamp)
+
     def test_process_response_redirect_on_ajax_request(self):
         url = settings.LOGIN_URL
         mw = middleware.HorizonMiddleware()
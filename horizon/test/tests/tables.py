@@ -15,6 +15,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
@@ -24,6 +26,7 @@ from django.template import defaultfilters
 from mox3.mox import IsA  # noqa
 import six
 
+from horizon import exceptions
 from horizon import tables
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
@@ -123,6 +126,10 @@ class MyRow(tables.Row):
 
     @classmethod
     def get_data(cls, request, obj_id):
+        if obj_id == 'gone':
+            raise http.Http404()
+        if obj_id == 'broken':
+            raise ValueError('Unable to retrieve the object.')
         return TEST_DATA_2[0]
 
 
@@ -326,6 +333,34 @@ class DisabledActionsTable(tables.DataTable):
 
 
 class DataTableTests(test.TestCase):
+    def test_get_object_by_id(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id('2'))
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id(2))
+        with self.assertRaises(exceptions.Http302):
+            self.table.get_object_by_id('5')
+
+        # The index follows changes of the data.
+        self.table.data = TEST_DATA_2
+        self.assertEqual(TEST_DATA_2[0], self.table.get_object_by_id('1'))
+        with self.assertRaises(exceptions.Http302):
+            self.table.get_object_by_id('2')
+        self.table.data = list(TEST_DATA_2)
+        self.table.data.append(TEST_DATA_3[0])
+        with self.assertRaises(ValueError):
+            self.table.get_object_by_id('1')
+
+        # Items replaced in place, keeping the length of the data.
+        self.table.data = list(TEST_DATA)
+        self.assertEqual(TEST_DATA[0], self.table.get_object_by_id('1'))
+        self.table.data[0] = TEST_DATA_2[0]
+        self.assertIs(TEST_DATA_2[0], self.table.get_object_by_id('1'))
+        replacement = FakeObject('5', 'object_5', 'value_5', 'up')
+        self.table.data[1] = replacement
+        self.assertIs(replacement, self.table.get_object_by_id('5'))
+        with self.assertRaises(exceptions.Http302):
+            self.table.get_object_by_id('2')
+
     def test_table_instantiation(self):
         """Tests everything that happens when the table is instantiated."""
         self.table = MyTable(self.request, TEST_DATA)
@@ -1016,6 +1051,22 @@ class DataTableTests(test.TestCase):
         self.assertContains(resp, "my_table__row__1")
         self.assertContains(resp, "status_down")
 
+        # Updating several rows at once; only the objects which are not
+        # found get removed, the ones which fail to load are left as they are.
+        req = self.factory.get('/my_url/',
+                               {"table": "my_table",
+                                "action": "row_update_batch",
+                                "obj_id": ["1", "gone", "broken"]},
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyTable(req)
+        resp = self.table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(['1'], list(content['rows']))
+        self.assertIn("my_table__row__1", content['rows']['1'])
+        self.assertIn("status_down", content['rows']['1'])
+        self.assertEqual(['gone'], content['removed'])
+
         # Verify that we don't get a response for a valid action with the
         # wrong method.
         params = {"table": "my_table", "action": "delete", "obj_id": "1"}
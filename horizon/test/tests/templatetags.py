@@ -128,3 +128,17 @@ class TemplateTagTests(test.TestCase):
                                             template_text=text,
                                             context={'request': self.request})
         self.assertEqual(single_line(rendered_str), single_line(expected))
+
+    def test_nav_tree_computed_once_per_request(self):
+        self.render_template(tag_require='horizon',
+                             template_text="{% horizon_main_nav %}",
+                             context={'request': self.request})
+        tree = self.request._horizon_nav_tree
+        self.assertEqual(['cats', 'dogs'],
+                         [dash.slug for dash, visible, groups in tree
+                          if visible])
+
+        self.render_template(tag_require='horizon',
+                             template_text="{% horizon_nav %}",
+                             context={'request': self.request})
+        self.assertIs(tree, self.request._horizon_nav_tree)
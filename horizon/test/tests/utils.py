@@ -14,18 +14,24 @@
 
 import datetime
 import os
+import threading
+import time
+import zlib
 
 from django.core.exceptions import ValidationError  # noqa
 import django.template
 from django.template import defaultfilters
 
+from horizon import exceptions
 from horizon import forms
 from horizon.test import helpers as test
+from horizon.utils import csvbase
 from horizon.utils import filters
 # we have to import the filter in order to register it
 from horizon.utils.filters import parse_isotime  # noqa
 from horizon.utils import functions
 from horizon.utils import memoized
+from horizon.utils import parallel
 from horizon.utils import secret_key
 from horizon.utils import units
 from horizon.utils import validators
@@ -372,6 +378,207 @@ class MemoizedTests(test.TestCase):
             cache_calls(1)
         self.assertEqual(1, len(values_list))
 
+    def test_memoized_lru_eviction_and_stats(self):
+        values_list = []
+
+        @memoized.memoized(maxsize=2)
+        def cache_calls(value):
+            values_list.append(value)
+            return value
+
+        cache_calls(1)
+        cache_calls(2)
+        cache_calls(1)
+        cache_calls(3)  # evicts 2, the least recently used value
+        cache_calls(1)
+        self.assertEqual([1, 2, 3], values_list)
+        cache_calls(2)
+        self.assertEqual([1, 2, 3, 2], values_list)
+
+        info = cache_calls.cache_info()
+        self.assertEqual(2, info['hits'])
+        self.assertEqual(4, info['misses'])
+        self.assertEqual(2, info['evictions'])
+        self.assertEqual(2, info['size'])
+
+        cache_calls.cache_clear()
+        self.assertEqual(0, cache_calls.cache_info()['size'])
+
+    def test_memoized_ttl(self):
+        values_list = []
+
+        @memoized.memoized(ttl=0.01)
+        def cache_calls(value):
+            values_list.append(value)
+            return value
+
+        cache_calls('a')
+        cache_calls('a')
+        self.assertEqual(1, len(values_list))
+        time.sleep(0.02)
+        cache_calls('a')
+        self.assertEqual(2, len(values_list))
+
+    def test_memoized_drops_collected_arguments(self):
+        class Request(object):
+            pass
+
+        @memoized.memoized
+        def cache_calls(request, value=None):
+            return value
+
+        request = Request()
+        for x in range(0, 3):
+            cache_calls(request)
+            cache_calls(request, value=request)
+            cache_calls('a')
+        self.assertEqual(3, cache_calls.cache_info()['size'])
+        del request
+        self.assertEqual(1, cache_calls.cache_info()['size'])
+
+    def test_memoized_in_cache(self):
+        values_list = []
+
+        @memoized.memoized_in_cache(lambda value: ('key', value), timeout=60)
+        def cache_calls(value):
+            values_list.append(value)
+            return [value]
+
+        cache_calls.invalidate_all()
+        for x in range(0, 5):
+            self.assertEqual([1], cache_calls(1))
+        self.assertEqual(1, len(values_list))
+
+        cache_calls(2)
+        self.assertEqual(2, len(values_list))
+
+        cache_calls.invalidate(1)
+        cache_calls(1)
+        cache_calls(2)
+        self.assertEqual(3, len(values_list))
+
+        cache_calls.invalidate_all()
+        cache_calls(1)
+        cache_calls(2)
+        self.assertEqual(5, len(values_list))
+
+    def test_memoized_in_cache_disabled_or_too_large(self):
+        values_list = []
+
+        @memoized.memoized_in_cache(lambda value: value, timeout=0)
+        def disabled(value):
+            values_list.append(value)
+            return value
+
+        @memoized.memoized_in_cache(lambda value: value, max_size=10)
+        def too_large(value):
+            values_list.append(value)
+            return value * 100
+
+        for x in range(0, 3):
+            disabled(1)
+            too_large('x')
+        self.assertEqual(6, len(values_list))
+
+
+class ParallelTests(test.TestCase):
+    def test_map_parallel_preserves_order(self):
+        results = parallel.map_parallel(lambda x: x * 2, range(20),
+                                        max_workers=4)
+        self.assertEqual([x * 2 for x in range(20)], results)
+
+    def test_map_parallel_reraises(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError(x)
+            return x
+        self.assertRaises(ValueError, parallel.map_parallel, fail, range(5))
+
+    def test_calls_are_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def work(x):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+            return x
+
+        parallel.map_parallel(work, range(12), max_workers=3)
+        self.assertLessEqual(state['peak'], 3)
+
+    def test_call_timeout(self):
+        event = threading.Event()
+        calls = parallel.call_parallel(
+            [parallel.Call(event.wait, (5,)), parallel.Call(int, ('1',))],
+            max_workers=2, timeout=0.05)
+        event.set()
+        self.assertRaises(parallel.CallTimeout, calls[0].get)
+        self.assertEqual(1, calls[1].get())
+
+    def test_cancelled_pool_skips_pending_calls(self):
+        pool = parallel.WorkerPool(max_workers=1)
+        pool.cancel()
+        calls = pool.run([parallel.Call(int, ('1',))])
+        self.assertRaises(parallel.CallCancelled, calls[0].get)
+
+    def test_fan_out_handles_errors(self):
+        def fail(request):
+            raise exceptions.NotFound()
+
+        request = self.factory.get('/')
+        fan_out = parallel.FanOut(request)
+        fan_out.add('ok', len, (['a', 'b'],))
+        fan_out.add('failed', fail, (request,), default=[],
+                    message="Unable to retrieve things.")
+        results = fan_out.run()
+        self.assertEqual(2, results['ok'])
+        self.assertEqual([], results['failed'])
+        self.assertEqual(['ok', 'failed'], list(fan_out.timings))
+
+
+class CsvStreamingTests(test.TestCase):
+    class Renderer(csvbase.BaseCsvStreamingResponse):
+        columns = ['id', 'name']
+        chunk_size = 1024
+
+        def get_row_data(self):
+            for i in range(1000):
+                yield (i, 'row %d' % i)
+
+    def _expected(self):
+        return b''.join([b'id,name\r\n'] +
+                        [('%d,row %d\r\n' % (i, i)).encode('ascii')
+                         for i in range(1000)])
+
+    def test_rows_sent_in_chunks(self):
+        request = self.factory.get('/export')
+        resp = self.Renderer(request, None, {}, 'text/csv')
+        chunks = list(resp.streaming_content)
+        # The header chunk, then chunks of about chunk_size bytes.
+        self.assertTrue(3 < len(chunks) < 20)
+        self.assertEqual(self._expected(), b''.join(chunks))
+        self.assertFalse(resp.has_header('Content-Encoding'))
+
+    def test_gzip(self):
+        class GzipRenderer(self.Renderer):
+            gzip = True
+
+        request = self.factory.get('/export', HTTP_ACCEPT_ENCODING='gzip')
+        resp = GzipRenderer(request, None, {}, 'text/csv')
+        self.assertEqual('gzip', resp['Content-Encoding'])
+        self.assertIn('Accept-Encoding', resp['Vary'])
+        content = b''.join(resp.streaming_content)
+        self.assertEqual(self._expected(),
+                         zlib.decompress(content, 16 + zlib.MAX_WBITS))
+
+        request = self.factory.get('/export')
+        resp = GzipRenderer(request, None, {}, 'text/csv')
+        self.assertFalse(resp.has_header('Content-Encoding'))
+
 
 class GetPageSizeTests(test.TestCase):
     def test_bad_session_value(self):
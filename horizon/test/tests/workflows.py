@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 from django import forms
 from django import http
 
@@ -240,6 +242,25 @@ class WorkflowsTests(test.TestCase):
         flow.context.set("extra_data", "foo")
         self.assertTrue(flow.is_valid())
 
+    def test_workflow_validate_step_range(self):
+        seed = {"project_id": PROJECT_ID,
+                "user_id": self.user.id}
+        req = self.factory.post("/", seed,
+                                HTTP_X_HORIZON_VALIDATE_STEP_START='0',
+                                HTTP_X_HORIZON_VALIDATE_STEP_END='0')
+        req.user = self.user
+        flow = TestWorkflow(req)
+        self.assertEqual((0, 0), flow.get_validate_step_range())
+        self.assertTrue(flow.steps[0].action.is_valid())
+        # The actions of the steps after the validated ones aren't built.
+        self.assertIsNone(getattr(flow.steps[1], '_action', None))
+
+        view = TestWorkflowView.as_view()
+        res = view(req)
+        self.assertEqual(200, res.status_code)
+        self.assertEqual('application/json', res['Content-Type'])
+        self.assertFalse(json.loads(res.content.decode('utf-8'))['has_errors'])
+
     def test_workflow_finalization(self):
         flow = TestWorkflow(self.request)
         self.assertTrue(flow.finalize())
@@ -14,10 +14,13 @@ from __future__ import division
 
 from csv import DictWriter  # noqa
 from csv import writer  # noqa
+import zlib
 
 
+from django.conf import settings
 from django.http import HttpResponse  # noqa
 from django import template as django_template
+from django.utils.cache import patch_vary_headers
 from django import VERSION  # noqa
 import six
 
@@ -106,8 +109,16 @@ if VERSION >= (1, 5, 0):
     class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
 
         """Base CSV Streaming class. Provides streaming response for CSV data.
+
+        Rows are sent in chunks of about ``chunk_size`` bytes
+        (``CSV_STREAMING_CHUNK_SIZE``, 64 KiB by default) rather than one
+        by one. When ``gzip`` is set and the client accepts it, the chunks
+        are compressed on the fly.
         """
 
+        chunk_size = None
+        gzip = False
+
         def __init__(self, request, template, context, content_type, **kwargs):
             super(BaseCsvStreamingResponse, self).__init__()
             self['Content-Disposition'] = 'attachment; filename="%s"' % (
@@ -121,13 +132,29 @@ if VERSION >= (1, 5, 0):
                 context = django_template.RequestContext(request, self.context)
                 self.header = header_template.render(context)
 
+            if self.chunk_size is None:
+                self.chunk_size = getattr(settings, 'CSV_STREAMING_CHUNK_SIZE',
+                                          64 * 1024)
+            self.compressor = None
+            if self.gzip:
+                patch_vary_headers(self, ('Accept-Encoding',))
+                if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+                    self['Content-Encoding'] = 'gzip'
+                    self.compressor = zlib.compressobj(
+                        6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
             self._closable_objects.append(self.out)
 
             self.streaming_content = self.get_content()
 
         def buffer(self):
             buf = self.out.getvalue()
+            self.out.seek(0)
             self.out.truncate(0)
+            if self.compressor:
+                if isinstance(buf, six.text_type):
+                    buf = buf.encode('utf-8')
+                buf = self.compressor.compress(buf)
             return buf
 
         def get_content(self):
@@ -135,11 +162,20 @@ if VERSION >= (1, 5, 0):
                 self.out.write(self.encode(self.header))
 
             self.write_csv_header()
+            # Send the header straight away so the download starts.
             yield self.buffer()
 
             for row in self.get_row_data():
                 self.write_csv_row(row)
-                yield self.buffer()
+                if self.out.tell() >= self.chunk_size:
+                    buf = self.buffer()
+                    if buf:
+                        yield buf
+
+            buf = self.buffer()
+            if self.compressor:
+                buf += self.compressor.flush()
+            yield buf
 
         def get_row_data(self):
             return []
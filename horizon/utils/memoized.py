@@ -12,10 +12,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import functools
+import hashlib
+import threading
+import time
 import warnings
 import weakref
 
+from django.conf import settings
+from django.core.cache import caches
 import six
 
 
@@ -23,30 +29,53 @@ class UnhashableKeyWarning(RuntimeWarning):
     """Raised when trying to memoize a function with an unhashable argument."""
 
 
-def _try_weakref(arg, remove_callback):
+# Arguments of these types are used in cache keys as they are; they can't be
+# weakly referenced anyway, so don't pay for trying.
+_PLAIN_TYPES = six.string_types + six.integer_types + (
+    six.binary_type, float, bool, type(None))
+
+# Separates positional from keyword arguments in cache keys.
+_KWARGS_MARK = object()
+
+# Every function decorated with @memoized by id, for memoized_stats().
+_registry = weakref.WeakValueDictionary()
+
+
+def _try_weakref(arg, remove_callback=None):
     """Return a weak reference to arg if possible, or arg itself if not."""
+    if isinstance(arg, _PLAIN_TYPES):
+        return arg
     try:
+        # Without a callback, this returns the existing reference to arg if
+        # there is one, which makes building a key for a lookup cheap.
         arg = weakref.ref(arg, remove_callback)
     except TypeError:
-        # Not all types can have a weakref. That includes strings
-        # and floats and such, so just pass them through directly.
+        # Not all types can have a weakref. That includes tuples and
+        # frozensets and such, so just pass them through directly.
         pass
     return arg
 
 
-def _get_key(args, kwargs, remove_callback):
+def _get_key(args, kwargs, remove_callback=None):
     """Calculate the cache key, using weak references where possible."""
     # Use tuples, because lists are not hashable.
-    weak_args = tuple(_try_weakref(arg, remove_callback) for arg in args)
-    # Use a tuple of (key, values) pairs, because dict is not hashable.
-    # Sort it, so that we don't depend on the order of keys.
-    weak_kwargs = tuple(sorted(
-        (key, _try_weakref(value, remove_callback))
-        for (key, value) in six.iteritems(kwargs)))
-    return weak_args, weak_kwargs
+    key = tuple(_try_weakref(arg, remove_callback) for arg in args)
+    if kwargs:
+        # Use (key, value) pairs, because dict is not hashable. Sort them,
+        # so that we don't depend on the order of keys.
+        key += (_KWARGS_MARK,) + tuple(sorted(
+            (name, _try_weakref(value, remove_callback))
+            for (name, value) in six.iteritems(kwargs)))
+    return key
 
 
-def memoized(func):
+def _get_maxsize(maxsize):
+    if maxsize is None:
+        maxsize = getattr(settings, 'HORIZON_MEMOIZED_MAXSIZE', 1000)
+    return maxsize or None
+
+
+def memoized(func=None, maxsize=None, ttl=None):
     """Decorator that caches function calls.
 
     Caches the decorated function's return value the first time it is called
@@ -54,40 +83,69 @@ def memoized(func):
     cached value is returned instead of calling the decorated function again.
 
     The cache uses weak references to the passed arguments, so it doesn't keep
-    them alive in memory forever.
+    them alive in memory forever. Arguments which can't be weakly referenced
+    (strings, numbers, tuples, ...) are kept in the cache, which is why it
+    holds at most ``maxsize`` values, evicting the least recently used ones
+    (``HORIZON_MEMOIZED_MAXSIZE``, 1000 by default; 0 means no limit).
+    Values older than ``ttl`` seconds, if given, are not used either::
+
+        @memoized
+        def flavor_get(request, flavor_id):
+            ...
+
+        @memoized(maxsize=100, ttl=60)
+        def region_list(endpoint):
+            ...
+
+    The cache may be used from several threads. ``cache_info()`` of the
+    decorated function returns its hits, misses, evictions and size, and
+    ``cache_clear()`` empties it.
     """
-    # The dictionary in which all the data will be cached. This is a separate
+    if func is None:
+        return functools.partial(memoized, maxsize=maxsize, ttl=ttl)
+
+    # The dictionary in which all the data will be cached, as (value,
+    # timestamp, key) tuples, least recently used first. This is a separate
     # instance for every decorated function, and it's stored in a closure of
     # the wrapped function.
-    cache = {}
+    cache = collections.OrderedDict()
+    lock = threading.Lock()
+    stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    # Keys whose arguments have been garbage collected. Weak reference
+    # callbacks may run at any time, even while the lock is held by the very
+    # same thread, so they only queue the keys and never touch the cache.
+    dead_keys = []
+
+    def purge():
+        while dead_keys:
+            cache.pop(dead_keys.pop(), None)
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
-        # We need to have defined key early, to be able to use it in the
-        # remove() function, but we calculate the actual value of the key
-        # later on, because we need the remove() function for that.
-        key = None
-
-        def remove(ref):
-            """A callback to remove outdated items from cache."""
-            try:
-                # The key here is from closure, and is calculated later.
-                del cache[key]
-            except KeyError:
-                # Some other weak reference might have already removed that
-                # key -- in that case we don't need to do anything.
-                pass
-
-        key = _get_key(args, kwargs, remove)
         try:
-            # We want cache hit to be as fast as possible, and don't really
-            # care much about the speed of a cache miss, because it will only
-            # happen once and likely calls some external API, database, or
-            # some other slow thing. That's why the hit is in straightforward
-            # code, and the miss is in an exception.
-            value = cache[key]
+            key = _get_key(args, kwargs)
+            with lock:
+                if dead_keys:
+                    purge()
+                # We want cache hit to be as fast as possible, and don't
+                # really care much about the speed of a cache miss, because
+                # it will only happen once and likely calls some external
+                # API, database, or some other slow thing. That's why the hit
+                # is in straightforward code, and the miss is in an
+                # exception.
+                value, timestamp, stored_key = cache[key]
+                if ttl is not None and time.time() - timestamp > ttl:
+                    del cache[key]
+                    raise KeyError(key)
+                if len(cache) > 1:
+                    # Mark the value as the most recently used one. Put it
+                    # back under the stored key, whose weak references have
+                    # the remove() callbacks attached.
+                    cache[stored_key] = cache.pop(key)
+                stats['hits'] += 1
+            return value
         except KeyError:
-            value = cache[key] = func(*args, **kwargs)
+            pass
         except TypeError:
             # The calculated key may be unhashable when an unhashable object,
             # such as a list, is passed as one of the arguments. In that case,
@@ -96,11 +154,169 @@ def memoized(func):
             warnings.warn(
                 "The key %r is not hashable and cannot be memoized." % (key,),
                 UnhashableKeyWarning, 2)
-            value = func(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        # The lock isn't held while calling the function, concurrent misses
+        # for the same key may both call it; the last value wins.
+        value = func(*args, **kwargs)
+
+        # We need to have defined key early, to be able to use it in the
+        # remove() function, but we calculate the actual value of the key
+        # later on, because we need the remove() function for that.
+        key = None
+
+        def remove(ref):
+            """A callback to remove outdated items from cache."""
+            # The key here is from closure, and is calculated later.
+            dead_keys.append(key)
+
+        key = _get_key(args, kwargs, remove)
+        limit = _get_maxsize(maxsize)
+        with lock:
+            stats['misses'] += 1
+            cache.pop(key, None)
+            cache[key] = (value, time.time(), key)
+            while limit and len(cache) > limit:
+                cache.popitem(last=False)
+                stats['evictions'] += 1
         return value
+
+    def cache_info():
+        with lock:
+            if dead_keys:
+                purge()
+            info = dict(stats, size=len(cache))
+        info.update(maxsize=_get_maxsize(maxsize), ttl=ttl)
+        return info
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            del dead_keys[:]
+
+    wrapped.cache_info = cache_info
+    wrapped.cache_clear = cache_clear
+    _registry[id(wrapped)] = wrapped
     return wrapped
 
 # We can use @memoized for methods now too, because it uses weakref and so
 # it doesn't keep the instances in memory forever. We might want to separate
 # them in the future, however.
 memoized_method = memoized
+
+
+def memoized_stats():
+    """Returns the cache statistics of all memoized functions, by name.
+
+    Counters of functions sharing a name, such as methods of different
+    classes on Python 2, are added up.
+    """
+    stats = {}
+    for func in list(_registry.values()):
+        name = '%s.%s' % (func.__module__,
+                          getattr(func, '__qualname__', func.__name__))
+        info = func.cache_info()
+        if name in stats:
+            for counter in ('hits', 'misses', 'evictions', 'size'):
+                stats[name][counter] += info[counter]
+        else:
+            stats[name] = info
+    return stats
+
+
+def _shared_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def memoized_in_cache(key_func, timeout=None, max_size=None, dumps=None,
+                      loads=None):
+    """Decorator that caches function calls across requests and processes.
+
+    Unlike :func:`memoized`, which keeps the values for the lifetime of its
+    (usually request-bound) arguments in the current process, the values are
+    stored in Django's cache framework (the ``API_CACHE_ALIAS`` cache, which
+    may be locmem, memcached, file based, ...), so every worker sharing that
+    cache benefits from them.
+
+    ``key_func`` is called with the arguments of the decorated function and
+    must return a stable, ``repr``-able key, e.g. built from an endpoint URL
+    and a project ID rather than from a request object.
+
+    Values are kept for ``timeout`` seconds, ``API_CACHE_TIMEOUT`` by default
+    (60 seconds); a timeout of 0 disables the cache. Values whose pickled
+    size exceeds ``max_size`` bytes (``API_CACHE_MAX_VALUE_SIZE``, 1 MiB by
+    default) are not cached, the number of entries is bound by the cache
+    backend ``MAX_ENTRIES`` option.
+
+    Objects which cannot be pickled, such as API client resources holding a
+    reference to their client, can be converted with ``dumps`` before
+    storing and restored with ``loads(value, *args, **kwargs)``.
+
+    The decorated function gets two invalidation hooks:
+    ``invalidate(*args, **kwargs)`` drops the value cached for the given
+    arguments and ``invalidate_all()`` drops every value of the function.
+    """
+    def decorator(func):
+        prefix = 'horizon:memoized:%s.%s' % (func.__module__, func.__name__)
+        generation_key = prefix + ':generation'
+
+        def get_timeout():
+            if timeout is not None:
+                return timeout
+            return getattr(settings, 'API_CACHE_TIMEOUT', 60)
+
+        def get_key(cache, args, kwargs):
+            generation = cache.get(generation_key)
+            if generation is None:
+                generation = 0
+            key = repr(key_func(*args, **kwargs))
+            digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+            return '%s:%s:%s' % (prefix, generation, digest)
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            cache_timeout = get_timeout()
+            if not cache_timeout:
+                return func(*args, **kwargs)
+            cache = _shared_cache()
+            key = get_key(cache, args, kwargs)
+            value = cache.get(key)
+            if value is not None:
+                if loads:
+                    return loads(value, *args, **kwargs)
+                return value
+
+            result = func(*args, **kwargs)
+            value = dumps(result) if dumps else result
+            limit = max_size
+            if limit is None:
+                limit = getattr(settings, 'API_CACHE_MAX_VALUE_SIZE',
+                                1024 * 1024)
+            try:
+                size = len(six.moves.cPickle.dumps(value, -1))
+            except Exception:
+                warnings.warn("The result of %s cannot be pickled and "
+                              "cannot be cached." % func.__name__,
+                              RuntimeWarning, 2)
+                return result
+            if size <= limit:
+                cache.set(key, value, cache_timeout)
+            return result
+
+        def invalidate(*args, **kwargs):
+            cache = _shared_cache()
+            cache.delete(get_key(cache, args, kwargs))
+
+        def invalidate_all():
+            cache = _shared_cache()
+            try:
+                cache.incr(generation_key)
+            except ValueError:
+                # The generation was never bumped (or has been evicted),
+                # values cached so far are stored under generation 0.
+                cache.set(generation_key, 1, None)
+
+        wrapped.invalidate = invalidate
+        wrapped.invalidate_all = invalidate_all
+        return wrapped
+    return decorator
@@ -0,0 +1,270 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Helpers for running independent, blocking API calls concurrently.
+
+Most Horizon views gather their data from several services one call after
+another, so the page latency is the sum of the backend latencies.  The
+helpers here run such calls on a small, bounded set of threads, which brings
+the latency down to roughly that of the slowest call.
+"""
+
+from collections import OrderedDict
+import logging
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core import urlresolvers
+from django.utils import translation
+import six
+from six.moves import queue
+
+from horizon import exceptions
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class CallTimeout(Exception):
+    """Raised from :meth:`Call.get` when a call did not finish in time."""
+
+
+class CallCancelled(Exception):
+    """Raised from :meth:`Call.get` when a call was cancelled before start."""
+
+
+def get_max_workers(max_workers=None):
+    """Returns the thread limit to use, honouring the deployment setting."""
+    if max_workers is None:
+        max_workers = getattr(settings, 'HORIZON_PARALLEL_MAX_WORKERS',
+                              DEFAULT_MAX_WORKERS)
+    return max(1, int(max_workers))
+
+
+class Call(object):
+    """A single function call and, once it has run, its outcome.
+
+    The outcome is either ``result`` or ``exc_info`` (as returned by
+    ``sys.exc_info()``); ``elapsed`` holds the wall clock time in seconds.
+    """
+    def __init__(self, func, args=(), kwargs=None, name=None):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.name = name or getattr(func, '__name__', repr(func))
+        self.result = None
+        self.exc_info = None
+        self.elapsed = None
+        self.done = False
+        self._lock = threading.Lock()
+
+    def run(self):
+        start = time.time()
+        result = exc_info = None
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception:
+            exc_info = sys.exc_info()
+        self._finish(result, exc_info, time.time() - start)
+
+    def cancel(self):
+        try:
+            raise CallCancelled("Call %s was cancelled." % self.name)
+        except CallCancelled:
+            self._finish(None, sys.exc_info(), 0)
+
+    def expire(self, elapsed):
+        try:
+            raise CallTimeout("Call %s timed out after %.2fs."
+                              % (self.name, elapsed))
+        except CallTimeout:
+            self._finish(None, sys.exc_info(), elapsed)
+
+    def _finish(self, result, exc_info, elapsed):
+        # A call which has already expired keeps its timeout outcome even
+        # if the worker thread eventually returns.
+        with self._lock:
+            if self.done:
+                return
+            self.result = result
+            self.exc_info = exc_info
+            self.elapsed = elapsed
+            self.done = True
+
+    @property
+    def failed(self):
+        return self.exc_info is not None
+
+    def get(self):
+        """Returns the result, re-raising the exception the call hit."""
+        if self.exc_info is not None:
+            six.reraise(*self.exc_info)
+        return self.result
+
+
+class WorkerPool(object):
+    """Runs :class:`Call` objects on at most ``max_workers`` threads.
+
+    ``timeout`` bounds the wall clock time of a whole :meth:`run`; calls
+    which have not finished by then are marked with :class:`CallTimeout`.
+    :meth:`cancel` may be called from another thread to stop handing out
+    calls which have not started yet.
+    """
+    def __init__(self, max_workers=None, timeout=None):
+        self.max_workers = get_max_workers(max_workers)
+        self.timeout = timeout
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _work(self, pending, context=None):
+        if context is not None:
+            # URL reversing and translations rely on thread local state set
+            # up for the request thread only, carry it over to the worker.
+            script_prefix, urlconf, language = context
+            urlresolvers.set_script_prefix(script_prefix)
+            urlresolvers.set_urlconf(urlconf)
+            if language:
+                translation.activate(language)
+        while True:
+            try:
+                call = pending.get_nowait()
+            except queue.Empty:
+                return
+            if self.cancelled:
+                call.cancel()
+            else:
+                call.run()
+
+    def run(self, calls):
+        calls = list(calls)
+        pending = queue.Queue()
+        for call in calls:
+            pending.put(call)
+
+        workers = min(self.max_workers, len(calls))
+        if workers <= 1 and self.timeout is None:
+            # Not worth a thread; run in the caller's thread instead.
+            self._work(pending)
+            return calls
+
+        context = (urlresolvers.get_script_prefix(),
+                   urlresolvers.get_urlconf(),
+                   translation.get_language())
+        start = time.time()
+        threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._work,
+                                      args=(pending, context))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            if self.timeout is None:
+                thread.join()
+            else:
+                thread.join(max(0, start + self.timeout - time.time()))
+
+        if any(thread.is_alive() for thread in threads):
+            self.cancel()
+            elapsed = time.time() - start
+            for call in calls:
+                call.expire(elapsed)
+        return calls
+
+
+def call_parallel(calls, max_workers=None, timeout=None):
+    """Runs the given :class:`Call` objects concurrently and returns them."""
+    return WorkerPool(max_workers, timeout).run(calls)
+
+
+def map_parallel(func, items, max_workers=None, timeout=None):
+    """Concurrent ``map()``: returns results in order, re-raising the first
+    exception encountered.
+    """
+    calls = call_parallel([Call(func, (item,)) for item in items],
+                          max_workers=max_workers, timeout=timeout)
+    return [call.get() for call in calls]
+
+
+class FanOut(object):
+    """Runs independent API calls of a view concurrently.
+
+    Every call is registered with the arguments ``exceptions.handle`` would
+    have been given had the call been made inline, so failures are reported
+    exactly as before: each failing call is handled in the request thread,
+    in registration order, and its ``default`` is used as its result.
+
+    Example::
+
+        fan_out = parallel.FanOut(request)
+        fan_out.add('flavors', api.nova.flavor_list, (request,),
+                    default=[], ignore=True)
+        fan_out.add('images', api.glance.image_list_detailed, (request,),
+                    default=([], False, False), ignore=True)
+        results = fan_out.run()
+        flavors = results['flavors']
+
+    ``timings`` maps each call name to its duration in seconds after
+    :meth:`run`.
+    """
+    def __init__(self, request, max_workers=None, timeout=None):
+        self.request = request
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.calls = OrderedDict()
+        self.handling = {}
+        self.timings = OrderedDict()
+
+    def add(self, name, func, args=(), kwargs=None, default=None,
+            message=None, ignore=False, redirect=None):
+        call = Call(func, args, kwargs, name=name)
+        self.calls[name] = call
+        self.handling[name] = {'default': default, 'message': message,
+                               'ignore': ignore, 'redirect': redirect}
+        return call
+
+    def run(self):
+        start = time.time()
+        call_parallel(self.calls.values(), max_workers=self.max_workers,
+                      timeout=self.timeout)
+        total = time.time() - start
+
+        results = OrderedDict()
+        for name, call in self.calls.items():
+            self.timings[name] = call.elapsed
+            if not call.failed:
+                results[name] = call.result
+                continue
+            handling = self.handling[name]
+            try:
+                call.get()
+            except Exception:
+                exceptions.handle(self.request,
+                                  message=handling['message'],
+                                  redirect=handling['redirect'],
+                                  ignore=handling['ignore'])
+            results[name] = handling['default']
+
+        LOG.debug("Fan-out of %d calls took %.3fs (%s)", len(self.calls),
+                  total, ", ".join("%s=%.3fs" % (name, elapsed or 0)
+                                   for name, elapsed in self.timings.items()))
+        return results
@@ -36,6 +36,9 @@ from horizon.utils import html
 
 LOG = logging.getLogger(__name__)
 
+VALIDATE_STEP_START_HEADER = 'HTTP_X_HORIZON_VALIDATE_STEP_START'
+VALIDATE_STEP_END_HEADER = 'HTTP_X_HORIZON_VALIDATE_STEP_END'
+
 
 class WorkflowContext(dict):
     def __init__(self, workflow, *args, **kwargs):
@@ -647,7 +650,14 @@ class Workflow(html.HTMLElement):
         self.context.update(clean_seed)
 
         if request and request.method == "POST":
-            for step in self.steps:
+            # When only a range of steps is being validated, the steps after
+            # it are never rendered or validated, so don't build their
+            # actions (and don't make the API calls that populate them).
+            steps = self.steps
+            step_range = self.get_validate_step_range()
+            if step_range is not None:
+                steps = steps[:step_range[1] + 1]
+            for step in steps:
                 valid = step.action.is_valid()
                 # Be sure to use the CLEANED data if the workflow is valid.
                 if valid:
@@ -656,6 +666,22 @@ class Workflow(html.HTMLElement):
                     data = request.POST
                 self.context = step.contribute(data, self.context)
 
+    def get_validate_step_range(self):
+        """Returns the ``(start, end)`` indexes of the steps to validate.
+
+        They come from the ``X-Horizon-Validate-Step-Start`` and
+        ``X-Horizon-Validate-Step-End`` headers, which the client sends to
+        validate a wizard's steps one at a time. Returns ``None`` if they
+        aren't present, or aren't valid integers.
+        """
+        if self.request is None:
+            return None
+        try:
+            return (int(self.request.META.get(VALIDATE_STEP_START_HEADER, '')),
+                    int(self.request.META.get(VALIDATE_STEP_END_HEADER, '')))
+        except ValueError:
+            return None
+
     @property
     def steps(self):
         if getattr(self, "_ordered_steps", None) is None:
@@ -166,24 +166,14 @@ class WorkflowView(hz_views.ModalBackdropMixin, generic.TemplateView):
         """Handler for HTTP POST requests."""
         context = self.get_context_data(**kwargs)
         workflow = context[self.context_object_name]
-        try:
-            # Check for the VALIDATE_STEP* headers, if they are present
-            # and valid integers, return validation results as JSON,
-            # otherwise proceed normally.
-            validate_step_start = int(self.request.META.get(
-                'HTTP_X_HORIZON_VALIDATE_STEP_START', ''))
-            validate_step_end = int(self.request.META.get(
-                'HTTP_X_HORIZON_VALIDATE_STEP_END', ''))
-        except ValueError:
-            # No VALIDATE_STEP* headers, or invalid values. Just proceed
-            # with normal workflow handling for POSTs.
-            pass
-        else:
+        # Check for the VALIDATE_STEP* headers, if they are present
+        # and valid integers, return validation results as JSON,
+        # otherwise proceed normally.
+        step_range = workflow.get_validate_step_range()
+        if step_range is not None:
             # There are valid VALIDATE_STEP* headers, so only do validation
             # for the specified steps and return results.
-            data = self.validate_steps(request, workflow,
-                                       validate_step_start,
-                                       validate_step_end)
+            data = self.validate_steps(request, workflow, *step_range)
             return http.HttpResponse(json.dumps(data),
                                      content_type="application/json")
         if not workflow.is_valid():
@@ -16,12 +16,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from collections import OrderedDict
 from collections import Sequence  # noqa
+import functools
 import logging
+import threading
 
 from django.conf import settings
+from django.utils import timezone
 
 from horizon import exceptions
+from horizon.utils import memoized
 
 import six
 
@@ -340,6 +345,124 @@ def is_service_enabled(request, service_type):
     return False
 
 
+class ClientPool(object):
+    """Thread-safe registry of API clients shared between requests.
+
+    Clients are stored under a key identifying the service, its endpoint and
+    the token they authenticate with, so consecutive requests made with the
+    same token reuse the client, and with it the HTTP connections its
+    session keeps alive. Clients are dropped once their token expires and
+    the least recently used ones are evicted beyond ``API_CLIENT_POOL_SIZE``
+    clients.
+    """
+    def __init__(self):
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge_expired(self, now):
+        expired = [key for key, (client, expires) in self._clients.items()
+                   if expires is not None and expires <= now]
+        for key in expired:
+            del self._clients[key]
+
+    def get(self, key, expires, factory, size):
+        now = timezone.now()
+        with self._lock:
+            try:
+                client, client_expires = self._clients.pop(key)
+            except KeyError:
+                pass
+            else:
+                if client_expires is None or client_expires > now:
+                    self._clients[key] = (client, client_expires)
+                    return client
+
+        # Build the client outside of the lock, it may take a while.
+        client = factory()
+        with self._lock:
+            self._purge_expired(now)
+            self._clients[key] = (client, expires)
+            while len(self._clients) > size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self, token_id=None):
+        """Drops all the clients, or only those using the given token."""
+        with self._lock:
+            if token_id is None:
+                self._clients.clear()
+                return
+            for key in [key for key in self._clients if key[2] == token_id]:
+                del self._clients[key]
+
+
+client_pool = ClientPool()
+
+
+def pooled_client(service_type):
+    """Reuses the clients built by the decorated function across requests.
+
+    The decorated function must take the request as its first argument and
+    build a client for ``service_type`` authenticated with the request's
+    token. Clients are kept in :data:`client_pool`; set
+    ``API_CLIENT_POOL_SIZE`` to 0 to build a new client every time.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(request, *args, **kwargs):
+            size = getattr(settings, 'API_CLIENT_POOL_SIZE', 100)
+            if not size:
+                return func(request, *args, **kwargs)
+            try:
+                endpoint = url_for(request, service_type)
+            except exceptions.ServiceCatalogException:
+                # Let the client report the missing endpoint itself.
+                endpoint = None
+            token = request.user.token
+            key = ('%s.%s' % (func.__module__, func.__name__), endpoint,
+                   token.id, request.user.tenant_id, args,
+                   tuple(sorted(kwargs.items())))
+            return client_pool.get(key, getattr(token, 'expires', None),
+                                   lambda: func(request, *args, **kwargs),
+                                   size)
+        return wrapped
+    return decorator
+
+
+def memoized_for_endpoint(service_type, per_project=False, per_user=False,
+                          per_roles=False, dumps=None, loads=None):
+    """Caches an API call in the shared cache across requests.
+
+    The decorated function must take the request as its first argument.
+    Values are keyed on the endpoint of ``service_type`` the request would
+    use, or on the endpoint returned by ``service_type`` when it is a
+    function taking the request, and the call arguments; ``per_project``
+    adds the project and domain the token is scoped to, for calls whose
+    result depends on them, and ``per_user`` adds the user, for resources
+    owned by users such as key pairs. ``per_roles`` adds the roles of the
+    token, for calls whose result depends on the policy the backend applies
+    to the caller, such as listings which include private resources for
+    admins only. See :func:`horizon.utils.memoized.memoized_in_cache` for
+    the other options.
+    """
+    def key(request, *args, **kwargs):
+        scope = None
+        if per_project:
+            scope = (request.user.project_id,
+                     getattr(request.user, 'domain_id', None))
+        if per_user:
+            scope = (scope, request.user.id)
+        if per_roles:
+            scope = (scope, sorted(role['name']
+                                   for role in request.user.roles))
+        if callable(service_type):
+            endpoint = service_type(request)
+        else:
+            endpoint = url_for(request, service_type)
+        return (endpoint, scope, args, sorted(kwargs.items()))
+    return memoized.memoized_in_cache(key, dumps=dumps, loads=loads)
+
+
 def _get_endpoint_region(endpoint):
     """Common function for getting the region from endpoint.
 
@@ -12,7 +12,6 @@
 
 from collections import OrderedDict
 import logging
-import threading
 
 from ceilometerclient import client as ceilometer_client
 from django.conf import settings
@@ -20,6 +19,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import keystone
@@ -277,10 +277,15 @@ def ceilometerclient(request):
     endpoint = base.url_for(request, 'metering')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
+    kwargs = {}
+    timeout = getattr(settings, 'CEILOMETER_API_TIMEOUT', None)
+    if timeout:
+        kwargs['timeout'] = timeout
     return ceilometer_client.Client('2', endpoint,
                                     token=(lambda: request.user.token.id),
                                     insecure=insecure,
-                                    cacert=cacert)
+                                    cacert=cacert,
+                                    **kwargs)
 
 
 def resource_list(request, query=None, ceilometer_usage_object=None):
@@ -309,16 +314,24 @@ def statistic_list(request, meter_name, query=None, period=None):
     return [Statistic(s) for s in statistics]
 
 
-class ThreadedUpdateResourceWithStatistics(threading.Thread):
-    """Multithread wrapper for update_with_statistics method of
+class ThreadedUpdateResourceWithStatistics(object):
+    """Bounded thread pool wrapper for update_with_statistics method of
     resource_usage.
 
-    A join logic is placed in process_list class method. All resources
-    will have its statistics attribute filled in separate threads.
+    All resources will have their statistics attribute filled by
+    process_list, using at most ``CEILOMETER_MAX_WORKERS`` threads (falling
+    back to ``HORIZON_PARALLEL_MAX_WORKERS``). Each worker task updates one
+    Resource with all the requested meters.
 
     The resource_usage object is shared between threads. Each thread is
     updating one Resource.
 
+    If ``CEILOMETER_STATISTICS_TIMEOUT`` seconds pass before all resources
+    are updated, or the pool is cancelled from another thread, the pool is
+    flagged as cancelled. Resources which have not been picked up by a
+    worker are left without statistics, and workers which are still running
+    stop querying and leave their resource untouched.
+
     :Parameters:
       - `resource`: Resource or ResourceAggregate object, that will
                     be filled by statistic data.
@@ -343,38 +356,55 @@ class ThreadedUpdateResourceWithStatistics(threading.Thread):
 
     def __init__(self, resource_usage, resource, meter_names=None,
                  period=None, filter_func=None, stats_attr=None,
-                 additional_query=None):
-        super(ThreadedUpdateResourceWithStatistics, self).__init__()
+                 additional_query=None, cancelled=None):
         self.resource_usage = resource_usage
         self.resource = resource
         self.meter_names = meter_names
         self.period = period
         self.stats_attr = stats_attr
         self.additional_query = additional_query
+        self.cancelled = cancelled
 
     def run(self):
         # Run the job
         self.resource_usage.update_with_statistics(
             self.resource,
             meter_names=self.meter_names, period=self.period,
-            stats_attr=self.stats_attr, additional_query=self.additional_query)
+            stats_attr=self.stats_attr, additional_query=self.additional_query,
+            cancelled=self.cancelled)
+
+    @classmethod
+    def get_pool(cls):
+        max_workers = getattr(settings, 'CEILOMETER_MAX_WORKERS', None)
+        timeout = getattr(settings, 'CEILOMETER_STATISTICS_TIMEOUT', None)
+        return parallel.WorkerPool(max_workers=max_workers, timeout=timeout)
 
     @classmethod
     def process_list(cls, resource_usage, resources, meter_names=None,
                      period=None, filter_func=None, stats_attr=None,
-                     additional_query=None):
-        threads = []
+                     additional_query=None, pool=None):
+        if pool is None:
+            pool = cls.get_pool()
 
+        def cancelled():
+            return pool.cancelled
+
+        calls = []
         for resource in resources:
             # add statistics data into resource
-            thread = cls(resource_usage, resource, meter_names=meter_names,
-                         period=period, stats_attr=stats_attr,
-                         additional_query=additional_query)
-            thread.start()
-            threads.append(thread)
+            job = cls(resource_usage, resource, meter_names=meter_names,
+                      period=period, stats_attr=stats_attr,
+                      additional_query=additional_query, cancelled=cancelled)
+            calls.append(parallel.Call(job.run, name=resource.id))
+
+        pool.run(calls)
 
-        for thread in threads:
-            thread.join()
+        # A resource whose statistics could not be obtained is left without
+        # them, the failure must not break the whole report.
+        for call in calls:
+            if call.failed:
+                LOG.warning("Unable to retrieve statistics for resource "
+                            "%s: %s", call.name, call.exc_info[1])
 
 
 class CeilometerUsage(object):
@@ -533,7 +563,8 @@ class CeilometerUsage(object):
                           resource_id=resource_id)
 
     def update_with_statistics(self, resource, meter_names=None, period=None,
-                               stats_attr=None, additional_query=None):
+                               stats_attr=None, additional_query=None,
+                               cancelled=None):
         """Adding statistical data into one Resource or ResourceAggregate.
 
         It adds each statistic of each meter_names into the resource
@@ -555,6 +586,9 @@ class CeilometerUsage(object):
                           object.
           - `additional_query`: Additional query for the statistics.
                                 E.g. timespan, etc.
+          - `cancelled`: Optional callable. Once it returns True no more
+                         statistics are queried and the resource is left
+                         untouched.
         """
 
         if not meter_names:
@@ -569,26 +603,35 @@ class CeilometerUsage(object):
                                  " conditions. See the docs for format.")
             query = query + additional_query
 
-        # TODO(lsmola) thread for each meter will be probably overkill
-        # but I should test lets say thread pool with 100 of threads
-        # and apply it only to this code.
+        # The meters of one resource are queried by the same worker of the
+        # ThreadedUpdateResourceWithStatistics pool, as the statistics API
+        # only accepts a single meter per query.
         # Though I do expect Ceilometer will support bulk requests,
         # so all of this optimization will not be necessary.
+        meters = []
         for meter in meter_names:
+            if cancelled is not None and cancelled():
+                return resource
             statistics = statistic_list(self._request, meter,
                                         query=query, period=period)
             meter = meter.replace(".", "_")
             if statistics:
                 if stats_attr:
                     # I want to load only a specific attribute
-                    resource.set_meter(
-                        meter,
-                        getattr(statistics[0], stats_attr, None))
+                    meters.append(
+                        (meter, getattr(statistics[0], stats_attr, None)))
                 else:
                     # I want a dictionary of all statistics
-                    resource.set_meter(meter, statistics)
+                    meters.append((meter, statistics))
             else:
-                resource.set_meter(meter, None)
+                meters.append((meter, None))
+
+        # The resource is only filled in once all of its meters are known,
+        # so a cancelled run never leaves it half updated.
+        if cancelled is not None and cancelled():
+            return resource
+        for meter, value in meters:
+            resource.set_meter(meter, value)
 
         return resource
 
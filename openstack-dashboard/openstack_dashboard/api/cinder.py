@@ -144,11 +144,11 @@ class VolumePool(base.APIResourceWrapper):
 
 
 @memoized
-def cinderclient(request):
-    api_version = VERSIONS.get_active_version()
-
-    insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
-    cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
+@base.pooled_client('volumev2')
+def _cinder_url(request, api_version=None):
+    """Returns the endpoint the cinder client of the request uses."""
+    if api_version is None:
+        api_version = VERSIONS.get_active_version()
     cinder_url = ""
     try:
         # The cinder client assumes that the v2 endpoint type will be
@@ -162,6 +162,15 @@ def cinderclient(request):
     except exceptions.ServiceCatalogException:
         LOG.debug('no volume service configured.')
         raise
+    return cinder_url
+
+
+def cinderclient(request):
+    api_version = VERSIONS.get_active_version()
+
+    insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
+    cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
+    cinder_url = _cinder_url(request, api_version)
     c = api_version['client'].Client(request.user.username,
                                      request.user.token.id,
                                      project_id=request.user.tenant_id,
@@ -608,7 +617,18 @@ def availability_zone_list(request, detailed=False):
     return cinderclient(request).availability_zones.list(detailed=detailed)
 
 
+def _dump_extensions(extensions):
+    return [extension.to_dict() for extension in extensions]
+
+
+def _load_extensions(data, request):
+    return [cinder_list_extensions.ListExtResource(None, info, loaded=True)
+            for info in data]
+
+
 @memoized
+@base.memoized_for_endpoint(_cinder_url, dumps=_dump_extensions,
+                            loads=_load_extensions)
 def list_extensions(request):
     return cinder_list_extensions.ListExtManager(cinderclient(request))\
         .show_all()
@@ -26,16 +26,20 @@ import os
 
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
 
 
 import glanceclient as glance_client
+from glanceclient import exc as glance_exceptions
+from glanceclient.v1 import images as glance_images
 from six.moves import _thread as thread
 
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 from openstack_dashboard.api import base
 
 
@@ -44,6 +48,7 @@ VERSIONS = base.APIVersionManager("image", preferred_version=2)
 
 
 @memoized
+@base.pooled_client('image')
 def glanceclient(request, version='1'):
     url = base.url_for(request, 'image')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
@@ -52,8 +57,20 @@ def glanceclient(request, version='1'):
                                 insecure=insecure, cacert=cacert)
 
 
+def _image_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def _image_cache_key(request, image_id):
+    return 'horizon:glance_image:%s:%s:%s' % (
+        base.url_for(request, 'image'), request.user.tenant_id, image_id)
+
+
 def image_delete(request, image_id):
-    return glanceclient(request).images.delete(image_id)
+    _image_cache().delete(_image_cache_key(request, image_id))
+    result = glanceclient(request).images.delete(image_id)
+    image_list_filtered.invalidate_all()
+    return result
 
 
 def image_get(request, image_id):
@@ -66,6 +83,60 @@ def image_get(request, image_id):
     return image
 
 
+def image_get_many(request, image_ids):
+    """Returns the images with the given IDs.
+
+    Only the requested images are retrieved, concurrently, which is much
+    cheaper than listing every image when only the few referenced by a page
+    of instances are needed. Images which no longer exist, are not visible
+    to the project or could not be retrieved for any other reason are left
+    out. Images are cached for ``API_CACHE_TIMEOUT`` seconds.
+    """
+    image_ids = list(collections.OrderedDict.fromkeys(
+        image_id for image_id in image_ids if image_id))
+    if not image_ids:
+        return []
+
+    images = {}
+    cache = _image_cache()
+    timeout = getattr(settings, 'API_CACHE_TIMEOUT', 60)
+    if timeout:
+        keys = dict((_image_cache_key(request, image_id), image_id)
+                    for image_id in image_ids)
+        cached = cache.get_many(list(keys))
+        if cached:
+            manager = glanceclient(request).images
+            for key, info in cached.items():
+                image = glance_images.Image(manager, info, loaded=True)
+                if not hasattr(image, 'name'):
+                    image.name = None
+                images[keys[key]] = image
+
+    calls = parallel.call_parallel(
+        [parallel.Call(image_get, (request, image_id), name=image_id)
+         for image_id in image_ids if image_id not in images])
+    fetched = {}
+    for call in calls:
+        try:
+            image = call.get()
+        except glance_exceptions.HTTPNotFound:
+            LOG.debug('Image %s not found.', call.name)
+            continue
+        except Exception:
+            # One image the project may not see (e.g. a private image of
+            # another project on an admin page) must not cost the others.
+            LOG.warning('Unable to retrieve image %s: %s', call.name,
+                        call.exc_info[1])
+            continue
+        images[call.name] = image
+        if timeout:
+            fetched[_image_cache_key(request, call.name)] = image.to_dict()
+    if fetched:
+        cache.set_many(fetched, timeout)
+
+    return [images[image_id] for image_id in image_ids if image_id in images]
+
+
 def image_list_detailed(request, marker=None, sort_dir='desc',
                         sort_key='created_at', filters=None, paginate=False):
     limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
@@ -107,10 +178,42 @@ def image_list_detailed(request, marker=None, sort_dir='desc',
     return (images, has_more_data, has_prev_data)
 
 
+def _dump_images(images):
+    return [image.to_dict() for image in images]
+
+
+def _load_images(data, request, *args, **kwargs):
+    manager = glanceclient(request).images
+    images = []
+    for info in data:
+        image = glance_images.Image(manager, info, loaded=True)
+        if not hasattr(image, 'name'):
+            image.name = None
+        images.append(image)
+    return images
+
+
+@base.memoized_for_endpoint('image', per_project=True, dumps=_dump_images,
+                            loads=_load_images)
+def image_list_filtered(request, **filters):
+    """Returns all the images matching ``filters``, without pagination.
+
+    Meant for choice lists such as the image selection of the Launch
+    Instance form, which is opened over and over again: the result is
+    cached for ``API_CACHE_TIMEOUT`` seconds per project, images created,
+    updated or deleted through this module invalidate it.
+    """
+    images, _more, _prev = image_list_detailed(request, filters=filters)
+    return images
+
+
 def image_update(request, image_id, **kwargs):
     image_data = kwargs.get('data', None)
+    _image_cache().delete(_image_cache_key(request, image_id))
     try:
-        return glanceclient(request).images.update(image_id, **kwargs)
+        image = glanceclient(request).images.update(image_id, **kwargs)
+        image_list_filtered.invalidate_all()
+        return image
     finally:
         if image_data:
             try:
@@ -144,6 +247,7 @@ def image_create(request, **kwargs):
     data = kwargs.pop('data', None)
 
     image = glanceclient(request).images.create(**kwargs)
+    image_list_filtered.invalidate_all()
 
     if data:
         if isinstance(data, TemporaryUploadedFile):
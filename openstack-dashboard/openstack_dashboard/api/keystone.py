@@ -21,6 +21,7 @@ import collections
 import logging
 
 from django.conf import settings
+from django.core.cache import caches
 from django.utils.translation import ugettext_lazy as _
 import six
 import six.moves.urllib.parse as urlparse
@@ -33,6 +34,7 @@ from openstack_auth import utils as auth_utils
 from horizon import exceptions
 from horizon import messages
 from horizon.utils import functions as utils
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 from openstack_dashboard import policy
@@ -256,9 +258,67 @@ def tenant_get(request, project, admin=True):
 
 def tenant_delete(request, project):
     manager = VERSIONS.get_project_manager(request, admin=True)
+    _tenant_name_cache().delete(_tenant_name_cache_key(request, project))
     return manager.delete(project)
 
 
+def _tenant_name_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def _tenant_name_cache_key(request, project_id):
+    return 'horizon:project_name:%s:%s' % (
+        base.url_for(request, 'identity'), project_id)
+
+
+def tenant_names(request, project_ids):
+    """Returns a dict mapping the given project IDs to the project names.
+
+    Meant for tables which show the project of each row, such as the admin
+    instances, so that only the projects of the rows on the page are looked
+    up, rather than listing every project of the cloud on each page load.
+    Names are cached for ``API_CACHE_TIMEOUT`` seconds and shared by every
+    view; the projects missing from the cache are fetched concurrently.
+    Projects which no longer exist or cannot be retrieved are left out, so
+    that one failing project does not hide the names of all the others.
+    """
+    project_ids = set(project_id for project_id in project_ids
+                      if project_id)
+    if not project_ids:
+        return {}
+
+    names = {}
+    cache = _tenant_name_cache()
+    timeout = getattr(settings, 'API_CACHE_TIMEOUT', 60)
+    if timeout:
+        keys = dict((_tenant_name_cache_key(request, project_id), project_id)
+                    for project_id in project_ids)
+        for key, name in cache.get_many(list(keys)).items():
+            names[keys[key]] = name
+
+    calls = parallel.call_parallel(
+        [parallel.Call(tenant_get, (request, project_id),
+                       {'admin': True}, name=project_id)
+         for project_id in project_ids if project_id not in names])
+    fetched = {}
+    for call in calls:
+        try:
+            project = call.get()
+        except keystone_exceptions.NotFound:
+            LOG.debug('Project %s not found.', call.name)
+            continue
+        except Exception:
+            LOG.warning('Unable to retrieve project %s: %s',
+                        call.name, call.exc_info[1])
+            continue
+        names[call.name] = project.name
+        if timeout:
+            fetched[_tenant_name_cache_key(request, call.name)] = project.name
+    if fetched:
+        cache.set_many(fetched, timeout)
+    return names
+
+
 def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
                 admin=True, filters=None):
     manager = VERSIONS.get_project_manager(request, admin=admin)
@@ -294,6 +354,7 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
 def tenant_update(request, project, name=None, description=None,
                   enabled=None, domain=None, **kwargs):
     manager = VERSIONS.get_project_manager(request, admin=True)
+    _tenant_name_cache().delete(_tenant_name_cache_key(request, project))
     try:
         if VERSIONS.active < 3:
             return manager.update(project, name, description, enabled,
@@ -596,10 +657,15 @@ def get_project_users_roles(request, project):
     if VERSIONS.active < 3:
         project_users = user_list(request, project=project)
 
-        for user in project_users:
-            roles = roles_for_user(request, user.id, project)
-            roles_ids = [role.id for role in roles]
-            users_roles[user.id].extend(roles_ids)
+        # There is no role assignment API in Keystone v2, so the roles of
+        # every member are asked for, concurrently.
+        calls = parallel.call_parallel(
+            [parallel.Call(roles_for_user, (request, user.id, project),
+                           name=user.id)
+             for user in project_users])
+        for call in calls:
+            roles_ids = [role.id for role in call.get()]
+            users_roles[call.name].extend(roles_ids)
     else:
         project_role_assignments = role_assignments_list(request,
                                                          project=project)
@@ -634,6 +700,71 @@ def remove_tenant_user_role(request, project=None, user=None, role=None,
                               group=group, domain=domain)
 
 
+def diff_role_assignments(current, wanted):
+    """Returns the role changes turning ``current`` into ``wanted``.
+
+    Both map user or group IDs to the IDs of the roles they hold, as
+    returned by :func:`get_project_users_roles`. Returns a ``(grants,
+    revokes)`` tuple of sorted lists of ``(actor_id, role_id)`` pairs.
+    """
+    grants = []
+    revokes = []
+    for actor_id in set(current) | set(wanted):
+        current_roles = set(current.get(actor_id, ()))
+        wanted_roles = set(wanted.get(actor_id, ()))
+        grants.extend((actor_id, role_id)
+                      for role_id in wanted_roles - current_roles)
+        revokes.extend((actor_id, role_id)
+                       for role_id in current_roles - wanted_roles)
+    return sorted(grants), sorted(revokes)
+
+
+def apply_project_role_changes(request, project, grants=(), revokes=(),
+                               group=False):
+    """Grants and revokes roles of users, or groups, on a project.
+
+    ``grants`` and ``revokes`` are ``(actor_id, role_id)`` pairs, as
+    returned by :func:`diff_role_assignments`. The changes are applied
+    concurrently and every one of them is attempted, even if some fail.
+    Returns the :class:`horizon.utils.parallel.Call` objects of the failed
+    changes, named after the user or group ID, in the order given.
+    """
+    if group:
+        add, remove, actor = add_group_role, remove_group_role, 'group'
+    else:
+        add, remove, actor = (add_tenant_user_role, remove_tenant_user_role,
+                              'user')
+    return _apply_role_changes(request, {'project': project}, add, remove,
+                               actor, grants, revokes)
+
+
+def apply_domain_role_changes(request, domain, grants=(), revokes=(),
+                              group=False):
+    """Grants and revokes roles of users, or groups, on a domain.
+
+    The domain counterpart of :func:`apply_project_role_changes`.
+    """
+    if group:
+        add, remove, actor = add_group_role, remove_group_role, 'group'
+    else:
+        add, remove, actor = (add_domain_user_role, remove_domain_user_role,
+                              'user')
+    return _apply_role_changes(request, {'domain': domain}, add, remove,
+                               actor, grants, revokes)
+
+
+def _apply_role_changes(request, target, add, remove, actor, grants,
+                        revokes):
+    calls = []
+    for func, changes in ((add, grants), (remove, revokes)):
+        for actor_id, role_id in changes:
+            kwargs = dict(target, role=role_id)
+            kwargs[actor] = actor_id
+            calls.append(parallel.Call(func, (request,), kwargs,
+                                       name=actor_id))
+    return [call for call in parallel.call_parallel(calls) if call.failed]
+
+
 def remove_tenant_user(request, project=None, user=None, domain=None):
     """Removes all roles from a user on a tenant, removing them from it."""
     client = keystoneclient(request, admin=True)
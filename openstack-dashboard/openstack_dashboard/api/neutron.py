@@ -550,6 +550,7 @@ def get_ipver_str(ip_version):
 
 
 @memoized
+@base.pooled_client('network')
 def neutronclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -651,6 +652,19 @@ def network_list_for_tenant(request, tenant_id, **params):
     return networks
 
 
+@base.memoized_for_endpoint('network', per_project=True)
+def network_list_for_tenant_cached(request, tenant_id, **params):
+    """Returns :func:`network_list_for_tenant`, cached for the choices of
+    forms.
+
+    It is cached for ``API_CACHE_TIMEOUT`` seconds, networks and subnets
+    created, updated or deleted through this module invalidate it. Views
+    which show the networks themselves, and their status, use
+    :func:`network_list_for_tenant` instead.
+    """
+    return network_list_for_tenant(request, tenant_id, **params)
+
+
 def network_get(request, network_id, expand_subnet=True, **params):
     LOG.debug("network_get(): netid=%s, params=%s" % (network_id, params))
     network = neutronclient(request).show_network(network_id,
@@ -681,6 +695,7 @@ def network_create(request, **kwargs):
         kwargs['tenant_id'] = request.user.project_id
     body = {'network': kwargs}
     network = neutronclient(request).create_network(body=body).get('network')
+    network_list_for_tenant_cached.invalidate_all()
     return Network(network)
 
 
@@ -689,12 +704,14 @@ def network_update(request, network_id, **kwargs):
     body = {'network': kwargs}
     network = neutronclient(request).update_network(network_id,
                                                     body=body).get('network')
+    network_list_for_tenant_cached.invalidate_all()
     return Network(network)
 
 
 def network_delete(request, network_id):
     LOG.debug("network_delete(): netid=%s" % network_id)
     neutronclient(request).delete_network(network_id)
+    network_list_for_tenant_cached.invalidate_all()
 
 
 def subnet_list(request, **params):
@@ -735,6 +752,7 @@ def subnet_create(request, network_id, **kwargs):
         kwargs['tenant_id'] = request.user.project_id
     body['subnet'].update(kwargs)
     subnet = neutronclient(request).create_subnet(body=body).get('subnet')
+    network_list_for_tenant_cached.invalidate_all()
     return Subnet(subnet)
 
 
@@ -743,12 +761,14 @@ def subnet_update(request, subnet_id, **kwargs):
     body = {'subnet': kwargs}
     subnet = neutronclient(request).update_subnet(subnet_id,
                                                   body=body).get('subnet')
+    network_list_for_tenant_cached.invalidate_all()
     return Subnet(subnet)
 
 
 def subnet_delete(request, subnet_id):
     LOG.debug("subnet_delete(): subnetid=%s" % subnet_id)
     neutronclient(request).delete_subnet(subnet_id)
+    network_list_for_tenant_cached.invalidate_all()
 
 
 def subnetpool_list(request, **params):
@@ -1151,6 +1171,7 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
 
 
 @memoized
+@base.memoized_for_endpoint('network')
 def list_extensions(request):
     extensions_list = neutronclient(request).list_extensions()
     if 'extensions' in extensions_list:
@@ -29,8 +29,11 @@ import six
 
 from novaclient import client as nova_client
 from novaclient import exceptions as nova_exceptions
+from novaclient.v2 import availability_zones as nova_availability_zones
 from novaclient.v2.contrib import instance_action as nova_instance_action
 from novaclient.v2.contrib import list_extensions as nova_list_extensions
+from novaclient.v2 import flavors as nova_flavors
+from novaclient.v2 import keypairs as nova_keypairs
 from novaclient.v2 import security_group_rules as nova_rules
 from novaclient.v2 import security_groups as nova_security_groups
 from novaclient.v2 import servers as nova_servers
@@ -442,6 +445,7 @@ class FloatingIpManager(network_base.FloatingIpManager):
 
 
 @memoized
+@base.pooled_client('compute')
 def novaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -485,11 +489,13 @@ def flavor_create(request, name, memory, vcpu, disk, flavorid='auto',
                                                 swap=swap, is_public=is_public)
     if (metadata):
         flavor_extra_set(request, flavor.id, metadata)
+    flavor_list.invalidate_all()
     return flavor
 
 
 def flavor_delete(request, flavor_id):
     novaclient(request).flavors.delete(flavor_id)
+    flavor_list.invalidate_all()
 
 
 def flavor_get(request, flavor_id, get_extras=False):
@@ -499,7 +505,25 @@ def flavor_get(request, flavor_id, get_extras=False):
     return flavor
 
 
+def _dump_flavors(flavors):
+    return [(flavor.to_dict(), getattr(flavor, 'extras', None))
+            for flavor in flavors]
+
+
+def _load_flavors(data, request, *args, **kwargs):
+    manager = novaclient(request).flavors
+    flavors = []
+    for info, extras in data:
+        flavor = nova_flavors.Flavor(manager, info, loaded=True)
+        if extras is not None:
+            flavor.extras = extras
+        flavors.append(flavor)
+    return flavors
+
+
 @memoized
+@base.memoized_for_endpoint('compute', per_project=True, per_roles=True,
+                            dumps=_dump_flavors, loads=_load_flavors)
 def flavor_list(request, is_public=True, get_extras=False):
     """Get the list of available instance sizes (flavors)."""
     flavors = novaclient(request).flavors.list(is_public=is_public)
@@ -517,14 +541,18 @@ def flavor_access_list(request, flavor=None):
 
 def add_tenant_to_flavor(request, flavor, tenant):
     """Add a tenant to the given flavor access list."""
-    return novaclient(request).flavor_access.add_tenant_access(
+    access = novaclient(request).flavor_access.add_tenant_access(
         flavor=flavor, tenant=tenant)
+    flavor_list.invalidate_all()
+    return access
 
 
 def remove_tenant_from_flavor(request, flavor, tenant):
     """Remove a tenant from the given flavor access list."""
-    return novaclient(request).flavor_access.remove_tenant_access(
+    access = novaclient(request).flavor_access.remove_tenant_access(
         flavor=flavor, tenant=tenant)
+    flavor_list.invalidate_all()
+    return access
 
 
 def flavor_get_extras(request, flavor_id, raw=False, flavor=None):
@@ -541,7 +569,9 @@ def flavor_get_extras(request, flavor_id, raw=False, flavor=None):
 def flavor_extra_delete(request, flavor_id, keys):
     """Unset the flavor extra spec keys."""
     flavor = novaclient(request).flavors.get(flavor_id)
-    return flavor.unset_keys(keys)
+    result = flavor.unset_keys(keys)
+    flavor_list.invalidate_all()
+    return result
 
 
 def flavor_extra_set(request, flavor_id, metadata):
@@ -549,7 +579,9 @@ def flavor_extra_set(request, flavor_id, metadata):
     flavor = novaclient(request).flavors.get(flavor_id)
     if (not metadata):  # not a way to delete keys
         return None
-    return flavor.set_keys(metadata)
+    result = flavor.set_keys(metadata)
+    flavor_list.invalidate_all()
+    return result
 
 
 def snapshot_create(request, instance_id, name):
@@ -557,21 +589,48 @@ def snapshot_create(request, instance_id, name):
 
 
 def keypair_create(request, name):
-    return novaclient(request).keypairs.create(name)
+    keypair = novaclient(request).keypairs.create(name)
+    keypair_list_cached.invalidate(request)
+    return keypair
 
 
 def keypair_import(request, name, public_key):
-    return novaclient(request).keypairs.create(name, public_key)
+    keypair = novaclient(request).keypairs.create(name, public_key)
+    keypair_list_cached.invalidate(request)
+    return keypair
 
 
 def keypair_delete(request, keypair_id):
     novaclient(request).keypairs.delete(keypair_id)
+    keypair_list_cached.invalidate(request)
+
+
+def _dump_resources(resources):
+    return [resource.to_dict() for resource in resources]
+
+
+def _load_keypairs(data, request, *args, **kwargs):
+    manager = novaclient(request).keypairs
+    return [nova_keypairs.Keypair(manager, info, loaded=True)
+            for info in data]
 
 
 def keypair_list(request):
     return novaclient(request).keypairs.list()
 
 
+@base.memoized_for_endpoint('compute', per_user=True,
+                            dumps=_dump_resources, loads=_load_keypairs)
+def keypair_list_cached(request):
+    """Returns :func:`keypair_list`, cached for the choices of forms.
+
+    It is cached for ``API_CACHE_TIMEOUT`` seconds, key pairs created,
+    imported or deleted through this module invalidate it. Views which
+    show the key pairs themselves use :func:`keypair_list` instead.
+    """
+    return keypair_list(request)
+
+
 def keypair_get(request, keypair_id):
     return novaclient(request).keypairs.get(keypair_id)
 
@@ -871,24 +930,49 @@ def tenant_absolute_limits(request, reserved=False):
     return limits_dict
 
 
+def _load_availability_zones(data, request, *args, **kwargs):
+    manager = novaclient(request).availability_zones
+    return [nova_availability_zones.AvailabilityZone(manager, info,
+                                                     loaded=True)
+            for info in data]
+
+
 def availability_zone_list(request, detailed=False):
     return novaclient(request).availability_zones.list(detailed=detailed)
 
 
+@base.memoized_for_endpoint('compute', per_project=True,
+                            dumps=_dump_resources,
+                            loads=_load_availability_zones)
+def availability_zone_list_cached(request):
+    """Returns :func:`availability_zone_list`, cached for the choices of
+    forms.
+
+    It is cached for ``API_CACHE_TIMEOUT`` seconds, host aggregates and
+    services changed through this module invalidate it. Views which show
+    the state of the zones use :func:`availability_zone_list` instead.
+    """
+    return availability_zone_list(request)
+
+
 def service_list(request, binary=None):
     return novaclient(request).services.list(binary=binary)
 
 
 def service_enable(request, host, binary):
-    return novaclient(request).services.enable(host, binary)
+    result = novaclient(request).services.enable(host, binary)
+    availability_zone_list_cached.invalidate_all()
+    return result
 
 
 def service_disable(request, host, binary, reason=None):
     if reason:
-        return novaclient(request).services.disable_log_reason(host,
-                                                               binary, reason)
+        result = novaclient(request).services.disable_log_reason(
+            host, binary, reason)
     else:
-        return novaclient(request).services.disable(host, binary)
+        result = novaclient(request).services.disable(host, binary)
+    availability_zone_list_cached.invalidate_all()
+    return result
 
 
 def aggregate_details_list(request):
@@ -900,11 +984,15 @@ def aggregate_details_list(request):
 
 
 def aggregate_create(request, name, availability_zone=None):
-    return novaclient(request).aggregates.create(name, availability_zone)
+    aggregate = novaclient(request).aggregates.create(name, availability_zone)
+    availability_zone_list_cached.invalidate_all()
+    return aggregate
 
 
 def aggregate_delete(request, aggregate_id):
-    return novaclient(request).aggregates.delete(aggregate_id)
+    result = novaclient(request).aggregates.delete(aggregate_id)
+    availability_zone_list_cached.invalidate_all()
+    return result
 
 
 def aggregate_get(request, aggregate_id):
@@ -912,7 +1000,9 @@ def aggregate_get(request, aggregate_id):
 
 
 def aggregate_update(request, aggregate_id, values):
-    return novaclient(request).aggregates.update(aggregate_id, values)
+    aggregate = novaclient(request).aggregates.update(aggregate_id, values)
+    availability_zone_list_cached.invalidate_all()
+    return aggregate
 
 
 def aggregate_set_metadata(request, aggregate_id, metadata):
@@ -924,11 +1014,16 @@ def host_list(request):
 
 
 def add_host_to_aggregate(request, aggregate_id, host):
-    return novaclient(request).aggregates.add_host(aggregate_id, host)
+    aggregate = novaclient(request).aggregates.add_host(aggregate_id, host)
+    availability_zone_list_cached.invalidate_all()
+    return aggregate
 
 
 def remove_host_from_aggregate(request, aggregate_id, host):
-    return novaclient(request).aggregates.remove_host(aggregate_id, host)
+    aggregate = novaclient(request).aggregates.remove_host(aggregate_id,
+                                                           host)
+    availability_zone_list_cached.invalidate_all()
+    return aggregate
 
 
 def interface_attach(request,
@@ -943,7 +1038,18 @@ def interface_detach(request, server, port_id):
     return novaclient(request).servers.interface_detach(server, port_id)
 
 
+def _dump_extensions(extensions):
+    return [extension.to_dict() for extension in extensions]
+
+
+def _load_extensions(data, request):
+    return [nova_list_extensions.ListExtResource(None, info, loaded=True)
+            for info in data]
+
+
 @memoized
+@base.memoized_for_endpoint('compute', dumps=_dump_extensions,
+                            loads=_load_extensions)
 def list_extensions(request):
     """List all nova extensions, except the ones in the blacklist."""
 
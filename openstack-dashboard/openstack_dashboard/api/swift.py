@@ -16,8 +16,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import logging
+import threading
+import time
 
+from oslo_utils import excutils
+from oslo_utils import strutils
 from oslo_utils import timeutils
 import six.moves.urllib.parse as urlparse
 import swiftclient
@@ -27,6 +32,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 
@@ -106,8 +112,7 @@ def _metadata_to_header(metadata):
     return headers
 
 
-@memoized
-def swift_api(request):
+def _swift_connection(request):
     endpoint = base.url_for(request, 'object-store')
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
@@ -121,6 +126,18 @@ def swift_api(request):
                                          auth_version="2.0")
 
 
+@memoized
+def _thread_swift_api(request, thread_id):
+    return _swift_connection(request)
+
+
+def swift_api(request):
+    # A swiftclient Connection holds a single HTTP connection and is not
+    # thread safe, so it is neither pooled across requests nor shared with
+    # the worker threads of a request: every thread gets its own.
+    return _thread_swift_api(request, threading.current_thread().ident)
+
+
 def swift_container_exists(request, container_name):
     try:
         swift_api(request).head_container(container_name)
@@ -196,19 +213,227 @@ def swift_update_container(request, name, metadata=({})):
     return Container({'name': name})
 
 
-def swift_delete_container(request, name):
-    # It cannot be deleted if it's not empty. The batch remove of objects
-    # be done in swiftclient instead of Horizon.
-    objects, more = swift_get_objects(request, name)
-    if objects:
-        error_msg = _("The container cannot be deleted "
-                      "since it is not empty.")
-        exc = exceptions.Conflict(error_msg)
-        raise exc
+def swift_delete_container(request, name, recursive=False):
+    if recursive:
+        swift_bulk_delete(request, name,
+                          [obj['name'] for obj in
+                           swift_list_all_objects(request, name)])
+    else:
+        # It cannot be deleted if it's not empty.
+        objects, more = swift_get_objects(request, name)
+        if objects:
+            error_msg = _("The container cannot be deleted "
+                          "since it is not empty.")
+            exc = exceptions.Conflict(error_msg)
+            raise exc
     swift_api(request).delete_container(name)
     return True
 
 
+def swift_list_all_objects(request, container_name, prefix=None):
+    """Yields the listing entries of all the objects of the container whose
+    name starts with ``prefix``, including those in pseudo-folders, paging
+    through the listing with markers ``API_RESULT_LIMIT`` objects at a time.
+    """
+    limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+    marker = None
+    while True:
+        headers, objects = swift_api(request).get_container(
+            container_name, prefix=prefix, marker=marker, limit=limit)
+        for obj in objects:
+            yield obj
+        if len(objects) < limit:
+            return
+        marker = objects[-1]['name']
+
+
+@memoized
+def _swift_capabilities(request):
+    try:
+        return swift_api(request).get_capabilities()
+    except Exception:
+        LOG.debug("Unable to retrieve the Swift capabilities.", exc_info=True)
+        return {}
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _map_chunks(func, items):
+    """Calls ``func`` concurrently on one chunk of ``items`` per worker and
+    joins the lists it returns.
+    """
+    workers = parallel.get_max_workers()
+    size = max(1, -(-len(items) // workers))
+    return [result for chunk_results in parallel.map_parallel(
+        func, list(_chunks(items, size)), max_workers=workers)
+        for result in chunk_results]
+
+
+def _may_have_static_large_objects(request):
+    capabilities = _swift_capabilities(request)
+    # Without the capabilities, static large objects can't be ruled out.
+    return not capabilities or 'slo' in capabilities
+
+
+def _is_static_large_object(connection, container_name, object_name):
+    try:
+        headers = connection.head_object(container_name, object_name)
+    except swiftclient.client.ClientException as e:
+        if e.http_status != 404:
+            raise
+        return False
+    return strutils.bool_from_string(headers.get('x-static-large-object'))
+
+
+def _delete_object(connection, container_name, object_name, manifest=False):
+    if manifest:
+        # A plain DELETE of a static large object would leave its segments
+        # behind.
+        connection.delete_object(container_name, object_name,
+                                 query_string='multipart-manifest=delete')
+    else:
+        connection.delete_object(container_name, object_name)
+
+
+def _find_static_large_objects(request, container_name, object_names):
+    """Returns the names of the objects which are static large objects or
+    whose headers can't be retrieved.
+    """
+    connection = _swift_connection(request)
+    manifests = []
+    for object_name in object_names:
+        try:
+            if _is_static_large_object(connection, container_name,
+                                       object_name):
+                manifests.append(object_name)
+        except swiftclient.client.ClientException:
+            manifests.append(object_name)
+    return manifests
+
+
+def _delete_objects(request, container_name, object_names, slo=False):
+    connection = _swift_connection(request)
+    failures = []
+    for object_name in object_names:
+        try:
+            manifest = slo and _is_static_large_object(
+                connection, container_name, object_name)
+            _delete_object(connection, container_name, object_name,
+                           manifest)
+        except swiftclient.client.ClientException as e:
+            if e.http_status != 404:
+                failures.append(object_name)
+    return failures
+
+
+def _bulk_delete_data(container_name, object_names):
+    paths = [urlparse.quote(('/%s/%s' % (container_name, name))
+                            .encode('utf-8')) for name in object_names]
+    return '\n'.join(paths).encode('utf-8') + b'\n'
+
+
+def _bulk_delete_failures(container_name, object_names, body):
+    """Returns the names of the objects which a bulk delete response reports
+    as not deleted.
+    """
+    result = json.loads(body)
+    errors = result.get('Errors') or []
+    if errors:
+        prefix = '/%s/' % container_name
+        return [urlparse.unquote(path)[len(prefix):]
+                for path, status in errors]
+    status = result.get('Response Status', '')
+    done = (result.get('Number Deleted', 0) +
+            result.get('Number Not Found', 0))
+    if not status.startswith('2') or done < len(object_names):
+        # The middleware rejected the whole request, e.g. with
+        # "400 Bad Request", without naming any object.
+        LOG.warning("Swift bulk delete failed: %s %s", status,
+                    result.get('Response Body', ''))
+        return list(object_names)
+    return []
+
+
+def swift_bulk_delete(request, container_name, object_names):
+    """Deletes the given objects of the container.
+
+    The objects are deleted with Swift's bulk delete middleware when the
+    cluster provides it, otherwise concurrently by at most
+    ``HORIZON_PARALLEL_MAX_WORKERS`` threads. Objects which no longer exist
+    are ignored; the names of the objects which could not be deleted are
+    returned.
+
+    The bulk delete middleware leaves the segments of static large objects
+    behind. So when the cluster supports those, the objects are looked up
+    first and the static large objects are deleted one by one, along with
+    their segments.
+    """
+    object_names = list(object_names)
+    if not object_names:
+        return []
+    failures = []
+    slo = _may_have_static_large_objects(request)
+    bulk_delete = _swift_capabilities(request).get('bulk_delete')
+    if bulk_delete and slo:
+        manifests = set(_map_chunks(
+            lambda chunk: _find_static_large_objects(request, container_name,
+                                                     chunk),
+            object_names))
+        failures.extend(_map_chunks(
+            lambda chunk: _delete_objects(request, container_name, chunk,
+                                          slo=True),
+            [name for name in object_names if name in manifests]))
+        # None of the remaining objects is a static large object.
+        object_names = [name for name in object_names
+                        if name not in manifests]
+        slo = False
+    if bulk_delete and object_names:
+        size = bulk_delete.get('max_deletes_per_request', 10000)
+        headers = {'Accept': 'application/json', 'Content-Type': 'text/plain'}
+        for index, chunk in enumerate(_chunks(object_names, size)):
+            data = _bulk_delete_data(container_name, chunk)
+            try:
+                response_headers, body = swift_api(request).post_account(
+                    headers=headers, query_string='bulk-delete', data=data)
+            except TypeError:
+                if index:
+                    raise
+                # Older python-swiftclient releases (e.g. 2.3.x) only accept
+                # post_account(headers, response_dict), so the bulk delete
+                # request can't be made; delete the objects one by one
+                # instead.
+                LOG.debug("Swift bulk delete not supported by swiftclient.",
+                          exc_info=True)
+                break
+            failures.extend(_bulk_delete_failures(container_name, chunk,
+                                                  body))
+        else:
+            return failures
+
+    return failures + _map_chunks(
+        lambda chunk: _delete_objects(request, container_name, chunk, slo),
+        object_names)
+
+
+def swift_delete_folder(request, container_name, folder_name):
+    """Deletes a pseudo-folder and everything in it."""
+    folder_name = folder_name.rstrip(FOLDER_DELIMITER) + FOLDER_DELIMITER
+    object_names = [obj['name'] for obj in
+                    swift_list_all_objects(request, container_name,
+                                           prefix=folder_name)]
+    if folder_name not in object_names:
+        object_names.append(folder_name)
+    failures = swift_bulk_delete(request, container_name, object_names)
+    if failures:
+        raise exceptions.Conflict(
+            _("Unable to delete %(count)d objects of the pseudo folder.")
+            % {'count': len(failures)})
+    return True
+
+
 def swift_get_objects(request, container_name, prefix=None, marker=None,
                       limit=None):
     limit = limit or getattr(settings, 'API_RESULT_LIMIT', 1000)
@@ -275,8 +500,127 @@ def swift_copy_object(request, orig_container_name, orig_object_name,
                                          headers=headers)
 
 
+def _copy_objects(request, orig_container_name, new_container_name,
+                  object_names):
+    connection = _swift_connection(request)
+    for orig_name, new_name in object_names:
+        headers = {"X-Copy-From": FOLDER_DELIMITER.join([orig_container_name,
+                                                         orig_name])}
+        connection.put_object(new_container_name, new_name, None,
+                              headers=headers)
+
+
+def swift_copy_folder(request, orig_container_name, orig_folder_name,
+                      new_container_name, new_folder_name):
+    """Copies a pseudo-folder and everything in it, server side.
+
+    The objects are copied concurrently by at most
+    ``HORIZON_PARALLEL_MAX_WORKERS`` threads.
+    """
+    orig_folder_name = (orig_folder_name.rstrip(FOLDER_DELIMITER) +
+                        FOLDER_DELIMITER)
+    new_folder_name = (new_folder_name.rstrip(FOLDER_DELIMITER) +
+                       FOLDER_DELIMITER)
+    if swift_object_exists(request, new_container_name, new_folder_name):
+        raise exceptions.AlreadyExists(new_folder_name, 'pseudo-folder')
+
+    object_names = [(obj['name'],
+                     new_folder_name + obj['name'][len(orig_folder_name):])
+                    for obj in swift_list_all_objects(
+                        request, orig_container_name,
+                        prefix=orig_folder_name)]
+    workers = parallel.get_max_workers()
+    size = max(1, -(-len(object_names) // workers))
+    parallel.map_parallel(
+        lambda chunk: _copy_objects(request, orig_container_name,
+                                    new_container_name, chunk),
+        list(_chunks(object_names, size)), max_workers=workers)
+    return True
+
+
+def _upload_segment(request, container_name, segment_name, object_file,
+                    offset, length):
+    path = getattr(object_file, 'temporary_file_path', None)
+    if path:
+        # Every segment reads the spooled upload through its own handle,
+        # so the segments can be sent concurrently.
+        with open(path(), 'rb') as segment_file:
+            segment_file.seek(offset)
+            return _swift_connection(request).put_object(
+                container_name, segment_name, segment_file,
+                content_length=length, chunk_size=CHUNK_SIZE)
+    object_file.seek(offset)
+    return _swift_connection(request).put_object(
+        container_name, segment_name, object_file,
+        content_length=length, chunk_size=CHUNK_SIZE)
+
+
+def _delete_segments(request, segment_container, segment_names):
+    for segment_name in segment_names:
+        try:
+            swift_api(request).delete_object(segment_container, segment_name)
+        except swiftclient.client.ClientException:
+            LOG.warning("Unable to delete segment %s of failed upload.",
+                        segment_name)
+
+
+def _upload_segmented_object(request, container_name, object_name,
+                             object_file, headers, segment_size):
+    """Uploads a large file as segments and a static large object manifest.
+
+    The segments are stored in the ``<container>_segments`` container, as
+    the swift command line client does, and uploaded concurrently by at
+    most ``SWIFT_UPLOAD_SEGMENT_CONCURRENCY`` threads.
+    """
+    size = object_file.size
+    segment_container = '%s_segments' % container_name
+    segment_prefix = '%s/slo/%f/%d/%d' % (object_name, time.time(), size,
+                                          segment_size)
+    swift_api(request).put_container(segment_container)
+
+    segments = []
+    for index, offset in enumerate(range(0, size, segment_size)):
+        segments.append(('%s/%08d' % (segment_prefix, index), offset,
+                         min(segment_size, size - offset)))
+    concurrency = getattr(settings, 'SWIFT_UPLOAD_SEGMENT_CONCURRENCY', 4)
+    if not hasattr(object_file, 'temporary_file_path'):
+        # All the segments have to be read through the same file object.
+        concurrency = 1
+    calls = parallel.call_parallel(
+        [parallel.Call(_upload_segment,
+                       (request, segment_container, name, object_file,
+                        offset, length), name=name)
+         for name, offset, length in segments],
+        max_workers=concurrency)
+
+    if any(call.failed for call in calls):
+        _delete_segments(request, segment_container,
+                         [call.name for call in calls if not call.failed])
+        for call in calls:
+            call.get()
+
+    manifest = [{'path': '/%s/%s' % (segment_container, name),
+                 'etag': call.result,
+                 'size_bytes': length}
+                for (name, offset, length), call in zip(segments, calls)]
+    try:
+        return swift_api(request).put_object(
+            container_name, object_name, json.dumps(manifest),
+            query_string='multipart-manifest=put', headers=headers)
+    except Exception:
+        with excutils.save_and_reraise_exception():
+            _delete_segments(request, segment_container,
+                             [name for name, offset, length in segments])
+
+
 def swift_upload_object(request, container_name, object_name,
                         object_file=None):
+    """Uploads an object.
+
+    Files larger than ``SWIFT_UPLOAD_SEGMENT_SIZE`` bytes (1 GiB by default)
+    are uploaded as a static large object, which also lifts the size limit
+    of single Swift objects.
+    """
     if swift_object_exists(request, container_name, object_name):
         raise exceptions.AlreadyExists(object_name, 'object')
     headers = {}
@@ -285,11 +629,18 @@ def swift_upload_object(request, container_name, object_name,
         headers['X-Object-Meta-Orig-Filename'] = object_file.name
         size = object_file.size
 
-    etag = swift_api(request).put_object(container_name,
-                                         object_name,
-                                         object_file,
-                                         content_length=size,
-                                         headers=headers)
+    segment_size = getattr(settings, 'SWIFT_UPLOAD_SEGMENT_SIZE',
+                           1024 * 1024 * 1024)
+    if object_file and segment_size and size > segment_size:
+        etag = _upload_segmented_object(request, container_name,
+                                        object_name, object_file, headers,
+                                        segment_size)
+    else:
+        etag = swift_api(request).put_object(container_name,
+                                             object_name,
+                                             object_file,
+                                             content_length=size,
+                                             headers=headers)
 
     obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
     return StorageObject(obj_info, container_name)
@@ -328,13 +679,39 @@ def swift_delete_object(request, container_name, object_name):
                       "since it is not empty.")
         exc = exceptions.Conflict(error_msg)
         raise exc
-    swift_api(request).delete_object(container_name, object_name)
+    connection = swift_api(request)
+    manifest = (_may_have_static_large_objects(request) and
+                _is_static_large_object(connection, container_name,
+                                        object_name))
+    _delete_object(connection, container_name, object_name, manifest)
     return True
 
 
 def swift_get_object(request, container_name, object_name, with_data=True,
-                     resp_chunk_size=CHUNK_SIZE):
-    if with_data:
+                     resp_chunk_size=CHUNK_SIZE, headers=None):
+    """Returns the object, with its content unless ``with_data`` is False.
+
+    ``headers`` are passed on to Swift, e.g. ``Range`` or ``If-None-Match``.
+    The HTTP status of the response is then available as ``status`` on the
+    returned object; statuses which Swift reports as errors but which are
+    valid answers to such headers (304, 412 and 416) are returned with no
+    data instead of raising.
+    """
+    status = 200
+    if with_data and headers:
+        response = {}
+        try:
+            headers, data = swift_api(request).get_object(
+                container_name, object_name, resp_chunk_size=resp_chunk_size,
+                headers=headers, response_dict=response)
+            status = response.get('status', status)
+        except swiftclient.client.ClientException as e:
+            if e.http_status not in (304, 412, 416):
+                raise
+            status = e.http_status
+            headers = response.get('headers') or {}
+            data = None
+    elif with_data:
         headers, data = swift_api(request).get_object(
             container_name, object_name, resp_chunk_size=resp_chunk_size)
     else:
@@ -354,6 +731,9 @@ def swift_get_object(request, container_name, object_name, with_data=True,
         'content_type': headers.get('content-type'),
         'etag': headers.get('etag'),
         'timestamp': timestamp,
+        'last_modified': headers.get('last-modified'),
+        'content_range': headers.get('content-range'),
+        'status': status,
     }
     return StorageObject(obj_info,
                          container_name,
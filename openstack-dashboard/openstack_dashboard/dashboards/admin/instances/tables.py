@@ -17,6 +17,7 @@ from django.template.defaultfilters import title  # noqa
 from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import ungettext_lazy
 
+from horizon import exceptions
 from horizon import tables
 from horizon.utils import filters
 
@@ -92,6 +93,21 @@ class AdminUpdateRow(project_tables.UpdateRow):
         instance.tenant_name = getattr(tenant, "name", None)
         return instance
 
+    def get_data_many(self, request, instance_ids):
+        instances, removed = super(AdminUpdateRow, self).get_data_many(
+            request, instance_ids)
+        # The projects which fail to load leave the project name empty,
+        # rather than failing the update of the whole batch.
+        try:
+            tenant_names = api.keystone.tenant_names(
+                request, [instance.tenant_id for instance in instances])
+        except Exception:
+            tenant_names = {}
+            exceptions.handle(request, ignore=True)
+        for instance in instances:
+            instance.tenant_name = tenant_names.get(instance.tenant_id)
+        return instances, removed
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     # Change default name of 'filter' to distinguish this one from the
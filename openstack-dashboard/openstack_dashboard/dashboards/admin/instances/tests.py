@@ -13,11 +13,14 @@
 #    under the License.
 
 from collections import OrderedDict
+import json
 import uuid
 
 from django.core.urlresolvers import reverse
 from django import http
+from django.utils.http import urlencode
 
+from keystoneclient import exceptions as keystone_exceptions
 from mox3.mox import IgnoreArg  # noqa
 from mox3.mox import IsA  # noqa
 
@@ -31,7 +34,8 @@ INDEX_URL = reverse('horizon:admin:instances:index')
 class InstanceViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported',),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
+                        api.glance: ('image_get_many',),
                         api.network: ('servers_update_addresses',)})
     def test_index(self):
         servers = self.servers.list()
@@ -41,14 +45,16 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in tenants))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
                              all_tenants=True, search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.flavor_list(IsA(http.HttpRequest)).AndReturn(flavors)
         self.mox.ReplayAll()
 
@@ -59,7 +65,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
                                    'server_list', 'extension_supported',),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
+                        api.glance: ('image_get_many',),
                         api.network: ('servers_update_addresses',)})
     def test_index_flavor_list_exception(self):
         servers = self.servers.list()
@@ -73,14 +80,16 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)). \
             AndRaise(self.exceptions.nova)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in tenants))
         for server in servers:
             api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
                 AndReturn(full_flavors[server.flavor["id"]])
@@ -94,7 +103,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
                                    'server_list', 'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
+                        api.glance: ('image_get_many',),
                         api.network: ('servers_update_addresses',)})
     def test_index_flavor_get_exception(self):
         servers = self.servers.list()
@@ -111,14 +121,16 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)). \
             AndReturn(flavors)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in tenants))
         for server in servers:
             api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
                 AndRaise(self.exceptions.nova)
@@ -146,6 +158,57 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertTemplateUsed(res, 'admin/instances/index.html')
         self.assertEqual(len(res.context['instances_table'].data), 0)
 
+    @test.create_stubs({api.nova: ('flavor_list', 'server_list',
+                                   'extension_supported',),
+                        api.keystone: ('tenant_list', 'tenant_names',),
+                        api.glance: ('image_get_many',),
+                        api.network: ('servers_update_addresses',)})
+    def test_index_project_filter(self):
+        tenant = self.tenants.first()
+        servers = self.servers.list()
+        self.setSessionValues(**{
+            'instances__filter_admin_instances__q_field': 'project',
+            'instances__filter_admin_instances__q': tenant.name})
+        api.keystone.tenant_list(IsA(http.HttpRequest),
+                                 filters={'name': tenant.name}) \
+            .AndReturn([self.tenants.list(), False])
+        search_opts = {'marker': None, 'paginate': True,
+                       'tenant_id': tenant.id}
+        api.nova.server_list(IsA(http.HttpRequest),
+                             all_tenants=True, search_opts=search_opts) \
+            .AndReturn([servers, False])
+        api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
+                                             all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in self.tenants.list()))
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        self.mox.ReplayAll()
+
+        res = self.client.get(INDEX_URL)
+        self.assertTemplateUsed(res, 'admin/instances/index.html')
+        self.assertItemsEqual(res.context['table'].data, servers)
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_index_project_filter_no_match(self):
+        self.setSessionValues(**{
+            'instances__filter_admin_instances__q_field': 'project',
+            'instances__filter_admin_instances__q': 'no_such_project'})
+        api.keystone.tenant_list(IsA(http.HttpRequest),
+                                 filters={'name': 'no_such_project'}) \
+            .AndReturn([[], False])
+        self.mox.ReplayAll()
+
+        res = self.client.get(INDEX_URL)
+        self.assertTemplateUsed(res, 'admin/instances/index.html')
+        self.assertEqual(len(res.context['table'].data), 0)
+
     @test.create_stubs({api.nova: ('server_get', 'flavor_get',
                                    'extension_supported', ),
                         api.keystone: ('tenant_get',)})
@@ -183,20 +246,58 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertContains(res, "Active", 1, 200)
         self.assertContains(res, "Running", 1, 200)
 
+    @test.create_stubs({api.nova: ('server_get', 'flavor_list',
+                                   'extension_supported', ),
+                        api.keystone: ('tenant_get',)})
+    def test_row_update_batch_tenant_not_found(self):
+        # The instances belong to two projects, one of which is gone.
+        servers = self.servers.list()[1:3]
+        tenant = self.tenants.first()
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        for server in servers:
+            api.nova.server_get(IsA(http.HttpRequest), server.id) \
+                .InAnyOrder().AndReturn(server)
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.keystone.tenant_get(IsA(http.HttpRequest), servers[0].tenant_id,
+                                admin=True) \
+            .InAnyOrder().AndReturn(tenant)
+        api.keystone.tenant_get(IsA(http.HttpRequest), servers[1].tenant_id,
+                                admin=True) \
+            .InAnyOrder().AndRaise(keystone_exceptions.NotFound())
+        self.mox.ReplayAll()
+
+        params = [('action', 'row_update_batch'), ('table', 'instances')]
+        params += [('obj_id', server.id) for server in servers]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(200, res.status_code)
+        content = json.loads(res.content.decode('utf-8'))
+        self.assertEqual([], content['removed'])
+        self.assertItemsEqual([server.id for server in servers],
+                              content['rows'])
+        self.assertIn(tenant.name, content['rows'][servers[0].id])
+
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
+                        api.glance: ('image_get_many',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_before_migrate(self):
         servers = self.servers.list()
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in self.tenants.list()))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
                              all_tenants=True, search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
@@ -212,7 +313,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
+                        api.glance: ('image_get_many',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_after_migrate(self):
         servers = self.servers.list()
@@ -220,8 +322,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
         server1.status = "VERIFY_RESIZE"
         server2 = servers[2]
         server2.status = "VERIFY_RESIZE"
-        api.keystone.tenant_list(IsA(http.HttpRequest)) \
-            .AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(dict((t.id, t.name) for t in self.tenants.list()))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
@@ -232,6 +334,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.flavor_list(IsA(http.HttpRequest)).\
             AndReturn(self.flavors.list())
         self.mox.ReplayAll()
@@ -75,18 +75,18 @@ class AdminIndexView(tables.DataTableView):
         marker = self.request.GET.get(
             project_tables.AdminInstancesTable._meta.pagination_param, None)
         search_opts = self.get_filters({'marker': marker, 'paginate': True})
-        # Gather our tenants to correlate against IDs
-        try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
-        except Exception:
-            tenants = []
-            msg = _('Unable to retrieve instance project information.')
-            exceptions.handle(self.request, msg)
-
         if 'project' in search_opts:
+            project_name = search_opts.pop('project')
+            # Keystone v3 filters the projects by name, v2 lists them all.
+            try:
+                tenants, has_more = api.keystone.tenant_list(
+                    self.request, filters={'name': project_name})
+            except Exception:
+                tenants = []
+                msg = _('Unable to retrieve instance project information.')
+                exceptions.handle(self.request, msg)
             ten_filter_ids = [t.id for t in tenants
-                              if t.name == search_opts['project']]
-            del search_opts['project']
+                              if t.name == project_name]
             if len(ten_filter_ids) > 0:
                 search_opts['tenant_id'] = ten_filter_ids[0]
             else:
@@ -119,10 +119,33 @@ class AdminIndexView(tables.DataTableView):
                 # If fails to retrieve flavor list, creates an empty list.
                 flavors = []
 
+            # Gather the names of the projects of this page of instances
+            # only, rather than listing every project.
+            try:
+                tenant_names = api.keystone.tenant_names(
+                    self.request, [inst.tenant_id for inst in instances])
+            except Exception:
+                tenant_names = {}
+                msg = _('Unable to retrieve instance project information.')
+                exceptions.handle(self.request, msg)
+
+            # Gather the images of this page of instances, so the image
+            # names don't have to be looked up one instance at a time.
+            try:
+                images = api.glance.image_get_many(
+                    self.request, views.get_image_ids(instances))
+            except Exception:
+                images = []
+                exceptions.handle(self.request, ignore=True)
+
             full_flavors = OrderedDict([(f.id, f) for f in flavors])
-            tenant_dict = OrderedDict([(t.id, t) for t in tenants])
-            # Loop through instances to get flavor and tenant info.
+            image_map = OrderedDict([(str(image.id), image)
+                                     for image in images])
+            # Loop through instances to get flavor, image and tenant info.
             for inst in instances:
+                if (isinstance(getattr(inst, 'image', None), dict) and
+                        inst.image.get('id') in image_map):
+                    inst.image = image_map[inst.image['id']]
                 flavor_id = inst.flavor["id"]
                 try:
                     if flavor_id in full_flavors:
@@ -135,8 +158,7 @@ class AdminIndexView(tables.DataTableView):
                 except Exception:
                     msg = _('Unable to retrieve instance size information.')
                     exceptions.handle(self.request, msg)
-                tenant = tenant_dict.get(inst.tenant_id, None)
-                inst.tenant_name = getattr(tenant, "name", None)
+                inst.tenant_name = tenant_names.get(inst.tenant_id)
         return instances
 
     def get_filters(self, filters):
@@ -10,21 +10,25 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import json
+import zlib
 
 from django.core.urlresolvers import reverse
 from django import http
 
+import mock
 from mox3.mox import IsA  # noqa
 import six
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.test.test_data import utils as test_utils
+from openstack_dashboard.utils import metering as metering_utils
 
 
 INDEX_URL = reverse('horizon:admin:metering:index')
 CREATE_URL = reverse('horizon:admin:metering:create')
 SAMPLES_URL = reverse('horizon:admin:metering:samples')
+CSV_URL = reverse('horizon:admin:metering:csvreport')
 
 
 class MeteringViewTests(test.BaseAdminViewTests):
@@ -55,6 +59,32 @@ class MeteringViewTests(test.BaseAdminViewTests):
         self.assertFormError(res, "form", "date_from",
                              ['Must specify start of period'])
 
+    def _get_csv_report(self, **extra):
+        rows = [{'project': 'test_tenant', 'meter': 'cpu',
+                 'description': 'CPU time used', 'service': 'Nova',
+                 'time': '2016-10-17T00:00:00', 'value': 42.0,
+                 'unit': 'ns'}]
+        with mock.patch.object(metering_utils.UsageReport, 'rows',
+                               return_value=iter(rows)):
+            res = self.client.get(CSV_URL + '?date_options=7', **extra)
+        self.assertEqual(200, res.status_code)
+        self.assertTrue(res.streaming)
+        return res, b''.join(res.streaming_content)
+
+    def test_csv_report(self):
+        res, content = self._get_csv_report()
+        content = content.decode('utf-8')
+        self.assertIn('Project Name,Meter,Description,Service,Time,'
+                      'Value (Avg),Unit\r\n', content)
+        self.assertIn('test_tenant,cpu,CPU time used,Nova,'
+                      '2016-10-17T00:00:00,42.0,ns\r\n', content)
+
+    def test_csv_report_gzip(self):
+        res, content = self._get_csv_report(HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual('gzip', res['Content-Encoding'])
+        content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        self.assertIn(b'test_tenant,cpu,CPU time used', content)
+
 
 class MeteringLineChartTabTests(test.BaseAdminViewTests):
     def setUp(self):
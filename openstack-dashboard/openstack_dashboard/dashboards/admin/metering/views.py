@@ -23,8 +23,6 @@ from horizon import forms
 from horizon import tabs
 from horizon.utils import csvbase
 
-from openstack_dashboard.api import ceilometer
-
 from openstack_dashboard.dashboards.admin.metering import forms as \
     metering_forms
 from openstack_dashboard.dashboards.admin.metering import tabs as \
@@ -92,7 +90,12 @@ class CsvReportView(django.views.generic.View):
     def get(self, request, **response_kwargs):
         render_class = ReportCsvRenderer
         response_kwargs.setdefault("filename", "usage.csv")
-        context = {'usage': load_report_data(request)}
+        report = metering_utils.UsageReport(
+            request,
+            request.GET.get('date_options', 7),
+            request.GET.get('date_from'),
+            request.GET.get('date_to'))
+        context = {'usage': report.rows()}
         resp = render_class(request=request,
                             template=None,
                             context=context,
@@ -101,74 +104,19 @@ class CsvReportView(django.views.generic.View):
         return resp
 
 
-class ReportCsvRenderer(csvbase.BaseCsvResponse):
+class ReportCsvRenderer(csvbase.BaseCsvStreamingResponse):
+
+    gzip = True
 
     columns = [_("Project Name"), _("Meter"), _("Description"),
                _("Service"), _("Time"), _("Value (Avg)"), _("Unit")]
 
     def get_row_data(self):
-
-        for p in self.context['usage'].values():
-            for u in p:
-                yield (u["project"],
-                       u["meter"],
-                       u["description"],
-                       u["service"],
-                       u["time"],
-                       u["value"],
-                       u["unit"])
-
-
-def load_report_data(request):
-    meters = ceilometer.Meters(request)
-    services = {
-        _('Nova'): meters.list_nova(),
-        _('Neutron'): meters.list_neutron(),
-        _('Glance'): meters.list_glance(),
-        _('Cinder'): meters.list_cinder(),
-        _('Swift_meters'): meters.list_swift(),
-        _('Kwapi'): meters.list_kwapi(),
-        _('IPMI'): meters.list_ipmi(),
-    }
-    project_rows = {}
-    date_options = request.GET.get('date_options', 7)
-    date_from = request.GET.get('date_from')
-    date_to = request.GET.get('date_to')
-    try:
-        date_from, date_to = metering_utils.calc_date_args(date_from,
-                                                           date_to,
-                                                           date_options)
-    except Exception:
-        exceptions.handle(request, _('Dates cannot be recognized.'))
-    try:
-        project_aggregates = metering_utils.ProjectAggregatesQuery(request,
-                                                                   date_from,
-                                                                   date_to,
-                                                                   3600 * 24)
-    except Exception:
-        exceptions.handle(request,
-                          _('Unable to retrieve project list.'))
-    for meter in meters._cached_meters.values():
-        service = None
-        for name, m_list in services.items():
-            if meter in m_list:
-                service = name
-                break
-        res, unit = project_aggregates.query(meter.name)
-        for r in res:
-            values = r.get_meter(meter.name.replace(".", "_"))
-            if values:
-                for value in values:
-                    row = {"name": 'none',
-                           "project": r.id,
-                           "meter": meter.name,
-                           "description": meter.description,
-                           "service": service,
-                           "time": value._apiresource.period_end,
-                           "value": value._apiresource.avg,
-                           "unit": meter.unit}
-                    if r.id not in project_rows:
-                        project_rows[r.id] = [row]
-                    else:
-                        project_rows[r.id].append(row)
-    return project_rows
+        for u in self.context['usage']:
+            yield (u["project"],
+                   u["meter"],
+                   u["description"],
+                   u["service"],
+                   u["time"],
+                   u["value"],
+                   u["unit"])
@@ -28,7 +28,9 @@ from openstack_dashboard import api
 from openstack_dashboard import usage
 
 
-class GlobalUsageCsvRenderer(csvbase.BaseCsvResponse):
+class GlobalUsageCsvRenderer(csvbase.BaseCsvStreamingResponse):
+
+    gzip = True
 
     columns = [_("Project Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)")]
@@ -365,42 +365,42 @@ class UpdateDomainWorkflowTests(test.BaseAdminViewTests):
         # admin user - try to remove all roles on current domain, warning
         api.keystone.roles_for_user(IsA(http.HttpRequest), '1',
                                     domain=domain.id) \
-            .AndReturn(roles)
+            .InAnyOrder().AndReturn(roles)
 
         # member user 1 - has role 1, will remove it
         api.keystone.roles_for_user(IsA(http.HttpRequest), '2',
                                     domain=domain.id) \
-            .AndReturn((roles[0],))
+            .InAnyOrder().AndReturn((roles[0],))
         # remove role 1
         api.keystone.remove_domain_user_role(IsA(http.HttpRequest),
                                              domain=domain.id,
                                              user='2',
-                                             role='1')
+                                             role='1').InAnyOrder()
         # add role 2
         api.keystone.add_domain_user_role(IsA(http.HttpRequest),
                                           domain=domain.id,
                                           user='2',
-                                          role='2')
+                                          role='2').InAnyOrder()
 
         # member user 3 - has role 2
         api.keystone.roles_for_user(IsA(http.HttpRequest), '3',
                                     domain=domain.id) \
-            .AndReturn((roles[1],))
+            .InAnyOrder().AndReturn((roles[1],))
         # remove role 2
         api.keystone.remove_domain_user_role(IsA(http.HttpRequest),
                                              domain=domain.id,
                                              user='3',
-                                             role='2')
+                                             role='2').InAnyOrder()
         # add role 1
         api.keystone.add_domain_user_role(IsA(http.HttpRequest),
                                           domain=domain.id,
                                           user='3',
-                                          role='1')
+                                          role='1').InAnyOrder()
 
         # member user 5 - do nothing
         api.keystone.roles_for_user(IsA(http.HttpRequest), '5',
                                     domain=domain.id) \
-            .AndReturn([])
+            .InAnyOrder().AndReturn([])
 
         # Group assignments
         api.keystone.group_list(IsA(http.HttpRequest),
@@ -410,44 +410,44 @@ class UpdateDomainWorkflowTests(test.BaseAdminViewTests):
         api.keystone.roles_for_group(IsA(http.HttpRequest),
                                      group='1',
                                      domain=domain.id) \
-            .AndReturn(roles)
+            .InAnyOrder().AndReturn(roles)
         for role in roles:
             api.keystone.remove_group_role(IsA(http.HttpRequest),
                                            role=role.id,
                                            group='1',
-                                           domain=domain.id)
+                                           domain=domain.id).InAnyOrder()
 
         # member group 1 - has role 1, will remove it
         api.keystone.roles_for_group(IsA(http.HttpRequest),
                                      group='2',
                                      domain=domain.id) \
-            .AndReturn((roles[0],))
+            .InAnyOrder().AndReturn((roles[0],))
         # remove role 1
         api.keystone.remove_group_role(IsA(http.HttpRequest),
                                        role='1',
                                        group='2',
-                                       domain=domain.id)
+                                       domain=domain.id).InAnyOrder()
         # add role 2
         api.keystone.add_group_role(IsA(http.HttpRequest),
                                     role='2',
                                     group='2',
-                                    domain=domain.id)
+                                    domain=domain.id).InAnyOrder()
 
         # member group 3 - has role 2
         api.keystone.roles_for_group(IsA(http.HttpRequest),
                                      group='3',
                                      domain=domain.id) \
-            .AndReturn((roles[1],))
+            .InAnyOrder().AndReturn((roles[1],))
         # remove role 2
         api.keystone.remove_group_role(IsA(http.HttpRequest),
                                        role='2',
                                        group='3',
-                                       domain=domain.id)
+                                       domain=domain.id).InAnyOrder()
         # add role 1
         api.keystone.add_group_role(IsA(http.HttpRequest),
                                     role='1',
                                     group='3',
-                                    domain=domain.id)
+                                    domain=domain.id).InAnyOrder()
 
         self.mox.ReplayAll()
 
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import logging
 
 from django.conf import settings
@@ -21,6 +22,7 @@ from django.utils.translation import ugettext_lazy as _
 from horizon import exceptions
 from horizon import forms
 from horizon import messages
+from horizon.utils import parallel
 from horizon import workflows
 
 from openstack_dashboard import api
@@ -308,95 +310,68 @@ class UpdateDomain(workflows.Workflow):
     def format_status_message(self, message):
         return message % self.context.get('name', 'unknown domain')
 
+    def _get_member_roles(self, data, step_slug, available_roles):
+        """Maps the users or groups picked in a membership step to the IDs
+        of the roles they were given.
+        """
+        member_step = self.get_step(step_slug)
+        members_roles = collections.defaultdict(list)
+        for role in available_roles:
+            field_name = member_step.get_member_field_name(role.id)
+            for member_id in data[field_name]:
+                members_roles[member_id].append(role.id)
+        return members_roles
+
     def _update_domain_members(self, request, domain_id, data):
         # update domain members
         users_to_modify = 0
-        # Project-user member step
-        member_step = self.get_step(constants.DOMAIN_USER_MEMBER_SLUG)
         try:
             # Get our role options
             available_roles = api.keystone.role_list(request)
-            # Get the users currently associated with this project so we
-            # can diff against it.
+            # Get the users currently associated with this domain, and their
+            # roles on it, so we can diff against it.
             domain_members = api.keystone.user_list(request,
                                                     domain=domain_id)
-            users_to_modify = len(domain_members)
-
-            for user in domain_members:
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_roles = api.keystone.roles_for_user(self.request,
-                                                            user.id,
-                                                            domain=domain_id)
-                current_role_ids = [role.id for role in current_roles]
-
-                for role in available_roles:
-                    field_name = member_step.get_member_field_name(role.id)
-                    # Check if the user is in the list of users with this role.
-                    if user.id in data[field_name]:
-                        # Add it if necessary
-                        if role.id not in current_role_ids:
-                            # user role has changed
-                            api.keystone.add_domain_user_role(
-                                request,
-                                domain=domain_id,
-                                user=user.id,
-                                role=role.id)
-                        else:
-                            # User role is unchanged, so remove it from the
-                            # remaining roles list to avoid removing it later.
-                            index = current_role_ids.index(role.id)
-                            current_role_ids.pop(index)
-
-                # Prevent admins from doing stupid things to themselves.
-                is_current_user = user.id == request.user.id
-                # TODO(lcheng) When Horizon moves to Domain scoped token for
-                # invoking identity operation, replace this with:
-                # domain_id == request.user.domain_id
-                is_current_domain = True
-
-                admin_roles = [role for role in current_roles
-                               if role.name.lower() == 'admin']
-                if len(admin_roles):
-                    removing_admin = any([role.id in current_role_ids
-                                          for role in admin_roles])
-                else:
-                    removing_admin = False
-                if is_current_user and is_current_domain and removing_admin:
-                    # Cannot remove "admin" role on current(admin) domain
-                    msg = _('You cannot revoke your administrative privileges '
-                            'from the domain you are currently logged into. '
-                            'Please switch to another domain with '
-                            'administrative privileges or remove the '
-                            'administrative role manually via the CLI.')
-                    messages.warning(request, msg)
-
-                # Otherwise go through and revoke any removed roles.
-                else:
-                    for id_to_delete in current_role_ids:
-                        api.keystone.remove_domain_user_role(
-                            request,
-                            domain=domain_id,
-                            user=user.id,
-                            role=id_to_delete)
-                users_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many users may be added for exception handling.
-                users_to_modify += len(data[field_name])
-            for role in available_roles:
-                users_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for user_id in data[field_name]:
-                    if not filter(lambda x: user_id == x.id, domain_members):
-                        api.keystone.add_tenant_user_role(request,
-                                                          project=domain_id,
-                                                          user=user_id,
-                                                          role=role.id)
-                    users_added += 1
-                users_to_modify -= users_added
+            calls = parallel.call_parallel(
+                [parallel.Call(api.keystone.roles_for_user,
+                               (request, user.id), {'domain': domain_id},
+                               name=user.id)
+                 for user in domain_members])
+            users_roles = dict((call.name, [role.id for role in call.get()])
+                               for call in calls)
+            grants, revokes = api.keystone.diff_role_assignments(
+                users_roles,
+                self._get_member_roles(data,
+                                       constants.DOMAIN_USER_MEMBER_SLUG,
+                                       available_roles))
+
+            # Prevent admins from doing stupid things to themselves.
+            # TODO(lcheng) When Horizon moves to Domain scoped token for
+            # invoking identity operation, only do this when
+            # domain_id == request.user.domain_id
+            admin_role_ids = [role.id for role in available_roles
+                              if role.name.lower() == 'admin']
+            if any(user_id == request.user.id and role_id in admin_role_ids
+                   for user_id, role_id in revokes):
+                # Cannot remove "admin" role on current(admin) domain
+                msg = _('You cannot revoke your administrative privileges '
+                        'from the domain you are currently logged into. '
+                        'Please switch to another domain with '
+                        'administrative privileges or remove the '
+                        'administrative role manually via the CLI.')
+                messages.warning(request, msg)
+                revokes = [(user_id, role_id) for user_id, role_id in revokes
+                           if user_id != request.user.id]
+
+            users_to_modify = len(set(user_id for user_id, role_id
+                                      in grants + revokes))
+            failed = api.keystone.apply_domain_role_changes(
+                request, domain_id, grants=grants, revokes=revokes)
+            if failed:
+                # Every change has been attempted, report the members which
+                # could not be updated along with the first error.
+                users_to_modify = len(set(call.name for call in failed))
+                failed[0].get()
             return True
         except Exception:
             exceptions.handle(request,
@@ -408,67 +383,34 @@ class UpdateDomain(workflows.Workflow):
     def _update_domain_groups(self, request, domain_id, data):
         # update domain groups
         groups_to_modify = 0
-        member_step = self.get_step(constants.DOMAIN_GROUP_MEMBER_SLUG)
         try:
             # Get our role options
             available_roles = api.keystone.role_list(request)
-            # Get the groups currently associated with this domain so we
-            # can diff against it.
+            # Get the groups currently associated with this domain, and
+            # their roles on it, so we can diff against it.
             domain_groups = api.keystone.group_list(request,
                                                     domain=domain_id)
-            groups_to_modify = len(domain_groups)
-            for group in domain_groups:
-                # Check if there have been any changes in the roles of
-                # Existing domain members.
-                current_roles = api.keystone.roles_for_group(
-                    self.request,
-                    group=group.id,
-                    domain=domain_id)
-                current_role_ids = [role.id for role in current_roles]
-                for role in available_roles:
-                    # Check if the group is in the list of groups with
-                    # this role.
-                    field_name = member_step.get_member_field_name(role.id)
-                    if group.id in data[field_name]:
-                        # Add it if necessary
-                        if role.id not in current_role_ids:
-                            # group role has changed
-                            api.keystone.add_group_role(
-                                request,
-                                role=role.id,
-                                group=group.id,
-                                domain=domain_id)
-                        else:
-                            # Group role is unchanged, so remove it from
-                            # the remaining roles list to avoid removing it
-                            # later
-                            index = current_role_ids.index(role.id)
-                            current_role_ids.pop(index)
-
-                # Revoke any removed roles.
-                for id_to_delete in current_role_ids:
-                    api.keystone.remove_group_role(request,
-                                                   role=id_to_delete,
-                                                   group=group.id,
-                                                   domain=domain_id)
-                groups_to_modify -= 1
-
-            # Grant new roles on the domain.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many groups may be added for error handling.
-                groups_to_modify += len(data[field_name])
-            for role in available_roles:
-                groups_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for group_id in data[field_name]:
-                    if not filter(lambda x: group_id == x.id, domain_groups):
-                        api.keystone.add_group_role(request,
-                                                    role=role.id,
-                                                    group=group_id,
-                                                    domain=domain_id)
-                    groups_added += 1
-                groups_to_modify -= groups_added
+            calls = parallel.call_parallel(
+                [parallel.Call(api.keystone.roles_for_group, (request,),
+                               {'group': group.id, 'domain': domain_id},
+                               name=group.id)
+                 for group in domain_groups])
+            groups_roles = dict((call.name, [role.id for role in call.get()])
+                                for call in calls)
+            grants, revokes = api.keystone.diff_role_assignments(
+                groups_roles,
+                self._get_member_roles(data,
+                                       constants.DOMAIN_GROUP_MEMBER_SLUG,
+                                       available_roles))
+
+            groups_to_modify = len(set(group_id for group_id, role_id
+                                       in grants + revokes))
+            failed = api.keystone.apply_domain_role_changes(
+                request, domain_id, grants=grants, revokes=revokes,
+                group=True)
+            if failed:
+                groups_to_modify = len(set(call.name for call in failed))
+                failed[0].get()
             return True
         except Exception:
             exceptions.handle(request,
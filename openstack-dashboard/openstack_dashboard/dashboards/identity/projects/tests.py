@@ -342,7 +342,8 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
                     api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                                       project=self.tenant.id,
                                                       user=user_id,
-                                                      role=role.id)
+                                                      role=role.id) \
+                        .InAnyOrder()
         for role in roles:
             if GROUP_ROLE_PREFIX + role.id in workflow_data:
                 ulist = workflow_data[GROUP_ROLE_PREFIX + role.id]
@@ -350,7 +351,8 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
                     api.keystone.add_group_role(IsA(http.HttpRequest),
                                                 role=role.id,
                                                 group=group_id,
-                                                project=self.tenant.id)
+                                                project=self.tenant.id) \
+                        .InAnyOrder()
 
         nova_updated_quota = dict([(key, quota_data[key]) for key in
                                    quotas.NOVA_QUOTA_FIELDS])
@@ -551,7 +553,8 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
                     api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                                       project=self.tenant.id,
                                                       user=user_id,
-                                                      role=role.id)
+                                                      role=role.id) \
+                        .InAnyOrder()
         for role in roles:
             if GROUP_ROLE_PREFIX + role.id in workflow_data:
                 ulist = workflow_data[GROUP_ROLE_PREFIX + role.id]
@@ -559,7 +562,8 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
                     api.keystone.add_group_role(IsA(http.HttpRequest),
                                                 role=role.id,
                                                 group=group_id,
-                                                project=self.tenant.id)
+                                                project=self.tenant.id) \
+                        .InAnyOrder()
 
         nova_updated_quota = dict([(key, quota_data[key]) for key in
                                    quotas.NOVA_QUOTA_FIELDS])
@@ -638,7 +642,7 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
                                                       project=self.tenant.id,
                                                       user=user_id,
                                                       role=role.id) \
-                       .AndRaise(self.exceptions.keystone)
+                       .InAnyOrder().AndRaise(self.exceptions.keystone)
                     break
             break
 
@@ -784,38 +788,28 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                               project=self.tenant.id,
                                               user='1',
-                                              role='2',)
+                                              role='2',).InAnyOrder()
             # remove role 2 from user 2
             api.keystone.remove_tenant_user_role(IsA(http.HttpRequest),
                                                  project=self.tenant.id,
                                                  user='2',
-                                                 role='2')
+                                                 role='2').InAnyOrder()
 
             # Give user 3 role 1
             api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                               project=self.tenant.id,
                                               user='3',
-                                              role='1',)
-            api.keystone.group_list(IsA(http.HttpRequest),
-                                    domain=self.domain.id,
-                                    project=self.tenant.id) \
-                .AndReturn(groups)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='1',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.remove_group_role(IsA(http.HttpRequest),
-                                           project=self.tenant.id,
-                                           group='1',
-                                           role='1')
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='2',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='3',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
+                                              role='1',).InAnyOrder()
+            api.keystone.role_assignments_list(IsA(http.HttpRequest),
+                                               project=self.tenant.id) \
+               .AndReturn(role_assignments)
+            # Group 1 keeps role 2, give groups 2 and 3 both roles
+            for group_id in ('2', '3'):
+                for role_id in ('1', '2'):
+                    api.keystone.add_group_role(IsA(http.HttpRequest),
+                                                project=self.tenant.id,
+                                                group=group_id,
+                                                role=role_id).InAnyOrder()
         else:
             api.keystone.user_list(IsA(http.HttpRequest),
                                    project=self.tenant.id) \
@@ -823,21 +817,24 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
 
             # admin user - try to remove all roles on current project, warning
             api.keystone.roles_for_user(IsA(http.HttpRequest), '1',
-                                        self.tenant.id).AndReturn(roles)
+                                        self.tenant.id) \
+                .InAnyOrder().AndReturn(roles)
 
             # member user 1 - has role 1, will remove it
             api.keystone.roles_for_user(IsA(http.HttpRequest), '2',
-                                        self.tenant.id).AndReturn((roles[1],))
+                                        self.tenant.id) \
+                .InAnyOrder().AndReturn((roles[1],))
 
             # member user 3 - has role 2
             api.keystone.roles_for_user(IsA(http.HttpRequest), '3',
-                                        self.tenant.id).AndReturn((roles[0],))
+                                        self.tenant.id) \
+                .InAnyOrder().AndReturn((roles[0],))
             # add role 2
             api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                               project=self.tenant.id,
                                               user='3',
                                               role='2')\
-                .AndRaise(self.exceptions.keystone)
+                .InAnyOrder().AndRaise(self.exceptions.keystone)
 
     @test.create_stubs({api.keystone: ('get_default_role',
                                        'roles_for_user',
@@ -895,7 +892,8 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             for user in proj_users:
                 api.keystone.roles_for_user(IsA(http.HttpRequest),
                                             user.id,
-                                            self.tenant.id).AndReturn(roles)
+                                            self.tenant.id) \
+                    .InAnyOrder().AndReturn(roles)
 
         api.keystone.role_assignments_list(IsA(http.HttpRequest),
                                            project=self.tenant.id) \
@@ -998,7 +996,8 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             for user in proj_users:
                 api.keystone.roles_for_user(IsA(http.HttpRequest),
                                             user.id,
-                                            self.tenant.id).AndReturn(roles)
+                                            self.tenant.id) \
+                    .InAnyOrder().AndReturn(roles)
 
         api.keystone.role_assignments_list(IsA(http.HttpRequest),
                                            project=self.tenant.id) \
@@ -1163,7 +1162,8 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             for user in proj_users:
                 api.keystone.roles_for_user(IsA(http.HttpRequest),
                                             user.id,
-                                            self.tenant.id).AndReturn(roles)
+                                            self.tenant.id) \
+                    .InAnyOrder().AndReturn(roles)
 
         role_ids = [role.id for role in roles]
         for user in proj_users:
@@ -1285,7 +1285,8 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             for user in proj_users:
                 api.keystone.roles_for_user(IsA(http.HttpRequest),
                                             user.id,
-                                            self.tenant.id).AndReturn(roles)
+                                            self.tenant.id) \
+                    .InAnyOrder().AndReturn(roles)
 
         api.keystone.role_assignments_list(IsA(http.HttpRequest),
                                            project=self.tenant.id) \
@@ -1412,7 +1413,8 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             for user in proj_users:
                 api.keystone.roles_for_user(IsA(http.HttpRequest),
                                             user.id,
-                                            self.tenant.id).AndReturn(roles)
+                                            self.tenant.id) \
+                    .InAnyOrder().AndReturn(roles)
 
         api.keystone.role_assignments_list(IsA(http.HttpRequest),
                                            project=self.tenant.id) \
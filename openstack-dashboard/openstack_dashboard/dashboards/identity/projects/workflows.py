@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 
 from django.conf import settings
 from django.core.urlresolvers import reverse
@@ -375,6 +376,18 @@ class UpdateProjectGroups(workflows.UpdateMembersStep):
 
 
 class CommonQuotaWorkflow(workflows.Workflow):
+    def _get_member_roles(self, data, step_slug, available_roles):
+        """Maps the users or groups picked in a membership step to the IDs
+        of the roles they were given.
+        """
+        member_step = self.get_step(step_slug)
+        members_roles = collections.defaultdict(list)
+        for role in available_roles:
+            field_name = member_step.get_member_field_name(role.id)
+            for member_id in data[field_name]:
+                members_roles[member_id].append(role.id)
+        return members_roles
+
     def _update_project_quota(self, request, data, project_id):
         # Update the project quota.
         nova_data = dict(
@@ -454,24 +467,17 @@ class CreateProject(CommonQuotaWorkflow):
         users_to_add = 0
         try:
             available_roles = api.keystone.role_list(request)
-            member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
-            # count how many users are to be added
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                users_to_add += len(role_list)
+            users_roles = self._get_member_roles(
+                data, PROJECT_USER_MEMBER_SLUG, available_roles)
+            users_to_add = len(users_roles)
             # add new users to project
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                users_added = 0
-                for user in role_list:
-                    api.keystone.add_tenant_user_role(request,
-                                                      project=project_id,
-                                                      user=user,
-                                                      role=role.id)
-                    users_added += 1
-                users_to_add -= users_added
+            grants, _revokes = api.keystone.diff_role_assignments(
+                {}, users_roles)
+            failed = api.keystone.apply_project_role_changes(
+                request, project_id, grants=grants)
+            if failed:
+                users_to_add = len(set(call.name for call in failed))
+                failed[0].get()
         except Exception:
             if PROJECT_GROUP_ENABLED:
                 group_msg = _(", add project groups")
@@ -488,25 +494,17 @@ class CreateProject(CommonQuotaWorkflow):
         groups_to_add = 0
         try:
             available_roles = api.keystone.role_list(request)
-            member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
-
-            # count how many groups are to be added
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                groups_to_add += len(role_list)
+            groups_roles = self._get_member_roles(
+                data, PROJECT_GROUP_MEMBER_SLUG, available_roles)
+            groups_to_add = len(groups_roles)
             # add new groups to project
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                groups_added = 0
-                for group in role_list:
-                    api.keystone.add_group_role(request,
-                                                role=role.id,
-                                                group=group,
-                                                project=project_id)
-                    groups_added += 1
-                groups_to_add -= groups_added
+            grants, _revokes = api.keystone.diff_role_assignments(
+                {}, groups_roles)
+            failed = api.keystone.apply_project_role_changes(
+                request, project_id, grants=grants, group=True)
+            if failed:
+                groups_to_add = len(set(call.name for call in failed))
+                failed[0].get()
         except Exception:
             exceptions.handle(request,
                               _('Failed to add %s project groups '
@@ -625,39 +623,6 @@ class UpdateProject(CommonQuotaWorkflow):
             exceptions.handle(request, ignore=True)
             return
 
-    def _add_roles_to_users(self, request, data, project_id, user_id,
-                            role_ids, available_roles):
-        member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
-        current_role_ids = list(role_ids)
-
-        for role in available_roles:
-            field_name = member_step.get_member_field_name(role.id)
-            # Check if the user is in the list of users with this role.
-            if user_id in data[field_name]:
-                # Add it if necessary
-                if role.id not in current_role_ids:
-                    # user role has changed
-                    api.keystone.add_tenant_user_role(
-                        request,
-                        project=project_id,
-                        user=user_id,
-                        role=role.id)
-                else:
-                    # User role is unchanged, so remove it from the
-                    # remaining roles list to avoid removing it later.
-                    index = current_role_ids.index(role.id)
-                    current_role_ids.pop(index)
-        return current_role_ids
-
-    def _remove_roles_from_user(self, request, project_id, user_id,
-                                current_role_ids):
-        for id_to_delete in current_role_ids:
-            api.keystone.remove_tenant_user_role(
-                request,
-                project=project_id,
-                user=user_id,
-                role=id_to_delete)
-
     def _is_removing_self_admin_role(self, request, project_id, user_id,
                                      available_roles, current_role_ids):
         is_current_user = user_id == request.user.id
@@ -687,8 +652,6 @@ class UpdateProject(CommonQuotaWorkflow):
     def _update_project_members(self, request, data, project_id):
         # update project members
         users_to_modify = 0
-        # Project-user member step
-        member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
         try:
             # Get our role options
             available_roles = self._get_available_roles(request)
@@ -696,41 +659,27 @@ class UpdateProject(CommonQuotaWorkflow):
             # can diff against it.
             users_roles = api.keystone.get_project_users_roles(
                 request, project=project_id)
-            users_to_modify = len(users_roles)
-
-            for user_id in users_roles.keys():
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_role_ids = list(users_roles[user_id])
-                modified_role_ids = self._add_roles_to_users(
-                    request, data, project_id, user_id,
-                    current_role_ids, available_roles)
-                # Prevent admins from doing stupid things to themselves.
-                removing_admin = self._is_removing_self_admin_role(
-                    request, project_id, user_id, available_roles,
-                    modified_role_ids)
-                # Otherwise go through and revoke any removed roles.
-                if not removing_admin:
-                    self._remove_roles_from_user(request, project_id, user_id,
-                                                 modified_role_ids)
-                users_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many users may be added for exception handling.
-                users_to_modify += len(data[field_name])
-            for role in available_roles:
-                users_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for user_id in data[field_name]:
-                    if user_id not in users_roles:
-                        api.keystone.add_tenant_user_role(request,
-                                                          project=project_id,
-                                                          user=user_id,
-                                                          role=role.id)
-                    users_added += 1
-                users_to_modify -= users_added
+            grants, revokes = api.keystone.diff_role_assignments(
+                users_roles,
+                self._get_member_roles(data, PROJECT_USER_MEMBER_SLUG,
+                                       available_roles))
+            # Prevent admins from doing stupid things to themselves.
+            own_revokes = [role_id for user_id, role_id in revokes
+                           if user_id == request.user.id]
+            if self._is_removing_self_admin_role(
+                    request, project_id, request.user.id, available_roles,
+                    own_revokes):
+                revokes = [(user_id, role_id) for user_id, role_id in revokes
+                           if user_id != request.user.id]
+            users_to_modify = len(set(user_id for user_id, role_id
+                                      in grants + revokes))
+            failed = api.keystone.apply_project_role_changes(
+                request, project_id, grants=grants, revokes=revokes)
+            if failed:
+                # Every change has been attempted, report the members which
+                # could not be updated along with the first error.
+                users_to_modify = len(set(call.name for call in failed))
+                failed[0].get()
             return True
         except Exception:
             if PROJECT_GROUP_ENABLED:
@@ -745,71 +694,27 @@ class UpdateProject(CommonQuotaWorkflow):
                                  'group_msg': group_msg})
             return False
 
-    def _update_project_groups(self, request, data, project_id, domain_id):
+    def _update_project_groups(self, request, data, project_id):
         # update project groups
         groups_to_modify = 0
-        member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
         try:
             available_roles = self._get_available_roles(request)
             # Get the groups currently associated with this project so we
             # can diff against it.
-            project_groups = api.keystone.group_list(request,
-                                                     domain=domain_id,
-                                                     project=project_id)
-            groups_to_modify = len(project_groups)
-            for group in project_groups:
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_roles = api.keystone.roles_for_group(
-                    self.request,
-                    group=group.id,
-                    project=project_id)
-                current_role_ids = [role.id for role in current_roles]
-                for role in available_roles:
-                    # Check if the group is in the list of groups with
-                    # this role.
-                    field_name = member_step.get_member_field_name(role.id)
-                    if group.id in data[field_name]:
-                        # Add it if necessary
-                        if role.id not in current_role_ids:
-                            # group role has changed
-                            api.keystone.add_group_role(
-                                request,
-                                role=role.id,
-                                group=group.id,
-                                project=project_id)
-                        else:
-                            # Group role is unchanged, so remove it from
-                            # the remaining roles list to avoid removing it
-                            # later.
-                            index = current_role_ids.index(role.id)
-                            current_role_ids.pop(index)
-
-                # Revoke any removed roles.
-                for id_to_delete in current_role_ids:
-                    api.keystone.remove_group_role(request,
-                                                   role=id_to_delete,
-                                                   group=group.id,
-                                                   project=project_id)
-                groups_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many groups may be added for error handling.
-                groups_to_modify += len(data[field_name])
-            for role in available_roles:
-                groups_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for group_id in data[field_name]:
-                    if not filter(lambda x: group_id == x.id,
-                                  project_groups):
-                        api.keystone.add_group_role(request,
-                                                    role=role.id,
-                                                    group=group_id,
-                                                    project=project_id)
-                    groups_added += 1
-                groups_to_modify -= groups_added
+            groups_roles = api.keystone.get_project_groups_roles(
+                request, project=project_id)
+            grants, revokes = api.keystone.diff_role_assignments(
+                groups_roles,
+                self._get_member_roles(data, PROJECT_GROUP_MEMBER_SLUG,
+                                       available_roles))
+            groups_to_modify = len(set(group_id for group_id, role_id
+                                       in grants + revokes))
+            failed = api.keystone.apply_project_role_changes(
+                request, project_id, grants=grants, revokes=revokes,
+                group=True)
+            if failed:
+                groups_to_modify = len(set(call.name for call in failed))
+                failed[0].get()
             return True
         except Exception:
             exceptions.handle(request,
@@ -831,25 +736,18 @@ class UpdateProject(CommonQuotaWorkflow):
             return False
 
     def handle(self, request, data):
-        # FIXME(gabriel): This should be refactored to use Python's built-in
-        # sets and do this all in a single "roles to add" and "roles to remove"
-        # pass instead of the multi-pass thing happening now.
-
         project = self._update_project(request, data)
         if not project:
             return False
 
         project_id = data['project_id']
-        # Use the domain_id from the project if available
-        domain_id = getattr(project, "domain_id", '')
 
         ret = self._update_project_members(request, data, project_id)
         if not ret:
             return False
 
         if PROJECT_GROUP_ENABLED:
-            ret = self._update_project_groups(request, data,
-                                              project_id, domain_id)
+            ret = self._update_project_groups(request, data, project_id)
             if not ret:
                 return False
 
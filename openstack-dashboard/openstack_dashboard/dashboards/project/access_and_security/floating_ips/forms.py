@@ -47,6 +47,7 @@ class FloatingIpAllocate(forms.SelfHandlingForm):
 
             fip = api.network.tenant_floating_ip_allocate(request,
                                                           pool=data['pool'])
+            quotas.clear_quota_usages_cache(request)
             messages.success(request,
                              _('Allocated Floating IP %(ip)s.')
                              % {"ip": fip.ip})
@@ -103,6 +103,7 @@ class ReleaseIPs(tables.BatchAction):
 
     def action(self, request, obj_id):
         api.network.tenant_floating_ip_release(request, obj_id)
+        quotas.clear_quota_usages_cache(request)
 
 
 class AssociateIP(tables.LinkAction):
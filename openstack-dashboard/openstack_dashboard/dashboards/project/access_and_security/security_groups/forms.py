@@ -31,6 +31,7 @@ from horizon import messages
 from horizon.utils import validators as utils_validators
 
 from openstack_dashboard import api
+from openstack_dashboard.usage import quotas
 from openstack_dashboard.utils import filters
 
 
@@ -80,9 +81,11 @@ class CreateGroup(GroupBase):
     error_message = _('Unable to create security group: %s')
 
     def _call_network_api(self, request, data):
-        return api.network.security_group_create(request,
-                                                 data['name'],
-                                                 data['description'])
+        group = api.network.security_group_create(request,
+                                                  data['name'],
+                                                  data['description'])
+        quotas.clear_quota_usages_cache(request)
+        return group
 
 
 class UpdateGroup(GroupBase):
@@ -64,6 +64,7 @@ class DeleteGroup(policy.PolicyTargetMixin, tables.DeleteAction):
 
     def delete(self, request, obj_id):
         api.network.security_group_delete(request, obj_id)
+        quotas.clear_quota_usages_cache(request)
 
 
 class CreateGroup(tables.LinkAction):
@@ -353,13 +353,44 @@ class DeleteObject(tables.DeleteAction):
     name = "delete_object"
     allowed_data_types = ("objects", "subfolders",)
 
+    def handle(self, table, request, obj_ids):
+        # Delete several selected objects with a single bulk request per
+        # container up front; delete() then only reports the outcome.
+        self._bulk_failures = {}
+        objects = {}
+        for obj_id in (obj_ids if len(obj_ids) > 1 else []):
+            obj = table.get_object_by_id(obj_id)
+            datum_type = getattr(obj, table._meta.data_type_name, None)
+            if (obj is not None and datum_type != 'subfolders' and
+                    table._filter_action(self, request, obj)):
+                objects.setdefault(obj.container_name, []).append(obj_id)
+        for container_name, object_names in objects.items():
+            try:
+                failures = api.swift.swift_bulk_delete(request,
+                                                       container_name,
+                                                       object_names)
+            except Exception:
+                failures = object_names
+            for object_name in object_names:
+                self._bulk_failures[(container_name, object_name)] = (
+                    object_name in failures)
+        return super(DeleteObject, self).handle(table, request, obj_ids)
+
     def delete(self, request, obj_id):
         obj = self.table.get_object_by_id(obj_id)
         container_name = obj.container_name
         datum_type = getattr(obj, self.table._meta.data_type_name, None)
         if datum_type == 'subfolders':
-            obj_id = obj_id[(len(container_name) + 1):] + "/"
-        api.swift.swift_delete_object(request, container_name, obj_id)
+            folder_name = obj_id[(len(container_name) + 1):] + "/"
+            api.swift.swift_delete_folder(request, container_name,
+                                          folder_name)
+            return
+        bulk_failures = getattr(self, '_bulk_failures', {})
+        failed = bulk_failures.get((container_name, obj_id))
+        if failed is None:
+            api.swift.swift_delete_object(request, container_name, obj_id)
+        elif failed:
+            raise exceptions.Conflict(_("Unable to delete object."))
 
     def get_success_url(self, request):
         url = super(DeleteObject, self).get_success_url(request)
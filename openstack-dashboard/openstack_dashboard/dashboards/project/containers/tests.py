@@ -311,13 +311,33 @@ class SwiftTests(test.TestCase):
         handled = table.maybe_handle()
         self.assertEqual(handled['location'], index_url)
 
-    @test.create_stubs({api.swift: ('swift_delete_object',)})
+    @test.create_stubs({api.swift: ('swift_bulk_delete',)})
+    def test_delete_multiple(self):
+        container = self.containers.first()
+        objects = self.objects.list()[:2]
+        args = (utils.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        api.swift.swift_bulk_delete(IsA(http.HttpRequest),
+                                    container.name,
+                                    [obj.name for obj in objects]) \
+            .AndReturn([])
+        self.mox.ReplayAll()
+
+        form_data = {"action": "objects__delete_multiple_objects",
+                     "object_ids": [obj.name for obj in objects]}
+        req = self.factory.post(index_url, form_data)
+        kwargs = {"container_name": container.name}
+        table = tables.ObjectsTable(req, self.objects.list(), **kwargs)
+        handled = table.maybe_handle()
+        self.assertEqual(handled['location'], index_url)
+
+    @test.create_stubs({api.swift: ('swift_delete_folder',)})
     def test_delete_pseudo_folder(self):
         container = self.containers.first()
         folder = self.folder.first()
         args = (utils.wrap_delimiter(container.name),)
         index_url = reverse('horizon:project:containers:index', args=args)
-        api.swift.swift_delete_object(IsA(http.HttpRequest),
+        api.swift.swift_delete_folder(IsA(http.HttpRequest),
                                       container.name,
                                       folder.name + '/')
         self.mox.ReplayAll()
@@ -374,6 +394,48 @@ class SwiftTests(test.TestCase):
                     'attachment; filename=%s' % expected_name
                 )
 
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range(self):
+        container = self.containers.first()
+        obj = api.swift.StorageObject(
+            {'name': 'test.txt', 'bytes': 4, 'etag': 'abc', 'status': 206,
+             'content_range': 'bytes 2-5/9', 'last_modified': None},
+            container.name, data=iter([b'ke D']))
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest), container.name, obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'Range': 'bytes=2-5'}).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=2-5')
+
+        self.assertEqual(206, res.status_code)
+        self.assertEqual('bytes 2-5/9', res['Content-Range'])
+        self.assertEqual('bytes', res['Accept-Ranges'])
+        self.assertEqual('"abc"', res['ETag'])
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_not_modified(self):
+        container = self.containers.first()
+        obj = api.swift.StorageObject(
+            {'name': 'test.txt', 'bytes': None, 'etag': 'abc',
+             'status': 304, 'content_range': None, 'last_modified': None},
+            container.name)
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest), container.name, obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'If-None-Match': '"abc"'}).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_IF_NONE_MATCH='"abc"')
+
+        self.assertEqual(304, res.status_code)
+        self.assertFalse(res.has_header('Content-Disposition'))
+
     @test.create_stubs({api.swift: ('swift_get_containers',)})
     def test_copy_index(self):
         ret = (self.containers.list(), False)
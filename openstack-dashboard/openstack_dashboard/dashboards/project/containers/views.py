@@ -192,33 +192,63 @@ class UploadView(forms.ModalFormView):
         return context
 
 
+# Request headers passed on to Swift so that it can answer with a part of
+# the object (resumed downloads, media seeking) or a 304 Not Modified.
+DOWNLOAD_HEADERS = (('HTTP_RANGE', 'Range'),
+                    ('HTTP_IF_RANGE', 'If-Range'),
+                    ('HTTP_IF_NONE_MATCH', 'If-None-Match'),
+                    ('HTTP_IF_MODIFIED_SINCE', 'If-Modified-Since'))
+
+
 def object_download(request, container_name, object_path):
+    headers = dict((header, request.META[key])
+                   for key, header in DOWNLOAD_HEADERS if key in request.META)
+    kwargs = {'resp_chunk_size': swift.CHUNK_SIZE}
+    if headers:
+        kwargs['headers'] = headers
     try:
         obj = api.swift.swift_get_object(request, container_name, object_path,
-                                         resp_chunk_size=swift.CHUNK_SIZE)
+                                         **kwargs)
     except Exception:
         redirect = reverse("horizon:project:containers:index")
         exceptions.handle(request,
                           _("Unable to retrieve object."),
                           redirect=redirect)
-    # Add the original file extension back on if it wasn't preserved in the
-    # name given to the object.
-    filename = object_path.rsplit(swift.FOLDER_DELIMITER)[-1]
-    if not os.path.splitext(obj.name)[1] and obj.orig_name:
-        name, ext = os.path.splitext(obj.orig_name)
-        filename = "%s%s" % (filename, ext)
-    # NOTE(tsufiev): StreamingHttpResponse class had been introduced in
-    # Django 1.5 specifically for the purpose streaming and/or transferring
-    # large files, it's less fragile than standard HttpResponse and should be
-    # used when available.
-    if django.VERSION >= (1, 5):
-        response = http.StreamingHttpResponse(obj.data)
+
+    status = getattr(obj, 'status', 200)
+    if status == 304:
+        response = http.HttpResponseNotModified()
+    elif status in (412, 416):
+        response = http.HttpResponse(status=status)
+        if status == 416 and getattr(obj, 'content_range', None):
+            response['Content-Range'] = obj.content_range
     else:
-        response = http.HttpResponse(obj.data)
-    safe_name = filename.replace(",", "").encode('utf-8')
-    response['Content-Disposition'] = 'attachment; filename="%s"' % safe_name
-    response['Content-Type'] = 'application/octet-stream'
-    response['Content-Length'] = obj.bytes
+        # Add the original file extension back on if it wasn't preserved in
+        # the name given to the object.
+        filename = object_path.rsplit(swift.FOLDER_DELIMITER)[-1]
+        if not os.path.splitext(obj.name)[1] and obj.orig_name:
+            name, ext = os.path.splitext(obj.orig_name)
+            filename = "%s%s" % (filename, ext)
+        # NOTE(tsufiev): StreamingHttpResponse class had been introduced in
+        # Django 1.5 specifically for the purpose streaming and/or
+        # transferring large files, it's less fragile than standard
+        # HttpResponse and should be used when available.
+        if django.VERSION >= (1, 5):
+            response = http.StreamingHttpResponse(obj.data, status=status)
+        else:
+            response = http.HttpResponse(obj.data, status=status)
+        safe_name = filename.replace(",", "").encode('utf-8')
+        response['Content-Disposition'] = ('attachment; filename="%s"'
+                                           % safe_name)
+        response['Content-Type'] = 'application/octet-stream'
+        response['Content-Length'] = obj.bytes
+        if status == 206:
+            response['Content-Range'] = obj.content_range
+    response['Accept-Ranges'] = 'bytes'
+    if getattr(obj, 'etag', None):
+        response['ETag'] = '"%s"' % obj.etag.strip('"')
+    if getattr(obj, 'last_modified', None):
+        response['Last-Modified'] = obj.last_modified
     return response
 
 
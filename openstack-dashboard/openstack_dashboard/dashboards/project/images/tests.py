@@ -149,6 +149,34 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
                                image.container_format not in ('ami', 'aki'))]
         self.assertEqual(len(expected_images), len(ret))
 
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_list_image_deduplicated(self):
+        public_images = [image for image in self.images.list()
+                         if image.status == 'active' and image.is_public]
+        private_images = [image for image in self.images.list()
+                          if (image.status == 'active' and
+                              not image.is_public)]
+        # The public images are also listed as the project's own images.
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([public_images, False, False])
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'property-owner_id': self.tenant.id,
+                     'status': 'active'}) \
+            .AndReturn([private_images + public_images, False, False])
+
+        self.mox.ReplayAll()
+
+        images_cache = {}
+        ret = utils.get_available_images(self.request, self.tenant.id,
+                                         images_cache)
+        expected_images = [image for image in private_images + public_images
+                           if image.container_format not in ('ari', 'aki')]
+        self.assertEqual([image.id for image in expected_images],
+                         [image.id for image in ret])
+
     @test.create_stubs({api.glance: ('image_list_detailed',)})
     def test_list_image_using_cache(self):
         public_images = [image for image in self.images.list()
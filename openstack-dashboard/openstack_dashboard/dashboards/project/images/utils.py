@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import itertools
+
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -35,9 +37,8 @@ def get_available_images(request, project_id=None, images_cache=None):
         public = {"is_public": True,
                   "status": "active"}
         try:
-            images, _more, _prev = glance.image_list_detailed(
-                request, filters=public)
-            [public_images.append(image) for image in images]
+            images = glance.image_list_filtered(request, **public)
+            public_images.extend(images)
             images_cache['public_images'] = public_images
         except Exception:
             exceptions.handle(request,
@@ -51,8 +52,7 @@ def get_available_images(request, project_id=None, images_cache=None):
         owner = {"property-owner_id": project_id,
                  "status": "active"}
         try:
-            owned_images, _more, _prev = glance.image_list_detailed(
-                request, filters=owner)
+            owned_images = glance.image_list_filtered(request, **owner)
             images_by_project[project_id] = owned_images
         except Exception:
             owned_images = []
@@ -65,17 +65,23 @@ def get_available_images(request, project_id=None, images_cache=None):
     if 'images_by_project' not in images_cache:
         images_cache['images_by_project'] = images_by_project
 
-    images = owned_images + public_images
+    return list(_iter_bootable_images(
+        itertools.chain(owned_images, public_images)))
+
 
-    # Remove duplicate images
-    image_ids = []
-    final_images = []
+def _iter_bootable_images(images):
+    """Yields each image once, leaving out kernel and ramdisk images.
+
+    The images are deduplicated on their ID in a single pass, so that very
+    long image lists can be merged in linear time.
+    """
+    seen = set()
     for image in images:
-        if image.id not in image_ids:
-            image_ids.append(image.id)
-            final_images.append(image)
-    return [image for image in final_images
-            if image.container_format not in ('aki', 'ari')]
+        if image.id in seen:
+            continue
+        seen.add(image.id)
+        if image.container_format not in ('aki', 'ari'):
+            yield image
 
 
 def image_field_data(request, include_empty_option=False):
@@ -35,6 +35,7 @@ from horizon import messages
 from horizon import tables
 from horizon.templatetags import sizeformat
 from horizon.utils import filters
+from horizon.utils import parallel
 
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.access_and_security.floating_ips \
@@ -45,6 +46,7 @@ from openstack_dashboard.dashboards.project.instances.workflows \
 from openstack_dashboard.dashboards.project.instances.workflows \
     import update_instance
 from openstack_dashboard import policy
+from openstack_dashboard.usage import quotas
 
 
 LOG = logging.getLogger(__name__)
@@ -110,6 +112,7 @@ class TerminateInstance(policy.PolicyTargetMixin, tables.BatchAction):
 
     def action(self, request, obj_id):
         api.nova.server_delete(request, obj_id)
+        quotas.clear_quota_usages_cache(request)
 
 
 class RebootInstance(policy.PolicyTargetMixin, tables.BatchAction):
@@ -665,6 +668,7 @@ class SimpleAssociateIP(policy.PolicyTargetMixin, tables.Action):
                 request, instance_id).split('_')[0]
 
             fip = api.network.tenant_floating_ip_allocate(request)
+            quotas.clear_quota_usages_cache(request)
             api.network.floating_ip_associate(request, fip.id, target_id)
             messages.success(request,
                              _("Successfully associated floating IP: %s")
@@ -747,18 +751,55 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, instance_id):
         instance = api.nova.server_get(request, instance_id)
+        self.load_details(request, instance)
+        return instance
+
+    def get_data_many(self, request, instance_ids):
+        # Fetch the instances concurrently, and their flavors with a single
+        # call rather than one flavor_get per instance.
+        calls = parallel.call_parallel(
+            [parallel.Call(api.nova.server_get, (request, instance_id),
+                           name=instance_id)
+             for instance_id in instance_ids])
+        instances = []
+        removed = []
+        for call in calls:
+            try:
+                instances.append(call.get())
+            except exceptions.NOT_FOUND:
+                removed.append(call.name)
+            except Exception:
+                # Leave the row as it is; it is polled again.
+                LOG.warning('Unable to retrieve instance %s: %s',
+                            call.name, call.exc_info[1])
+        if not instances:
+            return instances, removed
+
         try:
-            instance.full_flavor = api.nova.flavor_get(request,
-                                                       instance.flavor["id"])
+            flavors = api.nova.flavor_list(request)
+        except Exception:
+            # Fall back to retrieving the flavors one at a time.
+            flavors = []
+        full_flavors = dict((str(flavor.id), flavor) for flavor in flavors)
+        for instance in instances:
+            self.load_details(request, instance, full_flavors)
+        return instances, removed
+
+    def load_details(self, request, instance, full_flavors=None):
+        flavor_id = instance.flavor["id"]
+        try:
+            if full_flavors and flavor_id in full_flavors:
+                instance.full_flavor = full_flavors[flavor_id]
+            else:
+                instance.full_flavor = api.nova.flavor_get(request, flavor_id)
         except Exception:
             exceptions.handle(request,
                               _('Unable to retrieve flavor information '
-                                'for instance "%s".') % instance_id,
+                                'for instance "%s".') % instance.id,
                               ignore=True)
         error = get_instance_error(instance)
         if error:
             messages.error(request, error)
-        return instance
 
 
 class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
@@ -32,6 +32,7 @@ from django.utils import encoding
 from django.utils.http import urlencode
 from mox3.mox import IgnoreArg  # noqa
 from mox3.mox import IsA  # noqa
+from novaclient import exceptions as nova_exceptions
 import six
 
 from horizon import exceptions
@@ -63,7 +64,7 @@ class InstanceTests(helpers.TestCase):
             'tenant_absolute_limits',
             'extension_supported',
         ),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: (
             'floating_ip_simple_associate_supported',
             'floating_ip_supported',
@@ -79,8 +80,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -108,11 +109,14 @@ class InstanceTests(helpers.TestCase):
         self.assertNotContains(res, "Launch Instance (Quota exceeded)")
 
     @helpers.create_stubs({api.nova: ('server_list',
+                                      'flavor_list',
                                       'tenant_absolute_limits',)})
     def test_index_server_list_exception(self):
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndRaise(self.exceptions.nova)
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
            .MultipleTimes().AndReturn(self.limits['absolute'])
 
@@ -127,7 +131,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'flavor_get',
                    'tenant_absolute_limits', 'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -147,8 +151,8 @@ class InstanceTests(helpers.TestCase):
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndRaise(self.exceptions.nova)
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         for server in servers:
             api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
                 AndReturn(full_flavors[server.flavor["id"]])
@@ -171,7 +175,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
                    'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -190,8 +194,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -240,7 +244,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_list',
                                       'flavor_list',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance(self):
         servers = self.servers.list()
@@ -251,8 +255,8 @@ class InstanceTests(helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -264,7 +268,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_list',
                                       'flavor_list',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance_exception(self):
         servers = self.servers.list()
@@ -275,8 +279,8 @@ class InstanceTests(helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id) \
             .AndRaise(self.exceptions.nova)
 
@@ -291,7 +295,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_pause_instance(self):
         servers = self.servers.list()
@@ -302,8 +306,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -321,7 +325,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_pause_instance_exception(self):
         servers = self.servers.list()
@@ -332,8 +336,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -352,7 +356,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unpause_instance(self):
         servers = self.servers.list()
@@ -363,8 +367,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -382,7 +386,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unpause_instance_exception(self):
         servers = self.servers.list()
@@ -394,8 +398,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -413,15 +417,15 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
                                       'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_reboot_instance(self):
         servers = self.servers.list()
         server = servers[0]
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -439,7 +443,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
                                       'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_reboot_instance_exception(self):
         servers = self.servers.list()
@@ -447,8 +451,8 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -467,7 +471,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
                                       'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_soft_reboot_instance(self):
         servers = self.servers.list()
@@ -475,8 +479,8 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -495,7 +499,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_suspend_instance(self):
         servers = self.servers.list()
@@ -506,8 +510,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -526,7 +530,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_suspend_instance_exception(self):
         servers = self.servers.list()
@@ -537,8 +541,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -557,7 +561,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_resume_instance(self):
         servers = self.servers.list()
@@ -569,8 +573,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -588,7 +592,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_resume_instance_exception(self):
         servers = self.servers.list()
@@ -600,8 +604,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -621,7 +625,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_shelve_instance(self):
         servers = self.servers.list()
@@ -631,8 +635,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -650,7 +654,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_shelve_instance_exception(self):
         servers = self.servers.list()
@@ -660,8 +664,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -681,7 +685,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unshelve_instance(self):
         servers = self.servers.list()
@@ -692,8 +696,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -712,7 +716,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unshelve_instance_exception(self):
         servers = self.servers.list()
@@ -723,8 +727,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -744,7 +748,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_lock_instance(self):
         servers = self.servers.list()
@@ -752,8 +756,8 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
         search_opts = {'marker': None, 'paginate': True}
@@ -774,7 +778,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_lock_instance_exception(self):
         servers = self.servers.list()
@@ -782,8 +786,8 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
         search_opts = {'marker': None, 'paginate': True}
@@ -805,7 +809,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unlock_instance(self):
         servers = self.servers.list()
@@ -814,8 +818,8 @@ class InstanceTests(helpers.TestCase):
             http.HttpRequest)).MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
             IsA(http.HttpRequest),
@@ -834,7 +838,7 @@ class InstanceTests(helpers.TestCase):
                                       'server_list',
                                       'flavor_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_unlock_instance_exception(self):
         servers = self.servers.list()
@@ -842,8 +846,8 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
@@ -1273,7 +1277,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
                    'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -1287,8 +1291,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -3592,7 +3596,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
                    'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -3609,8 +3613,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -3767,7 +3771,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
                    'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -3783,8 +3787,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -3883,7 +3887,7 @@ class InstanceTests(helpers.TestCase):
                                          'tenant_floating_ip_allocate',
                                          'floating_ip_associate',
                                          'servers_update_addresses',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.nova: ('server_list',
                                       'flavor_list')})
     def test_associate_floating_ip(self):
@@ -3896,8 +3900,8 @@ class InstanceTests(helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.network.floating_ip_target_get_by_instance(
             IsA(http.HttpRequest),
             server.id).AndReturn(server.id)
@@ -3917,7 +3921,7 @@ class InstanceTests(helpers.TestCase):
                                          'tenant_floating_ip_list',
                                          'floating_ip_disassociate',
                                          'servers_update_addresses',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.nova: ('server_list',
                                       'flavor_list')})
     def test_disassociate_floating_ip(self):
@@ -3931,8 +3935,8 @@ class InstanceTests(helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.network.floating_ip_target_list_by_instance(
             IsA(http.HttpRequest),
             server.id).AndReturn([server.id, ])
@@ -4320,7 +4324,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
                    'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_get_many',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -4339,8 +4343,8 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .MultipleTimes().AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .MultipleTimes().AndReturn(self.images.list())
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -4384,7 +4388,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_list',
                                       'flavor_list',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_get_many',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance_with_pagination(self):
         """Instance should be deleted from
@@ -4400,8 +4404,8 @@ class InstanceTests(helpers.TestCase):
         api.network.servers_update_addresses(IsA(http.HttpRequest),
                                              servers[page_size:])
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_get_many(IsA(http.HttpRequest), IgnoreArg()) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -4588,6 +4592,74 @@ class InstanceAjaxTests(helpers.TestCase):
         self.assertContains(res, server.name)
         self.assertContains(res, "Not available")
 
+    @helpers.create_stubs({api.nova: ("server_get",
+                                      "flavor_list",
+                                      "extension_supported"),
+                           api.neutron: ("is_extension_supported",)})
+    def test_row_update_batch(self):
+        servers = self.servers.list()[:2]
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        for server in servers:
+            api.nova.server_get(IsA(http.HttpRequest), server.id)\
+                .InAnyOrder().AndReturn(server)
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'row_update_batch'), ('table', 'instances')]
+        params += [('obj_id', server.id) for server in servers]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        content = json.loads(res.content.decode('utf-8'))
+        self.assertEqual([], content['removed'])
+        for server in servers:
+            self.assertIn(server.name, content['rows'][server.id])
+
+    @helpers.create_stubs({api.nova: ("server_get",
+                                      "flavor_list",
+                                      "extension_supported"),
+                           api.neutron: ("is_extension_supported",)})
+    def test_row_update_batch_server_get_exception(self):
+        server, gone, broken = self.servers.list()[:3]
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_get(IsA(http.HttpRequest), server.id)\
+            .InAnyOrder().AndReturn(server)
+        api.nova.server_get(IsA(http.HttpRequest), gone.id)\
+            .InAnyOrder().AndRaise(nova_exceptions.NotFound(404))
+        api.nova.server_get(IsA(http.HttpRequest), broken.id)\
+            .InAnyOrder().AndRaise(self.exceptions.nova)
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'row_update_batch'), ('table', 'instances')]
+        params += [('obj_id', instance.id)
+                   for instance in (server, gone, broken)]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(200, res.status_code)
+        content = json.loads(res.content.decode('utf-8'))
+        # Only the instance which is not found is removed; the one which
+        # fails to load keeps its row.
+        self.assertEqual([gone.id], content['removed'])
+        self.assertEqual([server.id], list(content['rows']))
+
 
 class ConsoleManagerTests(helpers.TestCase):
 
@@ -67,7 +67,7 @@ def sort_flavor_list(request, flavors):
 def availability_zone_list(request):
     """Utility method to retrieve a list of availability zones."""
     try:
-        return api.nova.availability_zone_list(request)
+        return api.nova.availability_zone_list_cached(request)
     except Exception:
         exceptions.handle(request,
                           _('Unable to retrieve Nova availability zones.'))
@@ -89,7 +89,8 @@ def network_field_data(request, include_empty_option=False):
     networks = []
     if api.base.is_service_enabled(request, 'network'):
         try:
-            networks = api.neutron.network_list_for_tenant(request, tenant_id)
+            networks = api.neutron.network_list_for_tenant_cached(
+                request, tenant_id)
             networks = [(n.id, n.name_or_id) for n in networks]
             networks.sort(key=lambda obj: obj[1])
         except Exception as e:
@@ -119,7 +120,7 @@ def keypair_field_data(request, include_empty_option=False):
     """
     keypair_list = []
     try:
-        keypairs = api.nova.keypair_list(request)
+        keypairs = api.nova.keypair_list_cached(request)
         keypair_list = [(kp.name, kp.name) for kp in keypairs]
     except Exception:
         exceptions.handle(request, _('Unable to retrieve key pairs.'))
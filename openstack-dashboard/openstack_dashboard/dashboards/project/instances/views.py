@@ -53,6 +53,13 @@ from openstack_dashboard.dashboards.project.instances \
 LOG = logging.getLogger(__name__)
 
 
+def get_image_ids(instances):
+    """Returns the IDs of the images the given instances were booted from."""
+    return [instance.image['id'] for instance in instances
+            if isinstance(getattr(instance, 'image', None), dict)
+            and instance.image.get('id')]
+
+
 class IndexView(tables.DataTableView):
     table_class = project_tables.InstancesTable
     template_name = 'project/instances/index.html'
@@ -65,40 +72,31 @@ class IndexView(tables.DataTableView):
         marker = self.request.GET.get(
             project_tables.InstancesTable._meta.pagination_param, None)
         search_opts = self.get_filters({'marker': marker, 'paginate': True})
-        # Gather our instances
-        try:
-            instances, self._more = api.nova.server_list(
-                self.request,
-                search_opts=search_opts)
-        except Exception:
-            self._more = False
-            instances = []
-            exceptions.handle(self.request,
-                              _('Unable to retrieve instances.'))
+        # Gather our instances and flavors concurrently; flavors do not
+        # depend on the instances being listed.
+        fan_out = self.get_fan_out()
+        fan_out.add('instances', api.nova.server_list, (self.request,),
+                    {'search_opts': search_opts}, default=([], False),
+                    message=_('Unable to retrieve instances.'))
+        fan_out.add('flavors', api.nova.flavor_list, (self.request,),
+                    default=[], ignore=True)
+        results = fan_out.run()
+        instances, self._more = results['instances']
 
         if instances:
-            try:
-                api.network.servers_update_addresses(self.request, instances)
-            except Exception:
-                exceptions.handle(
-                    self.request,
-                    message=_('Unable to retrieve IP addresses from Neutron.'),
-                    ignore=True)
-
-            # Gather our flavors and images and correlate our instances to them
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                flavors = []
-                exceptions.handle(self.request, ignore=True)
-
-            try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
-            except Exception:
-                images = []
-                exceptions.handle(self.request, ignore=True)
+            # Only the images used by this page of instances are retrieved.
+            details = self.get_fan_out()
+            details.add('addresses', api.network.servers_update_addresses,
+                        (self.request, instances),
+                        message=_('Unable to retrieve IP addresses from '
+                                  'Neutron.'),
+                        ignore=True)
+            details.add('images', api.glance.image_get_many,
+                        (self.request, get_image_ids(instances)),
+                        default=[], ignore=True)
+            images = details.run()['images']
+
+            flavors = results['flavors']
 
             full_flavors = OrderedDict([(str(flavor.id), flavor)
                                        for flavor in flavors])
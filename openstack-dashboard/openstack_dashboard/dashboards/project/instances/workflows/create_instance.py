@@ -373,13 +373,7 @@ class SetInstanceDetailsAction(workflows.Action):
         return instance_utils.flavor_field_data(request, False)
 
     def populate_availability_zone_choices(self, request, context):
-        try:
-            zones = api.nova.availability_zone_list(request)
-        except Exception:
-            zones = []
-            exceptions.handle(request,
-                              _('Unable to retrieve availability zones.'))
-
+        zones = instance_utils.availability_zone_list(request)
         zone_list = [(zone.zoneName, zone.zoneName)
                      for zone in zones if zone.zoneState['available']]
         zone_list.sort()
@@ -945,6 +939,7 @@ class LaunchInstance(workflows.Workflow):
                                    admin_pass=context['admin_pass'],
                                    disk_config=context.get('disk_config'),
                                    config_drive=context.get('config_drive'))
+            quotas.clear_quota_usages_cache(request)
             return True
         except Exception:
             if port_profiles_supported:
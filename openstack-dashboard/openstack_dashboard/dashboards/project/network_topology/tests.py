@@ -153,6 +153,40 @@ class NetworkTopologyTests(test.TestCase):
                  'network_id': ext_net.id,
                  'fixed_ips': []})
         self.assertEqual(expect_port_urls, data['ports'])
+        self.assertIn('timestamp', data)
+        self.assertNotIn('deleted', data)
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_changes_since(self):
+        servers = self.servers.list()
+        deleted_server = servers[0]
+        deleted_server.status = 'DELETED'
+        search_opts = {'changes-since': '2016-01-01T00:00:00+00:00'}
+        api.nova.server_list(
+            IsA(http.HttpRequest),
+            search_opts=search_opts).AndReturn([servers, False])
+        api.neutron.network_list_for_tenant(
+            IsA(http.HttpRequest), self.tenant.id).AndReturn([])
+        api.neutron.network_list(
+            IsA(http.HttpRequest),
+            **{'router:external': True}).AndReturn([])
+        api.neutron.router_list(
+            IsA(http.HttpRequest), tenant_id=self.tenant.id).AndReturn([])
+        api.neutron.port_list(IsA(http.HttpRequest)).AndReturn([])
+
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL,
+                              {'changes_since': '2016-01-01T00:00:00Z'})
+        data = json.loads(res.content)
+
+        self.assertEqual([deleted_server.id], data['deleted']['servers'])
+        self.assertEqual([server.id for server in servers[1:]],
+                         [server['id'] for server in data['servers']])
 
 
 class NetworkTopologyCreateTests(test.TestCase):
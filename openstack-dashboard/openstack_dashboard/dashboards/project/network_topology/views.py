@@ -22,10 +22,13 @@ from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse  # noqa
+from django.utils import dateparse
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import View  # noqa
 
 from horizon import exceptions
+from horizon.utils import parallel
 from horizon import views
 
 from openstack_dashboard import api
@@ -204,27 +207,70 @@ class JSONView(View):
                 return True
         return False
 
+    def _changed(self, resource):
+        """Returns whether a resource changed since the client's last poll.
+
+        Resources which do not report when they were updated are always
+        considered changed.
+        """
+        if self.changes_since is None:
+            return True
+        updated_at = getattr(resource, 'updated_at', None)
+        if not updated_at:
+            return True
+        updated_at = dateparse.parse_datetime(updated_at)
+        if updated_at is None:
+            return True
+        if timezone.is_naive(updated_at):
+            updated_at = timezone.make_aware(updated_at, timezone.utc)
+        return updated_at >= self.changes_since
+
+    def _get_console_type(self, request, servers):
+        """Resolves the console type once per request.
+
+        The console types available are a property of the deployment rather
+        than of a server, so only the first running server is probed instead
+        of issuing console API calls for every server.
+        """
+        console_type = getattr(settings, 'CONSOLE_TYPE', 'AUTO')
+        if not console_type:
+            return None
+        for server in servers:
+            if server.status != 'ACTIVE':
+                continue
+            try:
+                return i_console.get_console(
+                    request, console_type, server)[0].lower()
+            except exceptions.NotAvailable:
+                return None
+        return None
+
     def _get_servers(self, request):
         # Get nova data
         try:
-            servers, more = api.nova.server_list(request)
+            if self.changes_since is None:
+                servers, more = api.nova.server_list(request)
+            else:
+                search_opts = {'changes-since': self.changes_since.isoformat()}
+                servers, more = api.nova.server_list(request,
+                                                     search_opts=search_opts)
         except Exception:
             servers = []
+        # Servers deleted since the last poll are only reported by nova
+        # when polling for changes, let the client drop them.
+        self.deleted_servers = [server.id for server in servers
+                                if server.status == 'DELETED']
+        servers = [server for server in servers
+                   if server.status != 'DELETED']
         data = []
-        console_type = getattr(settings, 'CONSOLE_TYPE', 'AUTO')
         # lowercase of the keys will be used at the end of the console URL.
+        console = self._get_console_type(request, servers)
         for server in servers:
-            try:
-                console = i_console.get_console(
-                    request, console_type, server)[0].lower()
-            except exceptions.NotAvailable:
-                console = None
-
             server_data = {'name': server.name,
                            'status': server.status,
                            'task': getattr(server, 'OS-EXT-STS:task_state'),
                            'id': server.id}
-            if console:
+            if console and server.status == 'ACTIVE':
                 server_data['console'] = console
             data.append(server_data)
         self.add_resource_url('horizon:project:instances:detail', data)
@@ -244,6 +290,8 @@ class JSONView(View):
             neutron_networks = []
         networks = []
         for network in neutron_networks:
+            if not self._changed(network):
+                continue
             obj = {'name': network.name_or_id,
                    'id': network.id,
                    'subnets': [{'id': subnet.id,
@@ -265,7 +313,8 @@ class JSONView(View):
                 neutron_public_networks = []
             my_network_ids = [net['id'] for net in networks]
             for publicnet in neutron_public_networks:
-                if publicnet.id in my_network_ids:
+                if (publicnet.id in my_network_ids
+                        or not self._changed(publicnet)):
                     continue
                 try:
                     subnets = []
@@ -305,7 +354,7 @@ class JSONView(View):
                     'name': router.name_or_id,
                     'status': router.status,
                     'external_gateway_info': router.external_gateway_info}
-                   for router in neutron_routers]
+                   for router in neutron_routers if self._changed(router)]
         self.add_resource_url('horizon:project:routers:detail', routers)
         return routers
 
@@ -322,7 +371,8 @@ class JSONView(View):
                   'device_owner': port.device_owner,
                   'status': port.status}
                  for port in neutron_ports
-                 if port.device_owner != 'network:router_ha_interface']
+                 if port.device_owner != 'network:router_ha_interface'
+                 and self._changed(port)]
         self.add_resource_url('horizon:project:networks:ports:detail',
                               ports)
         return ports
@@ -349,10 +399,37 @@ class JSONView(View):
             ports.append(fake_port)
 
     def get(self, request, *args, **kwargs):
-        data = {'servers': self._get_servers(request),
-                'networks': self._get_networks(request),
-                'ports': self._get_ports(request),
-                'routers': self._get_routers(request)}
+        """Returns the topology as JSON.
+
+        When the ``changes_since`` query parameter holds the ``timestamp``
+        of a previous response, only the objects changed since then are
+        returned, along with the IDs of the servers deleted meanwhile.
+        """
+        timestamp = timezone.now()
+        self.changes_since = None
+        changes_since = request.GET.get('changes_since')
+        if changes_since:
+            try:
+                self.changes_since = dateparse.parse_datetime(changes_since)
+            except ValueError:
+                pass
+            if (self.changes_since is not None
+                    and timezone.is_naive(self.changes_since)):
+                self.changes_since = timezone.make_aware(self.changes_since,
+                                                         timezone.utc)
+        self.deleted_servers = []
+
+        # The sections come from independent API calls, build them
+        # concurrently.
+        sections = ('servers', 'networks', 'ports', 'routers')
+        calls = parallel.call_parallel(
+            [parallel.Call(getattr(self, '_get_%s' % section), (request,),
+                           name=section)
+             for section in sections])
+        data = dict((call.name, call.get()) for call in calls)
         self._prepare_gateway_ports(data['routers'], data['ports'])
+        data['timestamp'] = timestamp.isoformat()
+        if self.changes_since is not None:
+            data['deleted'] = {'servers': self.deleted_servers}
         json_string = json.dumps(data, ensure_ascii=False)
         return HttpResponse(json_string, content_type='text/json')
@@ -76,6 +76,7 @@ class DeleteSubnet(SubnetPolicyTargetMixin, CheckNetworkEditable,
     def delete(self, request, obj_id):
         try:
             api.neutron.subnet_delete(request, obj_id)
+            quotas.clear_quota_usages_cache(request)
         except Exception:
             msg = _('Failed to delete subnet %s') % obj_id
             LOG.info(msg)
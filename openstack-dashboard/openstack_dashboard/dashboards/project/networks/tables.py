@@ -74,6 +74,7 @@ class DeleteNetwork(policy.PolicyTargetMixin, CheckNetworkEditable,
                 api.neutron.subnet_delete(request, subnet_id)
                 LOG.debug('Deleted subnet %s', subnet_id)
             api.neutron.network_delete(request, network_id)
+            quotas.clear_quota_usages_cache(request)
             LOG.debug('Deleted network %s successfully', network_id)
         except Exception:
             msg = _('Failed to delete network %s')
@@ -27,7 +27,9 @@ from horizon import views
 from openstack_dashboard import usage
 
 
-class ProjectUsageCsvRenderer(csvbase.BaseCsvResponse):
+class ProjectUsageCsvRenderer(csvbase.BaseCsvStreamingResponse):
+
+    gzip = True
 
     columns = [_("Instance Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)"),
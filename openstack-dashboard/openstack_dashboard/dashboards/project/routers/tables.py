@@ -63,6 +63,7 @@ class DeleteRouter(policy.PolicyTargetMixin, tables.DeleteAction):
                 api.neutron.router_remove_interface(request, obj_id,
                                                     port_id=port.id)
             api.neutron.router_delete(request, obj_id)
+            quotas.clear_quota_usages_cache(request)
         except q_ext.NeutronClientException as e:
             msg = _('Unable to delete router "%s"') % e
             LOG.info(msg)
@@ -25,6 +25,7 @@ from openstack_dashboard import api
 from openstack_dashboard.api import base
 from openstack_dashboard.api import cinder
 from openstack_dashboard import policy
+from openstack_dashboard.usage import quotas
 
 from openstack_dashboard.dashboards.project.volumes \
     .volumes import tables as volume_tables
@@ -72,6 +73,7 @@ class DeleteVolumeSnapshot(policy.PolicyTargetMixin, tables.DeleteAction):
 
     def delete(self, request, obj_id):
         api.cinder.volume_snapshot_delete(request, obj_id)
+        quotas.clear_quota_usages_cache(request)
 
 
 class EditVolumeSnapshot(policy.PolicyTargetMixin, tables.LinkAction):
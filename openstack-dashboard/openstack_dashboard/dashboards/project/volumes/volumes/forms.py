@@ -392,6 +392,7 @@ class CreateForm(forms.SelfHandlingForm):
                                           metadata=metadata,
                                           availability_zone=az,
                                           source_volid=volume_id)
+            quotas.clear_quota_usages_cache(request)
             message = _('Creating volume "%s"') % data['name']
             messages.info(request, message)
             return volume
@@ -522,6 +523,7 @@ class CreateSnapshotForm(forms.SelfHandlingForm):
                                                      data['name'],
                                                      data['description'],
                                                      force=force)
+            quotas.clear_quota_usages_cache(request)
 
             messages.info(request, message)
             return snapshot
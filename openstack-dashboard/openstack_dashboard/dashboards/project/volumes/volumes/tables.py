@@ -31,6 +31,7 @@ from horizon import tables
 from openstack_dashboard import api
 from openstack_dashboard.api import cinder
 from openstack_dashboard import policy
+from openstack_dashboard.usage import quotas
 
 
 DELETABLE_STATES = ("available", "error", "error_extending")
@@ -83,6 +84,7 @@ class DeleteVolume(VolumePolicyTargetMixin, tables.DeleteAction):
 
     def delete(self, request, obj_id):
         cinder.volume_delete(request, obj_id)
+        quotas.clear_quota_usages_cache(request)
 
     def allowed(self, request, volume=None):
         if volume:
@@ -42,6 +42,12 @@ ALLOWED_HOSTS = ['horizon.example.com','localhost','*','192.168.215.1', ]
 #CSRF_COOKIE_SECURE = True
 #SESSION_COOKIE_SECURE = True
 
+# The time of the last activity of a user, used to expire idle sessions
+# after SESSION_TIMEOUT seconds, is only saved in the session when it moved
+# on by at least this many seconds, saving session writes. Idle sessions may
+# thus expire up to this many seconds before SESSION_TIMEOUT.
+#SESSION_ACTIVITY_GRANULARITY = 60
+
 # Overrides for OpenStack API versions. Use this setting to force the
 # OpenStack dashboard to use a specific API version for a given service API.
 # Versions specified here should be integers or floats, not strings.
@@ -327,9 +333,55 @@ API_RESULT_PAGE_SIZE = 20
 # The size of chunk in bytes for downloading objects from Swift
 SWIFT_FILE_TRANSFER_CHUNK_SIZE = 512 * 1024
 
+# Objects larger than SWIFT_UPLOAD_SEGMENT_SIZE bytes are uploaded in segments
+# of that size, at most SWIFT_UPLOAD_SEGMENT_CONCURRENCY at a time, and
+# joined by a static large object manifest. Set the size to 0 to always
+# upload objects in one piece.
+#SWIFT_UPLOAD_SEGMENT_SIZE = 1024 * 1024 * 1024
+#SWIFT_UPLOAD_SEGMENT_CONCURRENCY = 4
+
 # Specify a maximum number of items to display in a dropdown.
 DROPDOWN_MAX_ITEMS = 30
 
+# The maximum number of threads a single page may use to call independent
+# OpenStack APIs concurrently.
+#HORIZON_PARALLEL_MAX_WORKERS = 8
+
+# The number of seconds the quota usages of a project are cached for. Usages
+# are refreshed as soon as resources are created or deleted through the
+# dashboard; set to 0 to disable the cache.
+#QUOTA_USAGES_CACHE_TIMEOUT = 30
+
+# Ceilometer statistics are gathered on a bounded pool of worker threads.
+# CEILOMETER_MAX_WORKERS defaults to HORIZON_PARALLEL_MAX_WORKERS, resources
+# not processed within CEILOMETER_STATISTICS_TIMEOUT seconds are skipped and
+# CEILOMETER_API_TIMEOUT is the HTTP timeout of each Ceilometer API call.
+#CEILOMETER_MAX_WORKERS = 8
+#CEILOMETER_STATISTICS_TIMEOUT = 120
+#CEILOMETER_API_TIMEOUT = 30
+
+# Results of API calls which rarely change (flavors, service extensions) are
+# shared between requests and processes through the API_CACHE_ALIAS cache for
+# API_CACHE_TIMEOUT seconds; set it to 0 to disable the cache. Results larger
+# than API_CACHE_MAX_VALUE_SIZE bytes are never cached.
+#API_CACHE_ALIAS = 'default'
+#API_CACHE_TIMEOUT = 60
+#API_CACHE_MAX_VALUE_SIZE = 1048576
+
+# Every function decorated with @memoized keeps at most this many results per
+# process, evicting the least recently used ones; 0 means no limit.
+#HORIZON_MEMOIZED_MAXSIZE = 1000
+
+# API clients, and the HTTP connections they keep alive, are reused by the
+# requests made with the same token until it expires. At most this many
+# clients are kept per process; set to 0 to build new clients for every
+# request.
+#API_CLIENT_POOL_SIZE = 100
+
+# Streaming CSV exports (e.g. usage reports) are sent in chunks of about
+# this many bytes.
+#CSV_STREAMING_CHUNK_SIZE = 65536
+
 # The timezone of the server. This should correspond with the timezone
 # of your entire OpenStack installation, and hopefully be in UTC.
 TIME_ZONE = "UTC"
@@ -388,6 +440,11 @@ POLICY_FILES_PATH = '/etc/openstack-dashboard'
 #    'telemetry': 'ceilometer_policy.json',
 #}
 
+# Policy files are parsed once per process and checked for changes on disk
+# at most once every POLICY_FILES_RELOAD_INTERVAL seconds; None disables the
+# check, changed files are then only picked up on restart.
+#POLICY_FILES_RELOAD_INTERVAL = 30
+
 # Trove user and database extension support. By default support for
 # creating users and databases on database instances is turned on.
 # To disable these extensions set the permission here to something
@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import optparse
+import time
+
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+from django import http
+from openstack_auth import user as auth_user
+from openstack_auth import utils as auth_utils
+
+from openstack_dashboard import policy_backend
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '-n', '--iterations',
+            type='int',
+            dest='iterations',
+            default=1000,
+            help='Number of warm policy checks to time (default: 1000).',
+        ),
+        optparse.make_option(
+            '--cold-iterations',
+            type='int',
+            dest='cold_iterations',
+            default=10,
+            help=('Number of times to reset the enforcers and time the '
+                  'first policy check (default: 10).'),
+        ),
+        optparse.make_option(
+            '--rows',
+            type='int',
+            dest='rows',
+            default=100,
+            help=('Number of table rows, every target appearing twice, '
+                  'to check at once with check_many (default: 100).'),
+        ),
+        optparse.make_option(
+            '--rule',
+            dest='rule',
+            default='identity:admin_required',
+            help=('Rule to check, as "<service>:<action>" '
+                  '(default: identity:admin_required).'),
+        ),
+    )
+
+    help = ("Measures the cost of a policy check on a cold process, which "
+            "has to load the policy files first, against a warm one.")
+
+    def handle(self, *args, **options):
+        scope, _sep, action = options['rule'].partition(':')
+        if not action:
+            raise CommandError('--rule must be given as <service>:<action>')
+        if scope not in policy_backend.warm_up():
+            raise CommandError('No policy file loaded for service "%s"'
+                               % scope)
+        actions = ((scope, action),)
+        user = auth_user.User(id='benchmark', user='benchmark',
+                              tenant_id='benchmark', tenant_name='benchmark',
+                              roles=[{'name': '_member_'}], enabled=True)
+
+        # Policy checks look the user up from the request's session, which
+        # a benchmark has none of; hand them the benchmark user instead.
+        get_user = auth_utils.get_user
+        auth_utils.get_user = lambda request: user
+        try:
+            cold = []
+            for i in range(options['cold_iterations']):
+                policy_backend.reset()
+                start = time.time()
+                policy_backend.check(actions, http.HttpRequest())
+                cold.append(time.time() - start)
+
+            # Every check gets a new request, as the decisions are cached
+            # for the lifetime of one.
+            policy_backend.warm_up()
+            start = time.time()
+            for i in range(options['iterations']):
+                policy_backend.check(actions, http.HttpRequest())
+            warm = (time.time() - start) / max(1, options['iterations'])
+
+            targets = [{'project_id': 'project-%d' % (i // 2)}
+                       for i in range(options['rows'])]
+            start = time.time()
+            policy_backend.check_many(actions, http.HttpRequest(), targets)
+            many = time.time() - start
+        finally:
+            auth_utils.get_user = get_user
+
+        self.stdout.write("cold check: %.3f ms (mean of %d)"
+                          % (1000 * sum(cold) / max(1, len(cold)),
+                             len(cold)))
+        self.stdout.write("warm check: %.3f ms (mean of %d)"
+                          % (1000 * warm, options['iterations']))
+        self.stdout.write("check_many of %d rows: %.3f ms"
+                          % (len(targets), 1000 * many))
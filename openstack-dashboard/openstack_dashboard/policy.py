@@ -26,6 +26,21 @@ def check(actions, request, target=None):
     return True
 
 
+def check_many(actions, request, targets):
+    """Wrapper of the configurable bulk policy method.
+
+    Returns a list of booleans, one for each of ``targets``.
+    """
+
+    policy_check = getattr(settings, "POLICY_CHECK_FUNCTION", None)
+    policy_check_many = getattr(settings, "POLICY_CHECK_MANY_FUNCTION", None)
+
+    if policy_check and policy_check_many:
+        return policy_check_many(actions, request, targets)
+
+    return [check(actions, request, target) for target in targets]
+
+
 class PolicyTargetMixin(object):
     """Mixin that adds the get_policy_target function
 
@@ -15,6 +15,8 @@
 
 import logging
 import os.path
+import threading
+import time
 
 from django.conf import settings
 from openstack_auth import utils as auth_utils
@@ -34,31 +36,95 @@ CONF.policy_dirs = []
 
 _ENFORCER = None
 _BASE_PATH = getattr(settings, 'POLICY_FILES_PATH', '')
+# Modification time of the policy file each enforcer was loaded from.
+_MTIMES = {}
+_LAST_RELOAD_CHECK = 0
+_LOCK = threading.Lock()
+
+
+def _load_rules(service, enforcer):
+    """Parses the policy file of the enforcer now rather than on its first
+    enforce() call, and stops enforce() from checking the file again on
+    every call; :func:`_maybe_reload` takes care of that instead.
+    """
+    try:
+        _MTIMES[service] = os.path.getmtime(enforcer.policy_path)
+    except OSError:
+        _MTIMES[service] = None
+    enforcer.load_rules(force_reload=True)
+    enforcer.use_conf = False
+
+
+def _reload_due():
+    interval = getattr(settings, 'POLICY_FILES_RELOAD_INTERVAL', 30)
+    return (interval is not None and
+            time.time() - _LAST_RELOAD_CHECK >= interval)
+
+
+def _maybe_reload(enforcers):
+    """Reloads the policy files which changed on disk, checking at most
+    once per ``POLICY_FILES_RELOAD_INTERVAL`` seconds.
+    """
+    global _LAST_RELOAD_CHECK
+    if not _reload_due():
+        return
+    _LAST_RELOAD_CHECK = time.time()
+    for service, enforcer in enforcers.items():
+        try:
+            mtime = os.path.getmtime(enforcer.policy_path)
+        except OSError:
+            continue
+        if mtime != _MTIMES.get(service):
+            LOG.info("reloading policy file for service: %s" % service)
+            _load_rules(service, enforcer)
 
 
 def _get_enforcer():
-    global _ENFORCER
-    if not _ENFORCER:
-        _ENFORCER = {}
-        policy_files = getattr(settings, 'POLICY_FILES', {})
-        for service in policy_files.keys():
-            policy_path = os.path.join(_BASE_PATH,
-                                       policy_files[service])
-            if os.path.isfile(policy_path):
-                LOG.debug("adding enforcer for service: %s" % service)
-                enforcer = policy.Enforcer(CONF)
-                CONF.oslo_policy.policy_dirs = []
-                enforcer.policy_path = policy_path
-                _ENFORCER[service] = enforcer
-            else:
-                LOG.warn("policy file for service: %s not found at %s" %
-                         (service, policy_path))
+    global _ENFORCER, _LAST_RELOAD_CHECK
+    # Every policy check of every table row ends up here, only take the
+    # lock when the enforcers have to be loaded or checked for changes.
+    enforcers = _ENFORCER
+    if enforcers and not _reload_due():
+        return enforcers
+    with _LOCK:
+        if not _ENFORCER:
+            enforcers = {}
+            policy_files = getattr(settings, 'POLICY_FILES', {})
+            for service in policy_files.keys():
+                policy_path = os.path.join(_BASE_PATH,
+                                           policy_files[service])
+                if os.path.isfile(policy_path):
+                    LOG.debug("adding enforcer for service: %s" % service)
+                    enforcer = policy.Enforcer(CONF)
+                    CONF.oslo_policy.policy_dirs = []
+                    enforcer.policy_path = policy_path
+                    _load_rules(service, enforcer)
+                    enforcers[service] = enforcer
+                else:
+                    LOG.warn("policy file for service: %s not found at %s" %
+                             (service, policy_path))
+            _ENFORCER = enforcers
+            _LAST_RELOAD_CHECK = time.time()
+        else:
+            _maybe_reload(_ENFORCER)
     return _ENFORCER
 
 
+def warm_up():
+    """Loads the enforcers and parses all the policy files.
+
+    Meant to be called once when a server process starts, so the first
+    request served by each process doesn't pay for it.
+    """
+    return _get_enforcer()
+
+
 def reset():
-    global _ENFORCER
-    _ENFORCER = None
+    global _ENFORCER, _LAST_RELOAD_CHECK
+    with _LOCK:
+        _ENFORCER = None
+        _MTIMES.clear()
+        _LAST_RELOAD_CHECK = 0
 
 
 def check(actions, request, target=None):
@@ -97,6 +163,11 @@ def check(actions, request, target=None):
                       representing the location of the object e.g.
                       {'project_id': object.project_id}
     :returns: boolean if the user has permission or not for the actions.
+
+    Decisions are cached for the lifetime of the request, keyed on the
+    scope, the action, the target and the user's credentials, so checking
+    the same actions for many rows of a table only evaluates the policy
+    rules once per distinct target.
     """
 
     if target is None:
@@ -125,29 +196,90 @@ def check(actions, request, target=None):
     credentials = _user_to_credentials(request, user)
 
     enforcer = _get_enforcer()
+    decisions, stats = _get_decision_cache(request)
+    target_key = _target_key(target)
 
     for action in actions:
         scope, action = action[0], action[1]
         if scope in enforcer:
-            # if any check fails return failure
-            if not enforcer[scope].enforce(action, target, credentials):
-                # to match service implementations, if a rule is not found,
-                # use the default rule for that service policy
-                #
-                # waiting to make the check because the first call to
-                # enforce loads the rules
-                if action not in enforcer[scope].rules:
-                    if not enforcer[scope].enforce('default',
-                                                   target, credentials):
+            key = None
+            if target_key is not None:
+                key = (scope, action, target_key, user._credentials_key)
+                if key in decisions:
+                    stats['cached'] += 1
+                    if not decisions[key]:
                         return False
-                else:
-                    return False
+                    continue
+            allowed = _enforce(enforcer[scope], action, target, credentials)
+            stats['enforced'] += 1
+            if key is not None:
+                decisions[key] = allowed
+            # if any check fails return failure
+            if not allowed:
+                return False
         # if no policy for scope, allow action, underlying API will
         # ultimately block the action if not permitted, treat as though
         # allowed
     return True
 
 
+def check_many(actions, request, targets):
+    """Check user permission for the same actions on several targets.
+
+    Returns a list of booleans, one for each of ``targets``, as
+    :func:`check` would for that target. Equal targets are only checked
+    once; tables use this to check an action for all their rows at once.
+    """
+    results = []
+    checked = {}
+    for target in targets:
+        key = _target_key(target or {})
+        if key is not None and key in checked:
+            results.append(checked[key])
+            continue
+        allowed = check(actions, request, target)
+        if key is not None:
+            checked[key] = allowed
+        results.append(allowed)
+    return results
+
+
+def get_stats(request):
+    """Returns the number of policy decisions evaluated (``enforced``) and
+    served from the cache (``cached``) for the given request.
+    """
+    return dict(_get_decision_cache(request)[1])
+
+
+def _enforce(enforcer, action, target, credentials):
+    if enforcer.enforce(action, target, credentials):
+        return True
+    # to match service implementations, if a rule is not found,
+    # use the default rule for that service policy
+    if action not in enforcer.rules:
+        return enforcer.enforce('default', target, credentials)
+    return False
+
+
+def _get_decision_cache(request):
+    if not hasattr(request, "_policy_decisions"):
+        request._policy_decisions = {}
+        request._policy_stats = {'enforced': 0, 'cached': 0}
+    return request._policy_decisions, request._policy_stats
+
+
+def _target_key(target):
+    """Returns a hashable representation of target, or None if it has
+    unhashable values and its decisions can't be cached.
+    """
+    try:
+        key = tuple(sorted(target.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def _user_to_credentials(request, user):
     if not hasattr(user, "_credentials"):
         roles = [role['name'] for role in user.roles]
@@ -159,4 +291,11 @@ def _user_to_credentials(request, user):
                              'domain_id': user.user_domain_id,
                              'is_admin': user.is_superuser,
                              'roles': roles}
+    if not hasattr(user, "_credentials_key"):
+        credentials = user._credentials
+        user._credentials_key = (credentials['user_id'],
+                                 credentials['project_id'],
+                                 credentials['domain_id'],
+                                 credentials['is_admin'],
+                                 tuple(sorted(credentials['roles'])))
     return user._credentials
@@ -18,7 +18,11 @@
 
 from __future__ import absolute_import
 
+import datetime
+
 from django.conf import settings
+from django.test.utils import override_settings
+from django.utils import timezone
 
 from horizon import exceptions
 
@@ -241,6 +245,43 @@ class ApiHelperTests(test.TestCase):
             url = api_base.url_for(self.request, 'image')
 
 
+class ClientPoolTests(test.TestCase):
+    def setUp(self):
+        super(ClientPoolTests, self).setUp()
+        api_base.client_pool.clear()
+        self.built = []
+
+        @api_base.pooled_client('compute')
+        def client(request):
+            self.built.append(request)
+            return object()
+        self.client = client
+
+    @override_settings(API_CLIENT_POOL_SIZE=10)
+    def test_client_reused_per_token(self):
+        first = self.client(self.request)
+        self.assertIs(first, self.client(self.request))
+        self.assertEqual(1, len(self.built))
+
+        api_base.client_pool.clear(token_id=self.request.user.token.id)
+        self.assertIsNot(first, self.client(self.request))
+        self.assertEqual(2, len(self.built))
+
+    @override_settings(API_CLIENT_POOL_SIZE=10)
+    def test_client_dropped_when_token_expired(self):
+        token = self.request.user.token
+        token.expires = timezone.now() - datetime.timedelta(seconds=1)
+        self.client(self.request)
+        self.client(self.request)
+        self.assertEqual(2, len(self.built))
+
+    @override_settings(API_CLIENT_POOL_SIZE=0)
+    def test_client_pool_disabled(self):
+        self.client(self.request)
+        self.client(self.request)
+        self.assertEqual(2, len(self.built))
+
+
 class QuotaSetTests(test.TestCase):
 
     def test_quotaset_add_with_plus(self):
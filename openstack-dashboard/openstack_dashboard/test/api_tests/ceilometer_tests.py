@@ -12,7 +12,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+import time
+
 from django import http
+from django.test.utils import override_settings
 
 from mox3.mox import IsA  # noqa
 
@@ -319,3 +323,60 @@ class CeilometerApiTests(test.APITestCase):
                          vars(statistic_obj))
 
         self.assertEqual(len(resources), len(data))
+
+    def test_update_with_statistics_cancelled(self):
+        resource = api.ceilometer.Resource(self.resources.first())
+
+        ceilometerclient = self.stub_ceilometerclient()
+        ceilometerclient.statistics = self.mox.CreateMockAnything()
+        ceilometerclient.statistics.list(meter_name='fake_meter_1',
+                                         period=None, q=IsA(list)).\
+            AndReturn(self.statistics.list())
+        self.mox.ReplayAll()
+
+        checks = []
+
+        def cancelled():
+            # Cancelled while the first meter is being queried.
+            checks.append(True)
+            return len(checks) > 1
+
+        ceilometer_usage = api.ceilometer.CeilometerUsage(http.HttpRequest)
+        ceilometer_usage.update_with_statistics(
+            resource, meter_names=['fake_meter_1', 'fake_meter_2'],
+            cancelled=cancelled)
+
+        self.assertEqual({}, resource.meters)
+
+    @override_settings(CEILOMETER_MAX_WORKERS=2)
+    def test_threaded_update_resource_with_statistics_is_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        class FakeResource(object):
+            def __init__(self, id):
+                self.id = id
+                self.meters = None
+
+        class FakeUsage(object):
+            def update_with_statistics(self, resource, meter_names=None,
+                                       **kwargs):
+                with lock:
+                    state['running'] += 1
+                    state['peak'] = max(state['peak'], state['running'])
+                time.sleep(0.01)
+                with lock:
+                    state['running'] -= 1
+                if resource.id == 'broken':
+                    raise Exception('statistics unavailable')
+                resource.meters = meter_names
+
+        resources = [FakeResource(str(i)) for i in range(8)]
+        resources.append(FakeResource('broken'))
+        api.ceilometer.ThreadedUpdateResourceWithStatistics.process_list(
+            FakeUsage(), resources, meter_names=['fake_meter_1'])
+
+        self.assertLessEqual(state['peak'], 2)
+        self.assertEqual([['fake_meter_1']] * 8,
+                         [resource.meters for resource in resources[:8]])
+        self.assertIsNone(resources[-1].meters)
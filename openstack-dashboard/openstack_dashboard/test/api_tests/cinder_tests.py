@@ -12,7 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django.core.cache import caches
 from django.test.utils import override_settings
+import mock
 import six
 
 import cinderclient as cinder_client
@@ -68,6 +70,25 @@ class CinderApiTests(test.APITestCase):
 
         api.cinder.volume_snapshot_list(self.request, search_opts=search_opts)
 
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_list_extensions_no_volumev2_configured(self):
+        # The cache key is built from the endpoint the cinder client uses,
+        # which falls back when there is no volumev2 endpoint.
+        for service in list(self.service_catalog):
+            if service["type"] == "volumev2":
+                self.service_catalog.remove(service)
+        self.addCleanup(caches['default'].clear)
+        self.stub_cinderclient()
+        self.mox.ReplayAll()
+
+        extensions = [api.cinder.cinder_list_extensions.ListExtResource(
+            None, {'name': 'SchedulerHints'}, loaded=True)]
+        with mock.patch.object(
+                api.cinder.cinder_list_extensions.ListExtManager, 'show_all',
+                return_value=extensions):
+            self.assertTrue(api.cinder.extension_supported(self.request,
+                                                           'SchedulerHints'))
+
     def test_volume_type_list_with_qos_associations(self):
         volume_types = self.cinder_volume_types.list()
         # Due to test data limitations, we can only run this test using
@@ -18,6 +18,7 @@
 
 from django.conf import settings
 from django.test.utils import override_settings
+from glanceclient import exc as glance_exceptions
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
@@ -247,3 +248,21 @@ class GlanceApiTests(test.APITestCase):
         self.mox.ReplayAll()
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
+
+    def test_image_get_many(self):
+        images = self.images.list()[:2]
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        for image in images:
+            glanceclient.images.get(image.id).InAnyOrder() \
+                .AndReturn(image)
+        glanceclient.images.get('deleted').InAnyOrder() \
+            .AndRaise(glance_exceptions.HTTPNotFound())
+        glanceclient.images.get('private').InAnyOrder() \
+            .AndRaise(glance_exceptions.HTTPForbidden())
+        self.mox.ReplayAll()
+
+        image_ids = [images[1].id, None, 'deleted', images[0].id,
+                     'private', images[1].id]
+        found = api.glance.image_get_many(self.request, image_ids)
+        self.assertEqual([images[1], images[0]], found)
@@ -18,6 +18,8 @@
 
 from __future__ import absolute_import
 
+from django.test.utils import override_settings
+from keystoneclient import exceptions as keystone_exceptions
 from keystoneclient.v2_0 import client as keystone_client
 import six
 
@@ -72,6 +74,51 @@ class RoleAPITests(test.APITestCase):
         self.mox.ReplayAll()
         api.keystone.remove_tenant_user(self.request, tenant.id, self.user.id)
 
+    def test_diff_role_assignments(self):
+        current = {'1': ['1'], '2': ['1', '2'], '3': ['2']}
+        wanted = {'1': ['1', '2'], '3': [], '4': ['2']}
+        grants, revokes = api.keystone.diff_role_assignments(current, wanted)
+        self.assertEqual([('1', '2'), ('4', '2')], grants)
+        self.assertEqual([('2', '1'), ('2', '2'), ('3', '2')], revokes)
+
+    def test_apply_project_role_changes(self):
+        keystoneclient = self.stub_keystoneclient()
+        tenant = self.tenants.first()
+
+        keystoneclient.roles = self.mox.CreateMockAnything()
+        keystoneclient.roles.grant('1', domain=None, group=None,
+                                   project=tenant.id, user='1') \
+            .InAnyOrder().AndRaise(self.exceptions.keystone)
+        keystoneclient.roles.grant('2', domain=None, group=None,
+                                   project=tenant.id, user='2') \
+            .InAnyOrder()
+        keystoneclient.roles.revoke('1', domain=None, group=None,
+                                    project=tenant.id, user='3') \
+            .InAnyOrder()
+        self.mox.ReplayAll()
+
+        # Every change is attempted, the failed ones are returned.
+        failed = api.keystone.apply_project_role_changes(
+            self.request, tenant.id, grants=[('1', '1'), ('2', '2')],
+            revokes=[('3', '1')])
+        self.assertEqual(['1'], [call.name for call in failed])
+
+    def test_apply_domain_role_changes(self):
+        keystoneclient = self.stub_keystoneclient()
+        domain = self.domains.first()
+
+        keystoneclient.roles = self.mox.CreateMockAnything()
+        keystoneclient.roles.grant(role='1', group='1', domain=domain.id,
+                                   project=None).InAnyOrder()
+        keystoneclient.roles.revoke(role='2', group='2', project=None,
+                                    domain=domain.id).InAnyOrder()
+        self.mox.ReplayAll()
+
+        failed = api.keystone.apply_domain_role_changes(
+            self.request, domain.id, grants=[('1', '1')],
+            revokes=[('2', '2')], group=True)
+        self.assertEqual([], failed)
+
     def test_get_default_role(self):
         keystoneclient = self.stub_keystoneclient()
         keystoneclient.roles = self.mox.CreateMockAnything()
@@ -84,6 +131,32 @@ class RoleAPITests(test.APITestCase):
         role = api.keystone.get_default_role(self.request)
 
 
+class TenantAPITests(test.APITestCase):
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_tenant_names(self):
+        tenant = self.tenants.first()
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.projects = self.mox.CreateMockAnything()
+        keystoneclient.projects.get(tenant.id).InAnyOrder() \
+            .AndReturn(tenant)
+        keystoneclient.projects.get('deleted').InAnyOrder() \
+            .AndRaise(keystone_exceptions.NotFound())
+        keystoneclient.projects.get('forbidden').InAnyOrder() \
+            .AndRaise(keystone_exceptions.Forbidden())
+        self.mox.ReplayAll()
+        self.addCleanup(api.keystone._tenant_name_cache().delete,
+                        api.keystone._tenant_name_cache_key(self.request,
+                                                            tenant.id))
+
+        names = api.keystone.tenant_names(self.request,
+                                          [tenant.id, 'deleted', 'forbidden',
+                                           tenant.id])
+        self.assertEqual({tenant.id: tenant.name}, names)
+        # The name of the project is served from the cache now.
+        names = api.keystone.tenant_names(self.request, [tenant.id, None])
+        self.assertEqual({tenant.id: tenant.name}, names)
+
+
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
         catalog = self.service_catalog
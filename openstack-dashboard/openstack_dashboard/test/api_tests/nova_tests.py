@@ -19,6 +19,8 @@
 
 from __future__ import absolute_import
 
+import copy
+
 from django.conf import settings
 from django import http
 from django.test.utils import override_settings
@@ -212,6 +214,55 @@ class ComputeApiTests(test.APITestCase):
         ret_val = api.nova.server_get(self.request, server.id)
         self.assertIsInstance(ret_val, api.nova.Server)
 
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_keypair_list_cached_until_changed(self):
+        self.addCleanup(api.nova.keypair_list_cached.invalidate_all)
+        keypair = self.keypairs.first()
+
+        novaclient = self.stub_novaclient()
+        novaclient.keypairs = self.mox.CreateMockAnything()
+        novaclient.keypairs.list().AndReturn([keypair])
+        novaclient.keypairs.list().AndReturn([keypair])
+        novaclient.keypairs.delete(keypair.id)
+        novaclient.keypairs.list().AndReturn([])
+        self.mox.ReplayAll()
+
+        ret_val = api.nova.keypair_list_cached(self.request)
+        self.assertEqual([keypair.name], [kp.name for kp in ret_val])
+        # Served from the cache.
+        ret_val = api.nova.keypair_list_cached(self.request)
+        self.assertEqual([keypair.name], [kp.name for kp in ret_val])
+        # The uncached listing still asks Nova.
+        ret_val = api.nova.keypair_list(self.request)
+        self.assertEqual([keypair.name], [kp.name for kp in ret_val])
+
+        api.nova.keypair_delete(self.request, keypair.id)
+        self.assertEqual([], api.nova.keypair_list_cached(self.request))
+
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_flavor_list_cached_per_roles(self):
+        self.addCleanup(api.nova.flavor_list.invalidate_all)
+        flavors = self.flavors.list()
+        public_flavors = [f for f in flavors
+                          if getattr(f, 'os-flavor-access:is_public', True)]
+
+        novaclient = self.stub_novaclient()
+        novaclient.flavors = self.mox.CreateMockAnything()
+        novaclient.flavors.list(is_public=None).AndReturn(flavors)
+        novaclient.flavors.list(is_public=None).AndReturn(public_flavors)
+        self.mox.ReplayAll()
+
+        self.request.user.roles = [self.roles.admin._info]
+        ret_val = api.nova.flavor_list(self.request, is_public=None)
+        self.assertEqual(len(flavors), len(ret_val))
+
+        # A member of the same project does not get the admin's listing.
+        member_request = copy.copy(self.request)
+        member_request.user = copy.copy(self.request.user)
+        member_request.user.roles = [self.roles.member._info]
+        ret_val = api.nova.flavor_list(member_request, is_public=None)
+        self.assertEqual(len(public_flavors), len(ret_val))
+
     def _test_absolute_limits(self, values, expected_results):
         limits = self.mox.CreateMockAnything()
         limits.absolute = []
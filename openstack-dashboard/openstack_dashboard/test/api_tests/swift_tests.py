@@ -18,7 +18,14 @@
 
 from __future__ import absolute_import
 
+import json
+import threading
+
+from django.test.utils import override_settings
+import mock
+from mox3.mox import IgnoreArg  # noqa
 from mox3.mox import IsA  # noqa
+import six
 
 from horizon import exceptions
 
@@ -27,6 +34,20 @@ from openstack_dashboard.test import helpers as test
 
 
 class SwiftApiTests(test.APITestCase):
+    @mock.patch.object(api.swift, '_swift_connection',
+                       side_effect=lambda request: object())
+    def test_swift_api_per_thread(self, mock_connection):
+        connection = api.swift.swift_api(self.request)
+        self.assertIs(connection, api.swift.swift_api(self.request))
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(api.swift.swift_api(self.request)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(connection, other[0])
+        self.assertEqual(2, mock_connection.call_count)
+
     def test_swift_get_containers(self):
         containers = self.containers.list()
         cont_data = [c._apidict for c in containers]
@@ -153,6 +174,25 @@ class SwiftApiTests(test.APITestCase):
             self.request, container.name, object.name)
         self.assertEqual(object.name, obj.name)
 
+    def test_swift_get_object_not_modified(self):
+        container = self.containers.first()
+        object = self.objects.first()
+        exc = api.swift.swiftclient.client.ClientException(
+            'Not Modified', http_status=304)
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_object(
+            container.name, object.name, resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'If-None-Match': '"abc"'}, response_dict={}
+        ).AndRaise(exc)
+        self.mox.ReplayAll()
+
+        obj = api.swift.swift_get_object(
+            self.request, container.name, object.name,
+            headers={'If-None-Match': '"abc"'})
+        self.assertEqual(304, obj.status)
+        self.assertIsNone(obj.data)
+
     def test_swift_get_object_without_data(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -227,6 +267,83 @@ class SwiftApiTests(test.APITestCase):
                                       obj.name,
                                       test_file)
 
+    @override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=10)
+    def test_swift_upload_segmented_object(self):
+        container = self.containers.first()
+        fake_name = 'fake_object.iso'
+        test_file = six.BytesIO(b'x' * 25)
+        test_file.name = fake_name
+        test_file.size = 25
+        segment_container = '%s_segments' % container.name
+
+        swift_api = self.stub_swiftclient(expected_calls=4)
+        swift_api.head_object(container.name, 'big').AndRaise(
+            self.exceptions.swift)
+        swift_api.put_container(segment_container)
+        for i, length in enumerate((10, 10, 5)):
+            swift_api.put_object(segment_container,
+                                 IsA(six.string_types),
+                                 test_file,
+                                 content_length=length,
+                                 chunk_size=api.swift.CHUNK_SIZE) \
+                .AndReturn('etag%d' % i)
+
+        def check_manifest(manifest):
+            manifest = json.loads(manifest)
+            self.assertEqual(['etag0', 'etag1', 'etag2'],
+                             [segment['etag'] for segment in manifest])
+            self.assertEqual([10, 10, 5],
+                             [segment['size_bytes'] for segment in manifest])
+            self.assertTrue(manifest[0]['path'].startswith(
+                '/%s/big/slo/' % segment_container))
+            return True
+
+        swift_api.put_object(
+            container.name, 'big', IgnoreArg(),
+            query_string='multipart-manifest=put',
+            headers={'X-Object-Meta-Orig-Filename': fake_name}) \
+            .WithSideEffects(lambda *args, **kwargs: check_manifest(args[2])) \
+            .AndReturn('manifest_etag')
+        self.mox.ReplayAll()
+
+        obj = api.swift.swift_upload_object(self.request, container.name,
+                                            'big', test_file)
+        self.assertEqual(25, obj.bytes)
+        self.assertEqual('manifest_etag', obj.etag)
+
+    @override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=10)
+    def test_swift_upload_segmented_object_manifest_failure(self):
+        container = self.containers.first()
+        test_file = six.BytesIO(b'x' * 25)
+        test_file.name = 'fake_object.iso'
+        test_file.size = 25
+        segment_container = '%s_segments' % container.name
+
+        swift_api = self.stub_swiftclient(expected_calls=4)
+        swift_api.head_object(container.name, 'big').AndRaise(
+            self.exceptions.swift)
+        swift_api.put_container(segment_container)
+        for i, length in enumerate((10, 10, 5)):
+            swift_api.put_object(segment_container,
+                                 IsA(six.string_types),
+                                 test_file,
+                                 content_length=length,
+                                 chunk_size=api.swift.CHUNK_SIZE) \
+                .AndReturn('etag%d' % i)
+        swift_api.put_object(
+            container.name, 'big', IgnoreArg(),
+            query_string='multipart-manifest=put',
+            headers=IgnoreArg()).AndRaise(self.exceptions.swift)
+        # The uploaded segments are cleaned up.
+        for i in range(3):
+            swift_api.delete_object(segment_container,
+                                    IsA(six.string_types))
+        self.mox.ReplayAll()
+
+        with self.assertRaises(api.swift.swiftclient.client.ClientException):
+            api.swift.swift_upload_object(self.request, container.name,
+                                          'big', test_file)
+
     def test_swift_upload_duplicate_object(self):
         container = self.containers.first()
         obj = self.objects.first()
@@ -269,6 +386,135 @@ class SwiftApiTests(test.APITestCase):
                                                  None)
         self.assertEqual(0, response['bytes'])
 
+    def test_swift_bulk_delete_with_middleware(self):
+        container = self.containers.first()
+        names = ['a', 'b', 'c d']
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_capabilities().AndReturn(
+            {'bulk_delete': {'max_deletes_per_request': 2}})
+        headers = {'Accept': 'application/json', 'Content-Type': 'text/plain'}
+        swift_api.post_account(
+            headers=headers, query_string='bulk-delete',
+            data=('/%s/a\n/%s/b\n' % (container.name, container.name))
+            .encode('utf-8')).AndReturn(({}, json.dumps(
+                {'Response Status': '200 OK', 'Number Deleted': 1,
+                 'Number Not Found': 1, 'Errors': []})))
+        swift_api.post_account(
+            headers=headers, query_string='bulk-delete',
+            data=('/%s/c%%20d\n' % container.name).encode('utf-8')) \
+            .AndReturn(({}, json.dumps(
+                {'Response Status': '400 Bad Request', 'Number Deleted': 0,
+                 'Errors': [['/%s/c%%20d' % container.name,
+                             '409 Conflict']]})))
+        self.mox.ReplayAll()
+
+        failures = api.swift.swift_bulk_delete(self.request, container.name,
+                                               names)
+        self.assertEqual(['c d'], failures)
+
+    def test_swift_bulk_delete_rejected(self):
+        container = self.containers.first()
+        names = ['a', 'b']
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_capabilities().AndReturn({'bulk_delete': {}})
+        swift_api.post_account(
+            headers=IgnoreArg(), query_string='bulk-delete',
+            data=IgnoreArg()).AndReturn(({}, json.dumps(
+                {'Response Status': '400 Bad Request', 'Number Deleted': 0,
+                 'Response Body': 'Invalid bulk delete.', 'Errors': []})))
+        self.mox.ReplayAll()
+
+        failures = api.swift.swift_bulk_delete(self.request, container.name,
+                                               names)
+        self.assertEqual(names, failures)
+
+    def test_swift_bulk_delete_old_swiftclient(self):
+        container = self.containers.first()
+        names = ['a', 'b']
+
+        swift_api = self.stub_swiftclient(expected_calls=3)
+        swift_api.get_capabilities().AndReturn({'bulk_delete': {}})
+        swift_api.post_account(
+            headers=IgnoreArg(), query_string='bulk-delete',
+            data=IgnoreArg()).AndRaise(TypeError('unexpected keyword'))
+        swift_api.delete_object(container.name, 'a').InAnyOrder()
+        swift_api.delete_object(container.name, 'b').InAnyOrder()
+        self.mox.ReplayAll()
+
+        failures = api.swift.swift_bulk_delete(self.request, container.name,
+                                               names)
+        self.assertEqual([], failures)
+
+    def test_swift_bulk_delete_without_middleware(self):
+        container = self.containers.first()
+        names = ['a', 'b', 'c']
+
+        swift_api = self.stub_swiftclient(expected_calls=4)
+        swift_api.get_capabilities().AndReturn({})
+        for name in names:
+            swift_api.head_object(container.name, name).InAnyOrder() \
+                .AndReturn({})
+        swift_api.delete_object(container.name, 'a').InAnyOrder()
+        swift_api.delete_object(container.name, 'b').InAnyOrder() \
+            .AndRaise(api.swift.swiftclient.client.ClientException(
+                'Not Found', http_status=404))
+        swift_api.delete_object(container.name, 'c').InAnyOrder() \
+            .AndRaise(api.swift.swiftclient.client.ClientException(
+                'Conflict', http_status=409))
+        self.mox.ReplayAll()
+
+        failures = api.swift.swift_bulk_delete(self.request, container.name,
+                                               names)
+        self.assertEqual(['c'], failures)
+
+    def test_swift_bulk_delete_static_large_objects(self):
+        container = self.containers.first()
+        names = ['a', 'b']
+
+        swift_api = self.stub_swiftclient(expected_calls=4)
+        swift_api.get_capabilities().AndReturn({'bulk_delete': {},
+                                                'slo': {}})
+        swift_api.head_object(container.name, 'a').InAnyOrder() \
+            .AndReturn({'x-static-large-object': 'True'})
+        swift_api.head_object(container.name, 'b').InAnyOrder() \
+            .AndReturn({})
+        # The static large object is deleted along with its segments.
+        swift_api.head_object(container.name, 'a') \
+            .AndReturn({'x-static-large-object': 'True'})
+        swift_api.delete_object(container.name, 'a',
+                                query_string='multipart-manifest=delete')
+        swift_api.post_account(
+            headers=IgnoreArg(), query_string='bulk-delete',
+            data=('/%s/b\n' % container.name).encode('utf-8')) \
+            .AndReturn(({}, json.dumps(
+                {'Response Status': '200 OK', 'Number Deleted': 1,
+                 'Errors': []})))
+        self.mox.ReplayAll()
+
+        failures = api.swift.swift_bulk_delete(self.request, container.name,
+                                               names)
+        self.assertEqual([], failures)
+
+    def test_swift_delete_static_large_object(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name, prefix='big', marker=None,
+                                limit=IgnoreArg(), delimiter='/',
+                                full_listing=True) \
+            .AndReturn(({}, [{'name': 'big', 'bytes': 25}]))
+        swift_api.get_capabilities().AndReturn({'slo': {}})
+        swift_api.head_object(container.name, 'big') \
+            .AndReturn({'x-static-large-object': 'True'})
+        swift_api.delete_object(container.name, 'big',
+                                query_string='multipart-manifest=delete')
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_object(self.request,
+                                                      container.name, 'big'))
+
     def test_swift_object_exists(self):
         container = self.containers.first()
         obj = self.objects.first()
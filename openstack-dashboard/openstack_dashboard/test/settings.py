@@ -225,6 +225,15 @@ POLICY_FILES = {
     'compute': 'nova_policy.json'
 }
 
+# Quota usages are mocked per test, don't let them leak between tests.
+QUOTA_USAGES_CACHE_TIMEOUT = 0
+
+# API calls are mocked per test, don't share their results between tests.
+API_CACHE_TIMEOUT = 0
+
+# API clients are mocked per test, build a new one every time.
+API_CLIENT_POOL_SIZE = 0
+
 # The openstack_auth.user.Token object isn't JSON-serializable ATM
 SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
 
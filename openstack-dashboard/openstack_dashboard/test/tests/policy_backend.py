@@ -11,6 +11,7 @@
 #    under the License.
 
 from django.test.utils import override_settings
+import mock
 
 from openstack_dashboard import policy
 from openstack_dashboard import policy_backend
@@ -62,6 +63,69 @@ class PolicyBackendTestCase(test.TestCase):
                              request=self.request)
         self.assertFalse(value)
 
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
+    def test_check_cached_per_request(self):
+        policy_backend.reset()
+        for i in range(3):
+            value = policy.check((("compute", "context_is_admin"),),
+                                 request=self.request,
+                                 target={'project_id': 'a'})
+            self.assertFalse(value)
+        policy.check((("compute", "context_is_admin"),),
+                     request=self.request, target={'project_id': 'b'})
+        stats = policy_backend.get_stats(self.request)
+        self.assertEqual(2, stats['enforced'])
+        self.assertEqual(2, stats['cached'])
+
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check,
+                       POLICY_CHECK_MANY_FUNCTION=policy_backend.check_many)
+    def test_check_many(self):
+        policy_backend.reset()
+        targets = [{'project_id': 'a'}, {'project_id': 'b'},
+                   {'project_id': 'a'}, None]
+        values = policy.check_many((("identity", "admin_required"),),
+                                   self.request, targets)
+        self.assertEqual([False] * 4, values)
+        stats = policy_backend.get_stats(self.request)
+        self.assertEqual(3, stats['enforced'])
+
+    def test_warm_up(self):
+        policy_backend.reset()
+        enforcer = policy_backend.warm_up()
+        self.assertEqual(2, len(enforcer))
+        for service in ('identity', 'compute'):
+            self.assertTrue(enforcer[service].rules)
+            self.assertFalse(enforcer[service].use_conf)
+            self.assertIsNotNone(policy_backend._MTIMES[service])
+
+    @override_settings(POLICY_FILES_RELOAD_INTERVAL=0)
+    def test_changed_policy_file_reloaded(self):
+        policy_backend.reset()
+        enforcer = policy_backend.warm_up()
+        mtime = policy_backend._MTIMES['compute']
+        policy_backend._MTIMES['compute'] = mtime - 1
+        enforcer['compute'].rules.clear()
+        policy_backend._get_enforcer()
+        self.assertEqual(mtime, policy_backend._MTIMES['compute'])
+        self.assertTrue(enforcer['compute'].rules)
+
+    @override_settings(POLICY_FILES_RELOAD_INTERVAL=3600)
+    def test_reload_check_rate_limited(self):
+        policy_backend.reset()
+        policy_backend.warm_up()
+        policy_backend._get_enforcer()
+        policy_backend._MTIMES['compute'] = 0
+        policy_backend._get_enforcer()
+        self.assertEqual(0, policy_backend._MTIMES['compute'])
+
+    @override_settings(POLICY_FILES_RELOAD_INTERVAL=3600)
+    def test_loaded_enforcer_lock_free(self):
+        policy_backend.reset()
+        enforcer = policy_backend.warm_up()
+        with mock.patch.object(policy_backend, '_LOCK') as lock:
+            self.assertIs(enforcer, policy_backend._get_enforcer())
+        self.assertFalse(lock.__enter__.called)
+
     @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
     def test_scope_not_found(self):
         policy_backend.reset()
@@ -19,7 +19,9 @@
 
 from __future__ import absolute_import
 
+from django.core.cache import cache
 from django import http
+from django.test.utils import override_settings
 from mox3.mox import IsA  # noqa
 
 from openstack_dashboard import api
@@ -133,6 +135,47 @@ class QuotaTests(test.APITestCase):
         self.assertIn('ram', quota_usages)
         self.assertIsNotNone(quota_usages.get('ram'))
 
+    @override_settings(QUOTA_USAGES_CACHE_TIMEOUT=30)
+    @test.create_stubs({api.nova: ('server_list',
+                                   'flavor_list',
+                                   'tenant_quota_get',),
+                        api.network: ('tenant_floating_ip_list',
+                                      'floating_ip_supported'),
+                        api.base: ('is_service_enabled',)})
+    def test_tenant_quota_usages_cached(self):
+        servers = [s for s in self.servers.list()
+                   if s.tenant_id == self.request.user.tenant_id]
+
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'volume').AndReturn(False)
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'network').AndReturn(False)
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
+            .AndReturn(self.quotas.first())
+        api.network.floating_ip_supported(IsA(http.HttpRequest)) \
+            .AndReturn(True)
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.floating_ips.list())
+        search_opts = {'tenant_id': self.request.user.tenant_id}
+        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts,
+                             all_tenants=True) \
+            .AndReturn([servers, False])
+
+        self.mox.ReplayAll()
+
+        cache_key = quotas._quota_usages_cache_key(
+            self.request, self.request.user.tenant_id)
+        cache.delete(cache_key)
+
+        quota_usages = quotas.tenant_quota_usages(self.request)
+        cached = cache.get(cache_key)
+        self.assertItemsEqual(quota_usages.usages, cached.usages)
+
+        quotas.clear_quota_usages_cache(self.request)
+        self.assertIsNone(cache.get(cache_key))
+
     @test.create_stubs({api.nova: ('server_list',
                                    'flavor_list',
                                    'tenant_quota_get',),
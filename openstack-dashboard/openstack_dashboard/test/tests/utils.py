@@ -16,6 +16,15 @@
 import datetime
 import uuid
 
+from django.core.cache import caches
+from django import http
+from django.test.utils import override_settings
+from django.utils import timezone
+import mock
+from mox3.mox import IsA  # noqa
+import pytz
+
+from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.utils import filters
 from openstack_dashboard.utils import metering
@@ -63,3 +72,71 @@ class UtilsMeteringTests(test.TestCase):
     def test_calc_date_args_invalid(self):
         self.assertRaises(
             ValueError, metering.calc_date_args, object, object, "other")
+
+    @test.create_stubs({api.nova: ('server_list', 'server_get')})
+    def test_get_resource_names_single_list_call(self):
+        servers = self.servers.list()
+        api.nova.server_list(IsA(http.HttpRequest), all_tenants=True) \
+            .AndReturn([servers, False])
+        self.mox.ReplayAll()
+
+        resource_ids = [server.id for server in servers] + ['deleted']
+        names = metering.get_resource_names(self.request, resource_ids,
+                                            'cpu_util')
+        expected = dict((server.id, server.name) for server in servers)
+        expected['deleted'] = 'deleted'
+        self.assertEqual(expected, names)
+
+    def test_get_resource_names_unmapped_meter(self):
+        names = metering.get_resource_names(self.request, ['a', 'b'],
+                                            'memory')
+        self.assertEqual({'a': 'a', 'b': 'b'}, names)
+
+    def test_usage_report_meter_services(self):
+        class FakeMeter(object):
+            def __init__(self, name):
+                self.name = name
+
+        class FakeMeters(object):
+            def __getattr__(self, name):
+                meters = {'list_nova': [FakeMeter('cpu'), FakeMeter('disk')],
+                          'list_glance': [FakeMeter('image'),
+                                          FakeMeter('disk')]}
+                return lambda: meters.get(name, [])
+
+        report = metering.UsageReport(self.request, 7, None, None)
+        services = report._get_meter_services(FakeMeters())
+        self.assertEqual(['cpu', 'disk', 'image'], sorted(services))
+        self.assertEqual('Nova', services['disk'])
+        self.assertEqual('Glance', services['image'])
+
+    def _test_usage_report_cache(self, first, second):
+        caches['default'].clear()
+        self.addCleanup(caches['default'].clear)
+        now = datetime.datetime(2016, 10, 17, 12, 0, 1, tzinfo=pytz.utc)
+        rows = [{'project': 'p1', 'meter': 'cpu', 'value': 1.0}]
+        query_rows = mock.Mock(side_effect=lambda *args: iter(rows))
+        with mock.patch.object(timezone, 'now', return_value=now):
+            with mock.patch.object(metering.UsageReport, '_query_rows',
+                                   query_rows):
+                for args in (first, second):
+                    report = metering.UsageReport(self.request, *args)
+                    self.assertEqual(rows, list(report.rows()))
+        return query_rows.call_count
+
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_usage_report_cache_hit(self):
+        # The tab passes the session values, the CSV view the GET ones.
+        self.assertEqual(1, self._test_usage_report_cache(('7', '', ''),
+                                                          (7, None, None)))
+        self.assertEqual(1, self._test_usage_report_cache(
+            ('other', '2016-10-01', '2016-10-07'),
+            ('other', '2016-10-01', '2016-10-07')))
+
+    @override_settings(API_CACHE_TIMEOUT=60)
+    def test_usage_report_cache_miss(self):
+        self.assertEqual(2, self._test_usage_report_cache(('1', '', ''),
+                                                          (7, None, None)))
+        self.assertEqual(2, self._test_usage_report_cache(
+            ('other', '2016-10-01', '2016-10-07'),
+            ('other', '2016-10-02', '2016-10-07')))
@@ -14,10 +14,13 @@ from collections import defaultdict
 import itertools
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import cinder
@@ -348,28 +351,88 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
             exceptions.handle(request, msg)
 
 
+class _UsageTally(object):
+    """Records tallies made while the quotas are still being retrieved, so
+    they can be replayed onto a :class:`QuotaUsage` afterwards.
+    """
+
+    def __init__(self):
+        self.tallies = []
+
+    def tally(self, name, value):
+        self.tallies.append((name, value))
+
+    def apply(self, usages, skip=()):
+        for name, value in self.tallies:
+            if name not in skip:
+                usages.tally(name, value)
+
+
+def _quota_usages_cache_key(request, tenant_id):
+    region = getattr(request.user, 'services_region', None)
+    return 'horizon:quota_usages:%s:%s' % (region, tenant_id)
+
+
+def clear_quota_usages_cache(request, tenant_id=None):
+    """Drops the cached usages of a project.
+
+    Must be called after creating or deleting resources which count against
+    the project quotas so the next quota check sees the change.
+    """
+    if not tenant_id:
+        tenant_id = request.user.project_id
+    cache.delete(_quota_usages_cache_key(request, tenant_id))
+
+
 @memoized
 def tenant_quota_usages(request, tenant_id=None):
     """Get our quotas and construct our usage object.
     If no tenant_id is provided, a the request.user.project_id
     is assumed to be used
+
+    The result is kept for ``QUOTA_USAGES_CACHE_TIMEOUT`` seconds (set it to
+    0 to disable caching), see :func:`clear_quota_usages_cache`.
     """
     if not tenant_id:
         tenant_id = request.user.project_id
 
+    timeout = getattr(settings, 'QUOTA_USAGES_CACHE_TIMEOUT', 30)
+    cache_key = _quota_usages_cache_key(request, tenant_id)
+    if timeout:
+        usages = cache.get(cache_key)
+        if usages is not None:
+            return usages
+
     disabled_quotas = get_disabled_quotas(request)
     usages = QuotaUsage()
 
-    for quota in get_tenant_quota_data(request,
-                                       disabled_quotas=disabled_quotas,
-                                       tenant_id=tenant_id):
+    # The quota limits and the compute, network and volume usages come from
+    # independent API calls, so gather them all concurrently.
+    quota_disabled_quotas = list(disabled_quotas)
+    calls = [parallel.Call(get_tenant_quota_data, (request,),
+                           {'disabled_quotas': quota_disabled_quotas,
+                            'tenant_id': tenant_id})]
+    tallies = []
+    for get_usages in (_get_tenant_compute_usages,
+                       _get_tenant_network_usages,
+                       _get_tenant_volume_usages):
+        tally = _UsageTally()
+        tallies.append(tally)
+        calls.append(parallel.Call(get_usages, (request, tally,
+                                                disabled_quotas, tenant_id)))
+    parallel.call_parallel(calls)
+
+    for quota in calls[0].get():
         usages.add_quota(quota)
-
-    # Get our usages.
-    _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id)
-
+    # Quotas disabled while retrieving the limits (e.g. Cinder failing)
+    # have no limit to tally against.
+    skip = set(quota_disabled_quotas) - set(disabled_quotas)
+    for call, tally in zip(calls[1:], tallies):
+        call.get()
+        tally.apply(usages, skip=skip)
+
+    if timeout:
+        cache.set(cache_key, usages, timeout)
     return usages
 
 
@@ -10,13 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import calendar
 import datetime
+import hashlib
 import logging
 
+from django.conf import settings
+from django.core.cache import caches
 from django.utils import timezone
+from django.utils import translation
 from django.utils.translation import ugettext_lazy as _
 import pytz
+import six
 
+from horizon import exceptions
+from horizon.utils import parallel
 from horizon.utils import units
 
 from openstack_dashboard import api
@@ -37,6 +45,11 @@ METER_API_MAPPINGS = {
     "image_size": 'glance'
 }
 
+API_SERVICE_TYPES = {
+    'nova': 'compute',
+    'glance': 'image',
+}
+
 
 def calc_period(date_from, date_to, number_of_samples=400):
     if date_from and date_to:
@@ -89,46 +102,125 @@ def calc_date_args(date_from, date_to, date_options):
     return date_from, date_to
 
 
-def get_resource_name(request, resource_id, resource_name, meter_name):
-    resource = None
-    try:
-        if resource_name == "resource_id":
-            meter_name = 'instance' if "instance" in meter_name else meter_name
-            api_type = METER_API_MAPPINGS.get(meter_name, '')
-            if api_type == 'nova':
-                resource = api.nova.server_get(request, resource_id)
-            elif api_type == 'glance':
-                resource = api.glance.image_get(request, resource_id)
+def _get_api_type(meter_name):
+    meter_name = 'instance' if "instance" in meter_name else meter_name
+    return METER_API_MAPPINGS.get(meter_name, '')
+
 
+def _name_cache_key(request, api_type, resource_id):
+    return 'horizon:metering_name:%s:%s' % (
+        api.base.url_for(request, API_SERVICE_TYPES[api_type]), resource_id)
+
+
+def _list_resources(request, api_type):
+    """Returns all the resources of the given API type visible to the admin
+    and whether the listing was cut short by ``API_RESULT_LIMIT``.
+    """
+    if api_type == 'nova':
+        resources, truncated = api.nova.server_list(request, all_tenants=True)
+    else:
+        resources, truncated, _has_prev = \
+            api.glance.image_list_detailed(request)
+    limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+    return resources, truncated or len(resources) >= limit
+
+
+def _get_resources(request, api_type, resource_ids):
+    if api_type == 'nova':
+        get = api.nova.server_get
+    else:
+        get = api.glance.image_get
+    calls = parallel.call_parallel(
+        [parallel.Call(get, (request, resource_id), name=resource_id)
+         for resource_id in resource_ids])
+    return [call.result for call in calls if not call.failed]
+
+
+def get_resource_names(request, resource_ids, meter_name):
+    """Returns a dict mapping the given resource IDs to resource names.
+
+    The names are resolved with a single list call to the service the meter
+    belongs to, instead of one call per resource, and are cached for
+    ``API_CACHE_TIMEOUT`` seconds so every view charting or reporting the
+    same resources shares them. Resources which can't be resolved, e.g.
+    deleted instances, are named after their ID.
+    """
+    names = dict((resource_id, resource_id) for resource_id in resource_ids)
+    api_type = _get_api_type(meter_name)
+    if api_type not in API_SERVICE_TYPES or not names:
+        return names
+
+    cache = caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+    timeout = getattr(settings, 'API_CACHE_TIMEOUT', 60)
+    missing = set(names)
+    try:
+        if timeout:
+            keys = dict((_name_cache_key(request, api_type, resource_id),
+                         resource_id) for resource_id in names)
+            for key, name in cache.get_many(list(keys)).items():
+                names[keys[key]] = name
+                missing.discard(keys[key])
+        if not missing:
+            return names
+
+        resources, truncated = _list_resources(request, api_type)
+        resources = [resource for resource in resources
+                     if resource.id in missing]
+        if truncated:
+            # Some of the resources may not have made it into the list.
+            found = set(resource.id for resource in resources)
+            resources.extend(_get_resources(request, api_type,
+                                            missing - found))
+
+        resolved = {}
+        for resource in resources:
+            if resource.name:
+                names[resource.id] = resource.name
+                resolved[_name_cache_key(request, api_type,
+                                         resource.id)] = resource.name
+        if timeout and resolved:
+            cache.set_many(resolved, timeout)
     except Exception:
-        LOG.info(_("Failed to get the resource name: %s"), resource_id,
-                 exc_info=True)
-    return resource.name if resource else resource_id
+        LOG.info(_("Failed to get the resource names: %s"),
+                 ", ".join(missing), exc_info=True)
+    return names
+
+
+def get_resource_name(request, resource_id, resource_name, meter_name):
+    if resource_name != "resource_id":
+        return resource_id
+    return get_resource_names(request, [resource_id],
+                              meter_name)[resource_id]
 
 
 def series_for_meter(request, aggregates, group_by, meter_id,
                      meter_name, stats_name, unit, label=None):
     """Construct datapoint series for a meter from resource aggregates."""
+    resources = [resource for resource in aggregates
+                 if resource.get_meter(meter_name)]
+    names = {}
+    if not label and group_by != "project":
+        names = get_resource_names(
+            request, [resource.resource_id for resource in resources],
+            meter_name)
+
     series = []
-    for resource in aggregates:
-        if resource.get_meter(meter_name):
-            if label:
-                name = label
-            else:
-                resource_name = ('id' if group_by == "project"
-                                 else 'resource_id')
-                resource_id = getattr(resource, resource_name)
-                name = get_resource_name(request, resource_id,
-                                         resource_name, meter_name)
-            point = {'unit': unit,
-                     'name': name,
-                     'meter': meter_id,
-                     'data': []}
-            for statistic in resource.get_meter(meter_name):
-                date = statistic.duration_end[:19]
-                value = float(getattr(statistic, stats_name))
-                point['data'].append({'x': date, 'y': value})
-            series.append(point)
+    for resource in resources:
+        if label:
+            name = label
+        elif group_by == "project":
+            name = resource.id
+        else:
+            name = names[resource.resource_id]
+        point = {'unit': unit,
+                 'name': name,
+                 'meter': meter_id,
+                 'data': []}
+        for statistic in resource.get_meter(meter_name):
+            date = statistic.duration_end[:19]
+            value = float(getattr(statistic, stats_name))
+            point['data'].append({'x': date, 'y': value})
+        series.append(point)
     return series
 
 
@@ -246,3 +338,122 @@ class MeterQuery(ProjectAggregatesQuery):
             filter_func=filter_by_meter_name)
 
         return resources, unit
+
+
+class UsageReport(object):
+    """The usage report: the daily statistics of every meter per project.
+
+    The aggregates of the meters are queried concurrently, at most
+    ``max_workers`` (``HORIZON_PARALLEL_MAX_WORKERS``) at a time, and
+    :meth:`rows` yields the rows of each batch of meters as soon as it is
+    done, so a streaming response can start sending them early.
+
+    Finished reports are cached for ``API_CACHE_TIMEOUT`` seconds per date
+    range and period, so the usage report tab and the CSV download of the
+    same report share them.
+    """
+    def __init__(self, request, date_options, date_from, date_to,
+                 period=3600 * 24, max_workers=None):
+        self.request = request
+        self.date_options = date_options
+        self.date_from = date_from
+        self.date_to = date_to
+        self.period = period
+        self.max_workers = parallel.get_max_workers(max_workers)
+
+    def _cache_key(self, date_from, date_to, timeout):
+        # Relative date ranges end now, so the dates are rounded down to the
+        # cache timeout: the same report asked for within that time, e.g.
+        # by the tab and then the CSV download, has the same key.
+        def window(date):
+            if not date:
+                return None
+            return int(calendar.timegm(date.utctimetuple()) // timeout)
+
+        key = repr((window(date_from), window(date_to), self.period,
+                    translation.get_language()))
+        return 'horizon:metering_report:%s:%s' % (
+            api.base.url_for(self.request, 'metering'),
+            hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def _get_meter_services(self, meters):
+        """Returns a dict mapping meter names to their service name."""
+        services = ((_('Nova'), meters.list_nova()),
+                    (_('Neutron'), meters.list_neutron()),
+                    (_('Glance'), meters.list_glance()),
+                    (_('Cinder'), meters.list_cinder()),
+                    (_('Swift_meters'), meters.list_swift()),
+                    (_('Kwapi'), meters.list_kwapi()),
+                    (_('IPMI'), meters.list_ipmi()))
+        index = {}
+        for service, meter_list in services:
+            for meter in meter_list:
+                index.setdefault(meter.name, service)
+        return index
+
+    def _query_rows(self, date_from, date_to):
+        meters = api.ceilometer.Meters(self.request)
+        meter_services = self._get_meter_services(meters)
+        try:
+            project_aggregates = ProjectAggregatesQuery(self.request,
+                                                        date_from,
+                                                        date_to,
+                                                        self.period)
+        except Exception:
+            exceptions.handle(self.request,
+                              _('Unable to retrieve project list.'))
+            return
+
+        meter_list = list(meters._cached_meters.values())
+        for i in range(0, len(meter_list), self.max_workers):
+            batch = meter_list[i:i + self.max_workers]
+            calls = parallel.call_parallel(
+                [parallel.Call(project_aggregates.query, (meter.name,),
+                               name=meter.name) for meter in batch],
+                max_workers=self.max_workers)
+            for meter, call in zip(batch, calls):
+                resources, unit = call.get()
+                service = meter_services.get(meter.name)
+                for resource in resources:
+                    values = resource.get_meter(meter.name.replace(".", "_"))
+                    for value in values or []:
+                        yield {"name": 'none',
+                               "project": resource.id,
+                               "meter": meter.name,
+                               "description": six.text_type(
+                                   meter.description),
+                               "service": (six.text_type(service)
+                                           if service else None),
+                               "time": value._apiresource.period_end,
+                               "value": value._apiresource.avg,
+                               "unit": meter.unit}
+
+    def rows(self):
+        try:
+            date_from, date_to = calc_date_args(self.date_from,
+                                                self.date_to,
+                                                self.date_options)
+        except Exception:
+            exceptions.handle(self.request, _('Dates cannot be recognized.'))
+            return
+
+        cache = caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+        timeout = getattr(settings, 'API_CACHE_TIMEOUT', 60)
+        key = None
+        if timeout:
+            key = self._cache_key(date_from, date_to, timeout)
+            cached = cache.get(key)
+            if cached is not None:
+                for row in cached:
+                    yield row
+                return
+
+        rows = []
+        for row in self._query_rows(date_from, date_to):
+            rows.append(row)
+            yield row
+
+        if key:
+            limit = getattr(settings, 'API_CACHE_MAX_VALUE_SIZE', 1024 * 1024)
+            if len(six.moves.cPickle.dumps(rows, -1)) <= limit:
+                cache.set(key, rows, timeout)